@@ -1,12 +1,23 @@
 import json
 import hashlib
+import os
 import tempfile
-from typing import Any, Callable, Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, List, Tuple
 from pathlib import Path
 import time
 
+from api.filters import ProblemFilter, get_tag_slug
 from api.LeetCodeAPI import LeetCodeAPI
 from utils.logger import log, LogLevel
+from utils.pagination import paginate
+
+# Company question lists fetched at once when merging several of them
+max_parallel_lists = 8
+
+# Problems whose details are fetched in a single request
+details_batch_size = 20
 
 
 def _get_cache_key(unique_id: str) -> str:
@@ -18,6 +29,53 @@ def _get_cache_key(unique_id: str) -> str:
     return hashlib.md5(unique_id.encode("utf-8")).hexdigest()
 
 
+def _to_json_compatible(value: Any) -> Any:
+    """
+    Convert values the JSON encoder does not support (e.g., sets of topic tags).
+    :param value: Value that could not be serialized.
+    :return: JSON compatible representation of the value.
+    """
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def merge_company_questions(
+    question_lists: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    match: str = "union",
+) -> List[Dict[str, Any]]:
+    """
+    Merge the question lists of several companies and durations, deduplicating
+    questions by `titleSlug` and summing their frequencies across lists, so
+    questions asked often, recently and at several companies come first.
+    :param question_lists: Questions by (company name, duration).
+    :param match: "union" to keep questions asked at any of the companies, or
+                  "intersection" for questions asked at all of them.
+    :return: Merged questions, by decreasing combined `frequency`, each with the
+             `companies` it was asked at.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for (company_name, _), questions in sorted(question_lists.items()):
+        for question in questions:
+            slug = question["titleSlug"]
+            if slug not in merged:
+                merged[slug] = {**question, "frequency": 0.0, "companies": []}
+            merged_question = merged[slug]
+            merged_question["frequency"] += question.get("frequency") or 0.0
+            if company_name not in merged_question["companies"]:
+                merged_question["companies"].append(company_name)
+
+    company_count = len({company_name for company_name, _ in question_lists})
+    questions = [
+        question
+        for question in merged.values()
+        if match == "union" or len(question["companies"]) == company_count
+    ]
+    # Sorting is stable, so equally frequent questions keep the order of their lists
+    questions.sort(key=lambda question: question["frequency"], reverse=True)
+    return questions
+
+
 class CachedLeetCodeAPI:
     def __init__(self, cache_dir: Optional[str] = None, cache_expiry: int = 3600):
         """
@@ -34,9 +92,24 @@ class CachedLeetCodeAPI:
             parents=True, exist_ok=True
         )  # Create cache directory if it doesn't exist
 
-        self.api = (
-            LeetCodeAPI()
-        )  # Delegate actual API calls to existing LeetCodeAPI class
+        self._api = None  # Constructed on the first cache miss
+        self._api_lock = threading.Lock()
+
+        # Parsed cache entries as (written_at, data), so long-lived processes
+        # (e.g., the daemon) do not re-read and re-parse cache files
+        self._memory_cache: Dict[str, Tuple[float, Any]] = {}
+
+    @property
+    def api(self) -> LeetCodeAPI:
+        """
+        The LeetCodeAPI used for actual API calls, constructed on first use so
+        that fully cached runs never open a session.
+        :return: LeetCodeAPI instance.
+        """
+        with self._api_lock:
+            if self._api is None:
+                self._api = LeetCodeAPI()
+        return self._api
 
     def _read_from_cache(self, cache_key: str) -> Any:
         """
@@ -44,12 +117,19 @@ class CachedLeetCodeAPI:
         :param cache_key: Key corresponding to the cached data.
         :return: Cached data, or None if cache is invalid or missing.
         """
+        memory_entry = self._memory_cache.get(cache_key)
+        if memory_entry and time.time() - memory_entry[0] <= self.cache_expiry:
+            return memory_entry[1]
+
         cache_file = self.cache_dir / cache_key
         if cache_file.exists():
             # Check expiry
-            if time.time() - cache_file.stat().st_mtime <= self.cache_expiry:
+            written_at = cache_file.stat().st_mtime
+            if time.time() - written_at <= self.cache_expiry:
                 with open(cache_file, "r") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                self._memory_cache[cache_key] = (written_at, data)
+                return data
 
         return None  # Cache miss or expired
 
@@ -60,20 +140,40 @@ class CachedLeetCodeAPI:
         :param data: Data to cache.
         """
         cache_file = self.cache_dir / cache_key
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+
+        # Write to a temporary file first so concurrent readers never see partial JSON.
+        # Thread idents repeat across processes (e.g., the CLI and the daemon)
+        temp_file = cache_file.with_name(
+            f"{cache_key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(temp_file, "w") as f:
+            json.dump(data, f, default=_to_json_compatible)
+        os.replace(temp_file, cache_file)
+
+        self._memory_cache[cache_key] = (time.time(), data)
 
     def _fetch_with_cache(
-        self, fetch_func: Callable, unique_id: str, *args, **kwargs
+        self, fetch_method: str, unique_id: str, *args, **kwargs
     ) -> Any:
         """
         Fetch data with caching.
-        :param fetch_func: Function to fetch data if cache is not available.
+        :param fetch_method: Name of the LeetCodeAPI method to call if cache is not available.
         :param unique_id: Unique identifier for the request (e.g., API parameters).
         :param args: Positional arguments to pass to the fetch function.
         :param kwargs: Keyword arguments to pass to the fetch function.
         :return: Fetched or cached data.
         """
+        return self._compute_with_cache(
+            unique_id, lambda: getattr(self.api, fetch_method)(*args, **kwargs)
+        )
+
+    def _compute_with_cache(self, unique_id: str, compute: Callable[[], Any]) -> Any:
+        """
+        Compute data with caching.
+        :param unique_id: Unique identifier for the data (e.g., API parameters).
+        :param compute: Computes the data if cache is not available.
+        :return: Computed or cached data.
+        """
         cache_key = _get_cache_key(unique_id)
 
         # Check cache first
@@ -84,28 +184,31 @@ class CachedLeetCodeAPI:
 
         # Cache miss, call the API
         log(f"❌ Cache miss for {unique_id}. Fetching from API...", LogLevel.DEBUG)
-        api_data = fetch_func(*args, **kwargs)
+        api_data = compute()
 
         # Save API data to cache
         self._write_to_cache(cache_key, api_data)
         return api_data
 
     # Cached versions of API methods
-    def fetch_problems(self, *args, **kwargs):
+    def fetch_problems(
+        self, *args, problem_filter: Optional[ProblemFilter] = None, **kwargs
+    ):
         """
-        Cached version of fetch_problems
+        Cached version of fetch_problems, cached apart for each filter
         """
         unique_id = f"fetch_problems-{json.dumps([args, kwargs], sort_keys=True)}"  # Unique key based on args
-        return self._fetch_with_cache(
-            self.api.fetch_problems, unique_id, *args, **kwargs
-        )
+        if problem_filter:
+            unique_id += f"-{problem_filter.cache_key()}"
+            kwargs["problem_filter"] = problem_filter
+        return self._fetch_with_cache("fetch_problems", unique_id, *args, **kwargs)
 
     def fetch_daily_challenge(self, *args, **kwargs):
         """
         Cached version of fetch_daily_challenge
         """
         return self._fetch_with_cache(
-            self.api.fetch_daily_challenge, "fetch_daily_challenge", *args, **kwargs
+            "fetch_daily_challenge", "fetch_daily_challenge", *args, **kwargs
         )
 
     def fetch_problem(self, problem_slug: str, *args, **kwargs):
@@ -114,25 +217,137 @@ class CachedLeetCodeAPI:
         """
         unique_id = f"fetch_problem-{problem_slug}"
         return self._fetch_with_cache(
-            self.api.fetch_problem, unique_id, problem_slug, *args, **kwargs
+            "fetch_problem", unique_id, problem_slug, *args, **kwargs
         )
 
+    def fetch_problems_details(self, problem_slugs: List[str]) -> Dict[str, Any]:
+        """
+        Cached version of fetch_problems_details, sharing the cache of fetch_problem.
+        Only problems missing from the cache are fetched, in batches.
+        :param problem_slugs: The slugs of the LeetCode problems.
+        :return: The details of each problem found, by slug.
+        """
+        details = {}
+        missing_slugs = []
+        for problem_slug in dict.fromkeys(problem_slugs):
+            cached_data = self._read_from_cache(
+                _get_cache_key(f"fetch_problem-{problem_slug}")
+            )
+            if cached_data is not None:
+                details[problem_slug] = cached_data
+            else:
+                missing_slugs.append(problem_slug)
+
+        log(
+            f"{len(details)} problem details cached, {len(missing_slugs)} to fetch.",
+            LogLevel.DEBUG,
+        )
+        for start in range(0, len(missing_slugs), details_batch_size):
+            batch = missing_slugs[start : start + details_batch_size]
+            for problem_slug, question in self.api.fetch_problems_details(
+                batch
+            ).items():
+                self._write_to_cache(
+                    _get_cache_key(f"fetch_problem-{problem_slug}"), question
+                )
+                details[problem_slug] = question
+        return details
+
+    def get_question_id(self, problem_slug: str) -> str:
+        """
+        Cached version of fetch_question_id, reusing cached problem details if possible
+        """
+        unique_id = f"fetch_problem-{problem_slug}"
+        problem = self._read_from_cache(_get_cache_key(unique_id))
+        if problem and problem.get("questionId"):
+            return problem["questionId"]
+
+        unique_id = f"fetch_question_id-{problem_slug}"
+        return self._fetch_with_cache("fetch_question_id", unique_id, problem_slug)
+
     def get_study_plan(self, slug: str, *args, **kwargs):
         """
         Cached version of get_study_plan
         """
         unique_id = f"get_study_plan-{slug}"
         return self._fetch_with_cache(
-            self.api.get_study_plan, unique_id, slug, *args, **kwargs
+            "get_study_plan", unique_id, slug, *args, **kwargs
         )
 
-    def fetch_company_questions(self, company_slug: str, *args, **kwargs):
+    def fetch_company_questions(
+        self,
+        company_slug: str,
+        *args,
+        problem_filter: Optional[ProblemFilter] = None,
+        **kwargs,
+    ):
         """
-        Cached version of fetch_company_questions
+        Cached version of fetch_company_questions, cached apart for each page and filter
         """
-        unique_id = f"fetch_company_questions-{company_slug}"
+        unique_id = f"fetch_company_questions-{company_slug}-{json.dumps([args, kwargs], sort_keys=True)}"
+        if problem_filter:
+            unique_id += f"-{problem_filter.cache_key()}"
+            kwargs["problem_filter"] = problem_filter
         return self._fetch_with_cache(
-            self.api.fetch_company_questions, unique_id, company_slug, *args, **kwargs
+            "fetch_company_questions", unique_id, company_slug, *args, **kwargs
+        )
+
+    def iter_company_questions(
+        self,
+        company_slug: str,
+        problem_filter: Optional[ProblemFilter] = None,
+        page_size: int = 100,
+        **kwargs,
+    ):
+        """
+        Stream all the questions of a company list, one cached page at a time,
+        with the next page prefetched while the current one is consumed.
+        :param company_slug: The slug for the company list (e.g., 'amazon-thirty-days').
+        :param problem_filter: Filters of the questions.
+        :param page_size: Questions fetched per page.
+        :param kwargs: Other arguments of `fetch_company_questions` (e.g., sort_by).
+        :return: Iterator over the questions.
+        """
+
+        def fetch_page(skip: int, limit: int):
+            results = self.fetch_company_questions(
+                company_slug,
+                skip=skip,
+                limit=limit,
+                problem_filter=problem_filter,
+                **kwargs,
+            )
+            if results.get("errors"):
+                raise Exception(
+                    f"❌ Failed to fetch questions of {company_slug}: {results['errors']}"
+                )
+            question_list = (results.get("data") or {}).get(
+                "favoriteQuestionList"
+            ) or {}
+            log(
+                f"📄 Fetched questions {skip} to {skip + limit} of "
+                f"{question_list.get('totalLength')} for {company_slug}.",
+                LogLevel.DEBUG,
+            )
+            return question_list.get("questions") or [], question_list.get("hasMore")
+
+        return paginate(fetch_page, page_size)
+
+    def get_company_names(self, *args, **kwargs):
+        """
+        Cached version of get_company_names
+        """
+        return self._fetch_with_cache(
+            "get_company_names", "get_company_names", *args, **kwargs
+        )
+
+    def get_topic_tags(self, *args, **kwargs):
+        """
+        Cached version of get_topic_tags
+        """
+        # Tags are cached as a sorted list, so turn them back into a set
+        return set(
+            self._fetch_with_cache("get_topic_tags", "get_topic_tags", *args, **kwargs)
         )
 
     def fetch_company_questions_for_duration(
@@ -141,14 +356,14 @@ class CachedLeetCodeAPI:
         duration: str,
         difficulties: Optional[List[str]] = None,
         tags: Optional[list] = None,
-        *args,
+        problem_filter: Optional[ProblemFilter] = None,
         **kwargs,
     ):
         """
         Wrapper around `fetch_company_questions` that accepts a company name,
         duration, and an optional difficulty filter to fetch questions for a specific time range.
 
-        This method is cached to avoid redundant API calls.
+        Every page of the list is fetched and cached to avoid redundant API calls.
 
         :param company_name: Name of the company (e.g., 'amazon', 'google').
         :param duration: Duration to filter questions (e.g., 'thirty-days', 'three-months').
@@ -158,10 +373,12 @@ class CachedLeetCodeAPI:
                          - "six-months"
                          - "more-than-six-months"
                          - "all"
-        :param difficulties: (Optional) Difficulty filter to narrow down the results.
-                           Valid options: "EASY", "MEDIUM", "HARD".
+        :param difficulties: (Optional) Difficulty levels to narrow down the results.
+                           Valid options: "EASY", "MEDIUM", "HARD" (in any case).
         :param tags: (Optional) List of topic tags to filter the questions.
-        :return: A dictionary containing the questions and metadata.
+        :param problem_filter: (Optional) Other filters (e.g., acceptance rate).
+        :param kwargs: Other arguments of `iter_company_questions` (e.g., page_size).
+        :return: All the questions of the list.
         """
 
         # Validate duration input
@@ -177,22 +394,9 @@ class CachedLeetCodeAPI:
                 f"Invalid duration: {duration}. Must be one of {valid_durations}."
             )
 
-        # Validate difficulty input
-        valid_difficulties = ["EASY", "MEDIUM", "HARD"]
-        difficulty_filter = None
-        if difficulties:
-            if difficulties not in valid_difficulties:
-                raise ValueError(
-                    f"Invalid difficulty: {difficulties}. Must be one of {valid_difficulties}."
-                )
-
-            # Create a difficulty filter with the operator "IS"
-            difficulty_filter = {"difficulties": difficulties, "operator": "IS"}
-
         # Validate tags input
-        topic_filter = None
         if tags:
-            topic_tags = self.api.get_topic_tags()
+            topic_tags = self.get_topic_tags()
             valid_tags = [tag.lower() for tag in topic_tags]
             standardized_tags = [tag.lower() for tag in tags]
             if any(tag not in valid_tags for tag in standardized_tags):
@@ -200,32 +404,79 @@ class CachedLeetCodeAPI:
                     f"Invalid tags. Supported tags: {', '.join(valid_tags)}"
                 )
 
-            # Create a topic filter with the operator "IS"
-            topic_filter = {
-                "tags": standardized_tags,
-                "operator": "IS",
-            }
+        # Difficulties and tags are filtered by LeetCode, which expects tag slugs
+        problem_filter = (problem_filter or ProblemFilter()).with_options(
+            difficulties=difficulties,
+            tags=[get_tag_slug(tag) for tag in tags or []],
+        )
 
         # Construct the favorite_slug based on company name and duration
         favorite_slug = f"{company_name.lower()}-{duration}"
 
-        # Append difficulties to the unique id if provided
-        unique_id = (
-            f"{favorite_slug}-{'-'.join(difficulties)}"
-            if difficulties
-            else favorite_slug
+        # Follow every page, so long lists (e.g., "all") are not truncated
+        return list(
+            self.iter_company_questions(favorite_slug, problem_filter, **kwargs)
         )
 
-        results = self._fetch_with_cache(
-            self.api.fetch_company_questions,
-            unique_id,
-            favorite_slug,
-            difficulty_filter,
-            topic_filter,
-            *args,
-            **kwargs,
+    def fetch_questions_for_companies(
+        self,
+        company_names: List[str],
+        durations: List[str],
+        difficulties: Optional[List[str]] = None,
+        tags: Optional[list] = None,
+        match: str = "union",
+        problem_filter: Optional[ProblemFilter] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the questions of several companies over several durations, merged
+        with `merge_company_questions`. Lists are fetched in parallel, and the
+        merged pool is cached as its own entry.
+
+        :param company_names: Names of the companies (e.g., ['amazon', 'google']).
+        :param durations: Durations of the lists (e.g., ['thirty-days', 'all']).
+        :param difficulties: (Optional) Difficulty levels to narrow down the results.
+        :param tags: (Optional) List of topic tags to filter the questions.
+        :param match: "union" or "intersection" of the companies' questions.
+        :param problem_filter: (Optional) Other filters (e.g., acceptance rate).
+        :return: Merged questions, by decreasing combined frequency.
+        """
+        valid_matches = ["union", "intersection"]
+        if match not in valid_matches:
+            raise ValueError(
+                f"Invalid company match: {match}. Must be one of {valid_matches}."
+            )
+
+        company_names = sorted({company_name.lower() for company_name in company_names})
+        durations = sorted(set(durations))
+        other_filters = problem_filter
+        problem_filter = (problem_filter or ProblemFilter()).with_options(
+            difficulties=difficulties, tags=[get_tag_slug(tag) for tag in tags or []]
+        )
+        unique_id = (
+            f"fetch_questions_for_companies-{json.dumps([company_names, durations, match])}"
+            f"-{problem_filter.cache_key()}"
         )
 
-        # Navigate to the questions in the actual response structure
-        favorite_question_list = results.get("data", {}).get("favoriteQuestionList", {})
-        return favorite_question_list.get("questions", [])
+        def fetch_and_merge():
+            lists = [
+                (company_name, duration)
+                for company_name in company_names
+                for duration in durations
+            ]
+            workers = min(len(lists), max_parallel_lists)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    key: executor.submit(
+                        self.fetch_company_questions_for_duration,
+                        *key,
+                        difficulties=difficulties,
+                        tags=tags,
+                        problem_filter=other_filters,
+                    )
+                    for key in lists
+                }
+            return merge_company_questions(
+                {key: future.result() for key, future in futures.items()}, match
+            )
+
+        return self._compute_with_cache(unique_id, fetch_and_merge)
@@ -1,12 +1,67 @@
 import os
+import time
+from email.utils import parsedate_to_datetime
 from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
-import requests
+from api.filters import ProblemFilter
+
+# Fields of the problem details, shared by the single and batched queries
+question_details_fields = """
+    questionId
+    questionFrontendId
+    title
+    titleSlug
+    content
+    acRate
+    difficulty
+    exampleTestcases
+    metaData
+    codeSnippets {
+        lang
+        code
+    }
+    topicTags {
+        name
+        id
+        slug
+    }
+"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header, given either in seconds or as an HTTP date.
+    :param value: Value of the header.
+    :return: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after: Optional[float] = None):
+        """
+        LeetCode asked to slow down.
+        :param retry_after: Seconds to wait before retrying, if LeetCode said so.
+        """
+        super().__init__("❌ Rate limited by LeetCode")
+        self.retry_after = retry_after
 
 
 class LeetCodeAPI:
     def __init__(self):
+        # Imported here since `requests` is slow to import and cached runs never need it
+        import requests
+
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -20,20 +75,31 @@ class LeetCodeAPI:
 
         self.session.cookies.set("LEETCODE_SESSION", leetcode_session)
         self.url = "https://leetcode.com/graphql"
+        self.base_url = "https://leetcode.com"
+
+        # Bounds of the delay between two checks of a pending verdict, in seconds
+        self.min_poll_delay = 0.5
+        self.max_poll_delay = 4.0
 
     def fetch_problems(
         self,
         limit: int = 50,
         skip: int = 0,
         difficulties: Optional[List[str]] = None,
+        problem_filter: Optional[ProblemFilter] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Fetch a list of problems from LeetCode.
+        Fetch a list of problems from LeetCode, without their statements and
+        code, which are fetched for the selected problems only (see
+        `fetch_problems_details`).
         :param limit: Number of problems to fetch.
         :param skip: Offset for pagination.
         :param difficulties: List of difficulty levels (e.g., ["Easy", "Medium", "Hard"]).
+        :param problem_filter: Other filters, applied by LeetCode where it can.
         :return: A list of problem dictionaries.
         """
+        problem_filter = problem_filter or ProblemFilter()
+        difficulties = difficulties or problem_filter.difficulties
         if limit < 1 or skip < 0:
             raise ValueError("❌ Limit must be positive and skip must be non-negative.")
 
@@ -47,15 +113,12 @@ class LeetCodeAPI:
           ) {
             total: totalNum
             questions: data {
+              questionId
+              questionFrontendId
               acRate
               difficulty
-              content
               title
               titleSlug
-              codeSnippets {
-                lang
-                code
-              }
               topicTags {
                 name
                 id
@@ -73,7 +136,9 @@ class LeetCodeAPI:
             if difficulty.lower() not in difficulty_enum:
                 return []
 
-            filters = {"difficulty": difficulty_enum.get(difficulty.lower())}
+            filters = problem_filter.to_question_list_filters(
+                difficulty_enum.get(difficulty.lower())
+            )
             variables = {
                 "categorySlug": "all-code-essentials",
                 "limit": limit,
@@ -94,11 +159,17 @@ class LeetCodeAPI:
                 raise Exception(f"❌ Failed to fetch problems: {response.content}")
 
             data = response.json()
-            return (
+            questions = (
                 data.get("data", {})
                 .get("problemsetQuestionList", {})
                 .get("questions", [])
             )
+            # Keywords were searched by LeetCode, unlike acceptance rates
+            return [
+                problem
+                for problem in questions
+                if problem_filter.matches(problem, search=False)
+            ]
 
         # Execute the fetches in parallel if multiple difficulties are provided
         if difficulties:
@@ -124,11 +195,15 @@ class LeetCodeAPI:
             userStatus
             link
             question {
+              questionId
+              questionFrontendId
               titleSlug
               title
               content
               acRate
               difficulty
+              exampleTestcases
+              metaData
               codeSnippets {
                 lang
                 code
@@ -165,25 +240,10 @@ class LeetCodeAPI:
         :param problem_slug: The slug of the LeetCode problem (e.g., "two-sum").
         :return: A dictionary containing the problem details.
         """
-        query = """
-        query getQuestionDetails($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
-                title
-                titleSlug
-                content
-                acRate
-                difficulty
-                codeSnippets {
-                    lang
-                    code
-                }
-                topicTags {
-                    name
-                    id
-                    slug
-                }
-            }
-        }
+        query = f"""
+        query getQuestionDetails($titleSlug: String!) {{
+            question(titleSlug: $titleSlug) {{{question_details_fields}}}
+        }}
         """
 
         response = self.session.post(
@@ -206,6 +266,43 @@ class LeetCodeAPI:
 
         return question
 
+    def fetch_problems_details(self, problem_slugs: List[str]) -> Dict[str, Any]:
+        """
+        Fetch the details of several problems in a single request, each problem
+        being queried under its own alias.
+        :param problem_slugs: The slugs of the LeetCode problems.
+        :return: The details of each problem found, by slug.
+        """
+        if not problem_slugs:
+            return {}
+
+        variables = {f"slug{i}": slug for i, slug in enumerate(problem_slugs)}
+        parameters = ", ".join(f"${name}: String!" for name in variables)
+        aliases = "".join(
+            f"q{i}: question(titleSlug: ${name}) {{{question_details_fields}}}"
+            for i, name in enumerate(variables)
+        )
+        query = f"query getQuestionsDetails({parameters}) {{{aliases}}}"
+
+        response = self.session.post(
+            self.url,
+            json={
+                "operationName": "getQuestionsDetails",
+                "variables": variables,
+                "query": query,
+            },
+        )
+
+        if not response.ok:
+            raise Exception(f"❌ Failed to fetch problem details: {response.content}")
+
+        data = response.json().get("data") or {}
+        return {
+            slug: data[f"q{i}"]
+            for i, slug in enumerate(problem_slugs)
+            if data.get(f"q{i}")
+        }
+
     def get_study_plan(self, slug: str) -> Dict[str, Any]:
         """
         Fetch study plan details from LeetCode.
@@ -223,6 +320,7 @@ class LeetCodeAPI:
               name
               questionNum
               questions {
+                questionFrontendId
                 title
                 titleSlug
               }
@@ -253,34 +351,191 @@ class LeetCodeAPI:
 
         return study_plan
 
-    def submit_solution(
-        self, problem_slug: str, code: str, language: str
+    def fetch_question_id(self, problem_slug: str) -> str:
+        """
+        Fetch the internal question ID of a problem, needed to run and submit code.
+        :param problem_slug: The slug of the LeetCode problem (e.g., "two-sum").
+        :return: The question ID.
+        """
+        query = """
+        query questionId($titleSlug: String!) {
+            question(titleSlug: $titleSlug) {
+                questionId
+            }
+        }
+        """
+
+        response = self.session.post(
+            self.url,
+            json={
+                "operationName": "questionId",
+                "variables": {"titleSlug": problem_slug},
+                "query": query,
+            },
+        )
+
+        if not response.ok:
+            raise Exception(f"❌ Failed to fetch question ID: {response.content}")
+
+        question = response.json().get("data", {}).get("question")
+        if not question:
+            raise Exception(f"❌ Problem not found for slug: {problem_slug}")
+
+        return question["questionId"]
+
+    def _post_code(self, problem_slug: str, endpoint: str, body: Dict[str, Any]):
+        """
+        Post code to a judge endpoint of a problem.
+        :param problem_slug: The slug of the problem.
+        :param endpoint: Endpoint name (e.g., "submit" or "interpret_solution").
+        :param body: JSON body of the request.
+        :return: The JSON response.
+        """
+        # Posting code requires the CSRF token LeetCode sets as a cookie
+        csrf_token = os.getenv("LEETCODE_CSRF_TOKEN") or self.session.cookies.get(
+            "csrftoken"
+        )
+        if not csrf_token:
+            self.session.get(self.base_url)
+            csrf_token = self.session.cookies.get("csrftoken", "")
+
+        problem_url = f"{self.base_url}/problems/{problem_slug}/"
+        response = self.session.post(
+            f"{problem_url}{endpoint}/",
+            headers={"Referer": problem_url, "x-csrftoken": csrf_token},
+            json=body,
+        )
+
+        if response.status_code == 429:
+            raise RateLimitError(parse_retry_after(response.headers.get("Retry-After")))
+        if not response.ok:
+            raise Exception(f"❌ Failed to post solution: {response.content}")
+
+        return response.json()
+
+    def check_submission(self, submission_id: str) -> Dict[str, Any]:
+        """
+        Check the state of a submission or run.
+        :param submission_id: ID of the submission, or interpret ID of the run.
+        :return: The check result, with a final verdict once `state` is "SUCCESS".
+        """
+        response = self.session.get(
+            f"{self.base_url}/submissions/detail/{submission_id}/check/"
+        )
+
+        if response.status_code == 429:
+            return {
+                "state": "PENDING",
+                "retry_after": parse_retry_after(response.headers.get("Retry-After")),
+            }
+        if not response.ok:
+            raise Exception(f"❌ Failed to check submission: {response.content}")
+
+        return response.json()
+
+    def wait_for_verdict(
+        self, submission_id: str, timeout: float = 120
     ) -> Dict[str, Any]:
         """
-        Submit a solution to LeetCode.
-        :param problem_slug: The slug of the problem to submit.
+        Poll a submission until the judge returns its verdict.
+        Polling backs off while the submission waits in the queue, and speeds up
+        again once judging has started, since the verdict is then close.
+        :param submission_id: ID of the submission, or interpret ID of the run.
+        :param timeout: Seconds to wait for the verdict.
+        :return: The final check result.
+        """
+        deadline = time.monotonic() + timeout
+        delay = self.min_poll_delay
+        previous_state = None
+
+        while True:
+            result = self.check_submission(submission_id)
+            state = result.get("state")
+            if state == "SUCCESS":
+                return result
+            if state not in ("PENDING", "STARTED"):
+                raise Exception(f"❌ Unexpected submission state: {result}")
+
+            if result.get("retry_after") is not None:
+                # Rate limited, wait as long as asked
+                delay = max(result["retry_after"], delay)
+            elif state == "STARTED" and previous_state != "STARTED":
+                delay = self.min_poll_delay
+            else:
+                delay = min(delay * 1.5, self.max_poll_delay)
+            previous_state = state
+
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"❌ No verdict after {timeout}s")
+            time.sleep(delay)
+
+    def run_solution(
+        self,
+        problem_slug: str,
+        code: str,
+        language: str,
+        data_input: str,
+        question_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a solution against test cases on LeetCode, without submitting it.
+        :param problem_slug: The slug of the problem.
         :param code: The user's solution code.
         :param language: The programming language of the solution (e.g., "python3").
-        :return: A dictionary containing the submission result.
+        :param data_input: Test cases, one argument per line (e.g., the example test cases).
+        :param question_id: ID of the problem, fetched if not provided.
+        :return: The verdict of the run (e.g., `run_success`, `correct_answer`,
+                 `code_answer` and `expected_code_answer`).
         """
-        problem_details = self.fetch_problem(problem_slug)
-        url = f"https://leetcode.com/problems/{problem_slug}/"
-
-        headers = {
-            "Referer": f"https://leetcode.com/problems/{problem_slug}/",
-        }
         body = {
             "lang": language,
-            "question_id": problem_details["questionId"],
+            "question_id": question_id or self.fetch_question_id(problem_slug),
             "typed_code": code,
+            "data_input": data_input,
         }
+        response = self._post_code(problem_slug, "interpret_solution", body)
+        return self.wait_for_verdict(response["interpret_id"])
 
-        response = self.session.post(url, headers=headers, json=body)
-
-        if not response.ok:
-            raise Exception(f"❌ Failed to submit solution: {response.content}")
+    def post_submission(
+        self,
+        problem_slug: str,
+        code: str,
+        language: str,
+        question_id: Optional[str] = None,
+    ) -> str:
+        """
+        Submit a solution to LeetCode without waiting for its verdict.
+        :param problem_slug: The slug of the problem to submit.
+        :param code: The user's solution code.
+        :param language: The programming language of the solution (e.g., "python3").
+        :param question_id: ID of the problem, fetched if not provided.
+        :return: The submission ID, to wait for the verdict with `wait_for_verdict`.
+        """
+        body = {
+            "lang": language,
+            "question_id": question_id or self.fetch_question_id(problem_slug),
+            "typed_code": code,
+        }
+        return str(self._post_code(problem_slug, "submit", body)["submission_id"])
 
-        return response.json()
+    def submit_solution(
+        self,
+        problem_slug: str,
+        code: str,
+        language: str,
+        question_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit a solution to LeetCode and wait for its verdict.
+        :param problem_slug: The slug of the problem to submit.
+        :param code: The user's solution code.
+        :param language: The programming language of the solution (e.g., "python3").
+        :param question_id: ID of the problem, fetched if not provided.
+        :return: A dictionary containing the submission result (e.g., `status_msg`,
+                 `status_runtime` and `status_memory`).
+        """
+        submission_id = self.post_submission(problem_slug, code, language, question_id)
+        return self.wait_for_verdict(submission_id)
 
     def fetch_company_questions(
         self,
@@ -292,6 +547,7 @@ class LeetCodeAPI:
         topic_filter: dict = None,
         filter_combine_type: str = "ALL",
         sort_by: dict = None,
+        problem_filter: Optional[ProblemFilter] = None,
     ):
         """
         Fetch filtered and sorted questions for a specific company using the company's GraphQL slug.
@@ -308,6 +564,8 @@ class LeetCodeAPI:
                              Operators include "IS" and "IS_NOT".
         :param filter_combine_type: Filter combination type, either "ALL" or "ANY" (default is "ALL").
         :param sort_by: A dictionary for sorting, e.g., {"sortField": "FREQUENCY", "sortOrder": "ASCENDING"}.
+        :param problem_filter: Filters compiled into `filtersV2`, replacing the
+                               difficulty and topic filters.
         :return: Questions and metadata as returned by the API.
         """
 
@@ -350,6 +608,8 @@ class LeetCodeAPI:
             or {},  # No operator for frequencyFilter
             # There are more filters available, but we're not using them in squidleet yet
         }
+        if problem_filter:
+            filters_v2.update(problem_filter.to_filters_v2(filter_combine_type))
 
         query = """
         query favoriteQuestionList(
@@ -405,7 +665,61 @@ class LeetCodeAPI:
         if not response.ok:
             raise Exception(f"❌ Failed to fetch company questions: {response.content}")
 
-        return response.json()
+        data = response.json()
+        if data.get("errors"):
+            # Raised rather than returned, so that errors are never cached
+            raise Exception(f"❌ Failed to fetch company questions: {data['errors']}")
+        if problem_filter:
+            # Keywords cannot be searched by this endpoint
+            question_list = (data.get("data") or {}).get("favoriteQuestionList") or {}
+            question_list["questions"] = [
+                question
+                for question in question_list.get("questions") or []
+                if problem_filter.matches(question)
+            ]
+        return data
+
+    def fetch_progress_questions(
+        self, skip: int = 0, limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Fetch the problems the user submitted to, most recently submitted first.
+        Requires an authenticated session.
+        :param skip: Number of problems to skip in pagination.
+        :param limit: Maximum number of problems to fetch.
+        :return: A dictionary with the `totalNum` of problems and the `questions`,
+                 each with its `frontendId`, `titleSlug`, `lastSubmittedAt` and
+                 `questionStatus` ("SOLVED" or "ATTEMPTED").
+        """
+        query = """
+        query userProgressQuestionList($filters: UserProgressQuestionListInput) {
+          userProgressQuestionList(filters: $filters) {
+            totalNum
+            questions {
+              frontendId
+              titleSlug
+              lastSubmittedAt
+              questionStatus
+            }
+          }
+        }
+        """
+
+        payload = {
+            "query": query,
+            "variables": {"filters": {"skip": skip, "limit": limit}},
+            "operationName": "userProgressQuestionList",
+        }
+
+        response = self.session.post(self.url, json=payload)
+        if not response.ok:
+            raise Exception(f"❌ Failed to fetch progress: {response.content}")
+
+        progress = (response.json().get("data") or {}).get("userProgressQuestionList")
+        if progress is None:
+            raise Exception("❌ Failed to fetch progress, is the session valid?")
+
+        return progress
 
     def get_company_names(self):
         """
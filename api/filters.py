@@ -0,0 +1,151 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+valid_difficulties = ["EASY", "MEDIUM", "HARD"]
+
+# Ways premium problems are served, as the `paid_only` option of a filter
+premium_modes = {"include": None, "exclude": False, "only": True}
+
+
+def get_tag_slug(tag_name: str) -> str:
+    """
+    Get the slug of a topic tag from its name.
+    :param tag_name: Name of the tag (e.g., "Hash Table").
+    :return: Slug of the tag (e.g., "hash-table").
+    """
+    return re.sub(r"[^a-z0-9]+", "-", tag_name.lower()).strip("-")
+
+
+class ProblemFilter:
+    def __init__(
+        self,
+        difficulties: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        min_ac_rate: Optional[float] = None,
+        max_ac_rate: Optional[float] = None,
+        paid_only: Optional[bool] = None,
+        search: Optional[str] = None,
+    ):
+        """
+        Filters of a problem list, compiled into the filters of the LeetCode
+        endpoints so that only matching problems are downloaded. Solved problems
+        are left to `filter_solved`, which also knows how to deprioritize them.
+        :param difficulties: Difficulty levels (e.g., ["Easy", "Medium"]).
+        :param tags: Topic tag slugs (e.g., ["array", "hash-table"]), all required.
+        :param min_ac_rate: Lowest acceptance rate, in percent.
+        :param max_ac_rate: Highest acceptance rate, in percent.
+        :param paid_only: True for premium problems only, False for free ones only.
+        :param search: Keywords searched in the titles of the problems.
+        """
+        self.difficulties = [difficulty.upper() for difficulty in difficulties or []]
+        self.tags = sorted(tags or [])
+        self.min_ac_rate = min_ac_rate
+        self.max_ac_rate = max_ac_rate
+        self.paid_only = paid_only
+        self.search = search.strip() if search else None
+
+        invalid = [d for d in self.difficulties if d not in valid_difficulties]
+        if invalid:
+            raise ValueError(
+                f"Invalid difficulty: {invalid[0]}. Must be one of {valid_difficulties}."
+            )
+        if (
+            self.min_ac_rate is not None
+            and self.max_ac_rate is not None
+            and self.min_ac_rate > self.max_ac_rate
+        ):
+            raise ValueError("Minimum acceptance rate exceeds the maximum.")
+
+    def cache_key(self) -> str:
+        """
+        Describe the filter, so that differently filtered lists are cached apart.
+        :return: Canonical JSON of the filter.
+        """
+        return json.dumps(vars(self), sort_keys=True)
+
+    def is_empty(self) -> bool:
+        """
+        Check whether the filter lets every problem through.
+        :return: True if no filter is set.
+        """
+        return self.cache_key() == ProblemFilter().cache_key()
+
+    def with_options(self, **options) -> "ProblemFilter":
+        """
+        Copy the filter, replacing some of its options.
+        :param options: Arguments of the constructor to replace (e.g., tags).
+        :return: New filter.
+        """
+        return ProblemFilter(**{**vars(self), **options})
+
+    def to_question_list_filters(
+        self, difficulty: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Compile the filter into a `QuestionListFilterInput` (`problemsetQuestionList`).
+        That input takes a single difficulty, so lists with several are fetched
+        once per difficulty. The acceptance rate is left to `matches`.
+        :param difficulty: Difficulty of this fetch, among the filter's difficulties.
+        :return: Filters for the query.
+        """
+        filters: Dict[str, Any] = {}
+        if difficulty:
+            filters["difficulty"] = difficulty.upper()
+        if self.tags:
+            filters["tags"] = self.tags
+        if self.paid_only is not None:
+            filters["premiumOnly"] = self.paid_only
+        if self.search:
+            filters["searchKeywords"] = self.search
+        return filters
+
+    def to_filters_v2(self, filter_combine_type: str = "ALL") -> Dict[str, Any]:
+        """
+        Compile the filter into a `QuestionFilterInput` (`filtersV2`, as used by
+        `favoriteQuestionList`). Keywords cannot be searched by the endpoint.
+        :param filter_combine_type: Whether "ALL" or "ANY" of the filters must match.
+        :return: Filters for the query.
+        """
+        operator = {"operator": "IS"}
+        filters: Dict[str, Any] = {
+            "filterCombineType": filter_combine_type,
+            "difficultyFilter": {"difficulties": self.difficulties, **operator},
+            "topicFilter": {"topicSlugs": self.tags, **operator},
+        }
+        if self.min_ac_rate is not None or self.max_ac_rate is not None:
+            filters["acceptanceFilter"] = {
+                "rangeLeft": self.min_ac_rate if self.min_ac_rate is not None else 0,
+                "rangeRight": (
+                    self.max_ac_rate if self.max_ac_rate is not None else 100
+                ),
+            }
+        if self.paid_only is not None:
+            filters["premiumFilter"] = {
+                "premiumStatus": ["PREMIUM" if self.paid_only else "NOT_PREMIUM"],
+                **operator,
+            }
+        return filters
+
+    def matches(self, problem: Dict[str, Any], search: bool = True) -> bool:
+        """
+        Check a downloaded problem against the filters an endpoint could not
+        apply (the acceptance rate and keywords), since the others were applied
+        by the endpoint already.
+        :param problem: Problem dictionary.
+        :param search: Whether to check the keywords, which only some endpoints search.
+        :return: True if the problem matches.
+        """
+        ac_rate = problem.get("acRate")
+        if ac_rate is not None:
+            if self.min_ac_rate is not None and ac_rate < self.min_ac_rate:
+                return False
+            if self.max_ac_rate is not None and ac_rate > self.max_ac_rate:
+                return False
+
+        if search and self.search:
+            title = (problem.get("title") or "").lower()
+            if not all(word in title for word in self.search.lower().split()):
+                return False
+
+        return True
@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from api.CachedLeetCodeAPI import CachedLeetCodeAPI
+
+
+class TestCachedLists(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.api = mock.Mock()
+        self.api.get_company_names.return_value = [{"name": "Google"}]
+        self.api.get_topic_tags.return_value = {"Array", "Hash Table"}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_cached_api(self):
+        cached_api = CachedLeetCodeAPI(cache_dir=self.temp_dir.name)
+        cached_api._api = self.api
+        return cached_api
+
+    def test_company_names_are_fetched_once(self):
+        """
+        Company names are fetched on a miss, then read from memory or disk.
+        """
+        cached_api = self.create_cached_api()
+        for _ in range(2):
+            self.assertEqual(cached_api.get_company_names(), [{"name": "Google"}])
+        # Another process finds them on disk
+        self.assertEqual(
+            self.create_cached_api().get_company_names(), [{"name": "Google"}]
+        )
+
+        self.api.get_company_names.assert_called_once_with()
+
+    def test_topic_tags_are_fetched_once(self):
+        """
+        Topic tags are cached as a list, and come back as a set.
+        """
+        cached_api = self.create_cached_api()
+        for _ in range(2):
+            self.assertEqual(cached_api.get_topic_tags(), {"Array", "Hash Table"})
+        self.assertEqual(
+            self.create_cached_api().get_topic_tags(), {"Array", "Hash Table"}
+        )
+
+        self.api.get_topic_tags.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from api.CachedLeetCodeAPI import CachedLeetCodeAPI, merge_company_questions
+from api.LeetCodeAPI import LeetCodeAPI
+
+
+def question(slug, frequency):
+    return {"titleSlug": slug, "title": slug.title(), "frequency": frequency}
+
+
+class TestMergeCompanyQuestions(unittest.TestCase):
+
+    def setUp(self):
+        self.question_lists = {
+            ("amazon", "thirty-days"): [question("two-sum", 50)],
+            ("amazon", "all"): [question("two-sum", 30), question("lru-cache", 70)],
+            ("google", "all"): [question("two-sum", 40), question("word-ladder", 10)],
+        }
+
+    def test_union_sums_frequencies(self):
+        merged = merge_company_questions(self.question_lists, "union")
+        self.assertEqual(
+            [(q["titleSlug"], q["frequency"]) for q in merged],
+            [("two-sum", 120), ("lru-cache", 70), ("word-ladder", 10)],
+        )
+        self.assertEqual(merged[0]["companies"], ["amazon", "google"])
+
+    def test_intersection_keeps_questions_of_every_company(self):
+        merged = merge_company_questions(self.question_lists, "intersection")
+        self.assertEqual([q["titleSlug"] for q in merged], ["two-sum"])
+
+
+class TestFetchQuestionsForCompanies(unittest.TestCase):
+
+    def test_merged_pool_is_cached(self):
+        lists = {
+            ("amazon", "all"): [question("two-sum", 30)],
+            ("google", "all"): [question("two-sum", 40), question("lru-cache", 5)],
+        }
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            with mock.patch.object(
+                cached_api,
+                "fetch_company_questions_for_duration",
+                side_effect=lambda company, duration, **kwargs: lists[
+                    (company, duration)
+                ],
+            ) as fetch_list:
+                for _ in range(2):
+                    merged = cached_api.fetch_questions_for_companies(
+                        ["Google", "Amazon"], ["all"], match="intersection"
+                    )
+
+        self.assertEqual([q["titleSlug"] for q in merged], ["two-sum"])
+        self.assertEqual(fetch_list.call_count, 2)
+
+    def test_invalid_match_is_rejected(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            with self.assertRaises(ValueError):
+                cached_api.fetch_questions_for_companies(
+                    ["amazon"], ["all"], match="xor"
+                )
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.ok = True
+        self.content = b""
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, json=None, **kwargs):
+        self.payloads.append(json)
+        return FakeResponse(
+            {
+                "data": {
+                    f"q{i}": {"titleSlug": slug, "content": f"<p>{slug}</p>"}
+                    for i, slug in enumerate(json["variables"].values())
+                    if slug != "missing"
+                }
+            }
+        )
+
+
+class TestFetchProblemsDetails(unittest.TestCase):
+
+    def test_missing_details_are_fetched_in_one_request(self):
+        with mock.patch.dict("os.environ", {"LEETCODE_SESSION": "session"}):
+            api = LeetCodeAPI()
+        api.session = FakeSession()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            cached_api._api = api
+            first = cached_api.fetch_problems_details(["two-sum", "missing", "3sum"])
+            second = cached_api.fetch_problems_details(["3sum", "two-sum"])
+            # Batched details are shared with fetch_problem
+            problem = cached_api.fetch_problem("two-sum")
+
+        self.assertEqual(set(first), {"two-sum", "3sum"})
+        self.assertEqual(second, {slug: first[slug] for slug in second})
+        self.assertEqual(problem["content"], "<p>two-sum</p>")
+        self.assertEqual(len(api.session.payloads), 1)
+        self.assertIn(
+            "q2: question(titleSlug: $slug2)", api.session.payloads[0]["query"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from api.CachedLeetCodeAPI import CachedLeetCodeAPI
+from api.filters import ProblemFilter, get_tag_slug
+from api.LeetCodeAPI import LeetCodeAPI
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.ok = True
+        self.status_code = 200
+        self.headers = {}
+        self.content = b""
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self, questions):
+        self.questions = questions
+        self.variables = []
+
+    def post(self, url, json=None, **kwargs):
+        variables = json["variables"]
+        self.variables.append(variables)
+        if "filtersV2" in variables:
+            end = variables["skip"] + variables["limit"]
+            data = {
+                "favoriteQuestionList": {
+                    "questions": self.questions[variables["skip"] : end],
+                    "totalLength": len(self.questions),
+                    "hasMore": end < len(self.questions),
+                }
+            }
+        else:
+            data = {"problemsetQuestionList": {"questions": self.questions}}
+        return FakeResponse({"data": data})
+
+
+class ErrorSession:
+    def post(self, url, json=None, **kwargs):
+        return FakeResponse({"data": None, "errors": [{"message": "Not found"}]})
+
+
+class TestProblemFilter(unittest.TestCase):
+
+    def test_tag_slugs(self):
+        self.assertEqual(get_tag_slug("Hash Table"), "hash-table")
+        self.assertEqual(get_tag_slug("Binary Search Tree"), "binary-search-tree")
+
+    def test_invalid_filters_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ProblemFilter(difficulties=["Impossible"])
+        with self.assertRaises(ValueError):
+            ProblemFilter(min_ac_rate=60, max_ac_rate=40)
+
+    def test_compiles_filters_v2(self):
+        problem_filter = ProblemFilter(
+            difficulties=["easy", "Medium"],
+            tags=["hash-table", "array"],
+            min_ac_rate=40,
+            paid_only=False,
+        )
+        filters = problem_filter.to_filters_v2()
+        self.assertEqual(
+            filters["difficultyFilter"]["difficulties"], ["EASY", "MEDIUM"]
+        )
+        self.assertEqual(filters["topicFilter"]["topicSlugs"], ["array", "hash-table"])
+        self.assertEqual(
+            filters["acceptanceFilter"], {"rangeLeft": 40, "rangeRight": 100}
+        )
+        self.assertEqual(filters["premiumFilter"]["premiumStatus"], ["NOT_PREMIUM"])
+
+    def test_compiles_question_list_filters(self):
+        problem_filter = ProblemFilter(tags=["array"], paid_only=True, search="two sum")
+        self.assertEqual(
+            problem_filter.to_question_list_filters("EASY"),
+            {
+                "difficulty": "EASY",
+                "tags": ["array"],
+                "premiumOnly": True,
+                "searchKeywords": "two sum",
+            },
+        )
+
+    def test_cache_key_ignores_order(self):
+        first = ProblemFilter(difficulties=["Easy", "Hard"], tags=["b", "a"])
+        second = ProblemFilter(difficulties=["Easy", "Hard"], tags=["a", "b"])
+        self.assertEqual(first.cache_key(), second.cache_key())
+        self.assertNotEqual(first.cache_key(), ProblemFilter().cache_key())
+
+    def test_options_are_replaced_in_copies(self):
+        problem_filter = ProblemFilter(min_ac_rate=30, search="sum")
+        copy = problem_filter.with_options(difficulties=["Easy"], tags=["array"])
+
+        self.assertEqual(copy.difficulties, ["EASY"])
+        self.assertEqual((copy.min_ac_rate, copy.search), (30, "sum"))
+        self.assertEqual(problem_filter.tags, [])
+        self.assertTrue(ProblemFilter().is_empty())
+        self.assertFalse(problem_filter.is_empty())
+
+    def test_matches_acceptance_rate_and_keywords(self):
+        problem_filter = ProblemFilter(min_ac_rate=30, max_ac_rate=60, search="Sum")
+        self.assertTrue(problem_filter.matches({"title": "Two Sum", "acRate": 50}))
+        self.assertFalse(problem_filter.matches({"title": "Two Sum", "acRate": 70}))
+        self.assertFalse(problem_filter.matches({"title": "LRU Cache", "acRate": 50}))
+        self.assertTrue(
+            problem_filter.matches({"title": "LRU Cache", "acRate": 50}, search=False)
+        )
+
+
+class TestFilterPushdown(unittest.TestCase):
+
+    def create_api(self, questions):
+        with mock.patch.dict("os.environ", {"LEETCODE_SESSION": "session"}):
+            api = LeetCodeAPI()
+        api.session = FakeSession(questions)
+        return api
+
+    def test_problem_list_filters_are_sent(self):
+        api = self.create_api(
+            [{"title": "Two Sum", "acRate": 50}, {"title": "3Sum", "acRate": 20}]
+        )
+        problems = api.fetch_problems(
+            problem_filter=ProblemFilter(
+                difficulties=["Easy"], tags=["array"], min_ac_rate=30
+            )
+        )
+        self.assertEqual([problem["title"] for problem in problems], ["Two Sum"])
+        self.assertEqual(
+            api.session.variables[0]["filters"],
+            {"difficulty": "EASY", "tags": ["array"]},
+        )
+
+    def test_company_filters_are_sent(self):
+        api = self.create_api([{"title": "Two Sum", "acRate": 50}])
+        api.fetch_company_questions(
+            "google-all",
+            problem_filter=ProblemFilter(difficulties=["Hard"], tags=["graph"]),
+        )
+        filters = api.session.variables[0]["filtersV2"]
+        self.assertEqual(filters["difficultyFilter"]["difficulties"], ["HARD"])
+        self.assertEqual(filters["topicFilter"]["topicSlugs"], ["graph"])
+
+    def test_other_filters_reach_company_lists(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            cached_api._api = self.create_api(
+                [
+                    {"titleSlug": "two-sum", "title": "Two Sum", "acRate": 50},
+                    {"titleSlug": "3sum", "title": "3Sum", "acRate": 20},
+                ]
+            )
+            questions = cached_api.fetch_questions_for_companies(
+                ["google"],
+                ["all"],
+                difficulties=["Easy"],
+                problem_filter=ProblemFilter(min_ac_rate=30, paid_only=False),
+            )
+
+        self.assertEqual([q["titleSlug"] for q in questions], ["two-sum"])
+        filters = cached_api.api.session.variables[0]["filtersV2"]
+        self.assertEqual(filters["difficultyFilter"]["difficulties"], ["EASY"])
+        self.assertEqual(filters["premiumFilter"]["premiumStatus"], ["NOT_PREMIUM"])
+
+    def test_company_questions_are_cached_per_filter(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            cached_api._api = self.create_api([{"title": "Two Sum", "acRate": 50}])
+
+            with mock.patch.object(
+                cached_api, "get_topic_tags", return_value={"Hash Table", "Graph"}
+            ):
+                for _ in range(2):
+                    cached_api.fetch_company_questions_for_duration(
+                        "Google", "all", difficulties=["easy"], tags=["Hash Table"]
+                    )
+                cached_api.fetch_company_questions_for_duration(
+                    "Google", "all", difficulties=["easy"], tags=["Graph"]
+                )
+
+        variables = cached_api.api.session.variables
+        self.assertEqual(len(variables), 2)
+        self.assertEqual(
+            variables[0]["filtersV2"]["topicFilter"]["topicSlugs"], ["hash-table"]
+        )
+        self.assertEqual(
+            variables[0]["filtersV2"]["difficultyFilter"]["difficulties"], ["EASY"]
+        )
+
+    def test_company_lists_are_not_truncated(self):
+        questions = [{"title": f"Problem {i}", "acRate": 50} for i in range(250)]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            cached_api._api = self.create_api(questions)
+            for _ in range(2):
+                self.assertEqual(
+                    cached_api.fetch_company_questions_for_duration("Google", "all"),
+                    questions,
+                )
+
+        # Each page is requested once, then read from the cache
+        skips = [variables["skip"] for variables in cached_api.api.session.variables]
+        self.assertEqual(skips, [0, 100, 200])
+
+    def test_company_list_errors_are_raised(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_api = CachedLeetCodeAPI(cache_dir=cache_dir)
+            cached_api._api = self.create_api([])
+            cached_api._api.session = ErrorSession()
+            with self.assertRaisesRegex(Exception, "Not found"):
+                list(cached_api.iter_company_questions("unknown-all"))
+            # Errors are not cached
+            self.assertEqual(list(cached_api.cache_dir.iterdir()), [])
+
+        # Errors in pages read from the cache are raised as well
+        with mock.patch.object(
+            cached_api,
+            "fetch_company_questions",
+            return_value={"data": None, "errors": [{"message": "Not found"}]},
+        ):
+            with self.assertRaisesRegex(Exception, "Not found"):
+                list(cached_api.iter_company_questions("unknown-all"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import time
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+from api.LeetCodeAPI import LeetCodeAPI, parse_retry_after
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {}
+        self.content = b""
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self, states):
+        self.states = list(states)
+        self.checks = 0
+
+    def get(self, url):
+        self.checks += 1
+        state = self.states.pop(0)
+        if state == "SUCCESS":
+            return FakeResponse({"state": state, "status_msg": "Accepted"})
+        return FakeResponse({"state": state})
+
+
+class TestVerdictPolling(unittest.TestCase):
+
+    def create_api(self, states):
+        with mock.patch.dict("os.environ", {"LEETCODE_SESSION": "session"}):
+            api = LeetCodeAPI()
+        api.session = FakeSession(states)
+        return api
+
+    def test_polling_backs_off_until_judging_starts(self):
+        """
+        Delays grow while the submission is queued and reset once it is judged.
+        """
+        api = self.create_api(["PENDING"] * 4 + ["STARTED", "SUCCESS"])
+        with mock.patch("api.LeetCodeAPI.time.sleep") as sleep:
+            result = api.wait_for_verdict("1")
+
+        self.assertEqual(result["status_msg"], "Accepted")
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(delays[:4], [0.75, 1.125, 1.6875, 2.53125])
+        self.assertEqual(delays[4], api.min_poll_delay)
+
+    def test_polling_gives_up(self):
+        """
+        A verdict that never arrives raises a TimeoutError.
+        """
+        api = self.create_api(["PENDING"] * 10)
+        with mock.patch("api.LeetCodeAPI.time.sleep"):
+            with self.assertRaises(TimeoutError):
+                api.wait_for_verdict("1", timeout=0)
+
+
+class TestRetryAfter(unittest.TestCase):
+
+    def test_seconds_and_http_dates_are_parsed(self):
+        self.assertEqual(parse_retry_after("30"), 30)
+        self.assertAlmostEqual(
+            parse_retry_after(formatdate(time.time() + 60, usegmt=True)), 60, delta=2
+        )
+
+    def test_invalid_headers_are_ignored(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Cold-start benchmark for the SquidLeet CLI.
+
+Each scenario runs in a fresh interpreter so that nothing is already imported,
+and the median wall time over several runs is compared against a budget.
+
+Usage: python benchmarks/import_time.py [--runs 7] [--budget-ms 200]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+load_mode = (
+    "import main\n"
+    "from handlers.PracticeHandler import PracticeModeHandler\n"
+    "PracticeModeHandler.get_mode({mode!r})\n"
+)
+
+scenarios = {
+    "help": ["main.py", "--help"],
+    "daily": ["-c", load_mode.format(mode="daily")],
+    "random": ["-c", load_mode.format(mode="random")],
+}
+
+
+def time_scenario(args, runs):
+    """
+    Time a scenario in fresh interpreters.
+    :param args: Arguments passed to the Python interpreter.
+    :param runs: Number of runs.
+    :return: Median wall time in milliseconds.
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=repo_root,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SquidLeet cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per scenario")
+    parser.add_argument(
+        "--budget-ms", type=float, default=200, help="Cold-start budget in ms"
+    )
+    options = parser.parse_args()
+
+    # Baseline: the cost of starting the interpreter itself
+    baseline = time_scenario(["-c", "pass"], options.runs)
+    print(f"{'interpreter':<12} {baseline:8.1f} ms")
+
+    over_budget = []
+    for name, args in scenarios.items():
+        median = time_scenario(args, options.runs)
+        print(f"{name:<12} {median:8.1f} ms")
+        if median > options.budget_ms:
+            over_budget.append(name)
+
+    if over_budget:
+        print(
+            f"❌ Over the {options.budget_ms:.0f} ms budget: {', '.join(over_budget)}"
+        )
+        sys.exit(1)
+
+    print(f"✅ All scenarios within the {options.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,12 @@
+from functools import lru_cache
+
 from api.LeetCodeAPI import LeetCodeAPI
 
-api = LeetCodeAPI()
+
+@lru_cache(maxsize=None)
+def get_api() -> LeetCodeAPI:
+    """
+    Get the shared LeetCodeAPI client, constructing it on first use.
+    :return: LeetCodeAPI instance.
+    """
+    return LeetCodeAPI()
@@ -1,3 +1,12 @@
+from functools import lru_cache
+
 from api.CachedLeetCodeAPI import CachedLeetCodeAPI
 
-cached_api = CachedLeetCodeAPI(cache_expiry=3600)
+
+@lru_cache(maxsize=None)
+def get_cached_api() -> CachedLeetCodeAPI:
+    """
+    Get the shared CachedLeetCodeAPI client, constructing it on first use.
+    :return: CachedLeetCodeAPI instance.
+    """
+    return CachedLeetCodeAPI(cache_expiry=3600)
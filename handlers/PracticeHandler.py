@@ -1,22 +1,23 @@
-from modes.RandomProblemMode import RandomProblemMode
-from modes.DailyChallengeMode import DailyChallengeMode
-from modes.CustomPracticeMode import CustomPracticeMode
-from modes.StudyPlanMode import StudyPlanMode
-from modes.CompanyMode import CompanyMode
+import importlib
+
+# Practice modes as (module, class) pairs, imported only once selected
+practice_modes = {
+    "random": ("modes.RandomProblemMode", "RandomProblemMode"),
+    "daily": ("modes.DailyChallengeMode", "DailyChallengeMode"),
+    "custom": ("modes.CustomPracticeMode", "CustomPracticeMode"),
+    "study-plan": ("modes.StudyPlanMode", "StudyPlanMode"),
+    "company": ("modes.CompanyMode", "CompanyMode"),
+    "review": ("modes.ReviewMode", "ReviewMode"),
+    "adaptive": ("modes.AdaptiveMode", "AdaptiveMode"),
+}
 
 
 class PracticeModeHandler:
     @staticmethod
     def get_mode(selection_mode: str):
-        if selection_mode == "random":
-            return RandomProblemMode()
-        elif selection_mode == "daily":
-            return DailyChallengeMode()
-        elif selection_mode == "custom":
-            return CustomPracticeMode()
-        elif selection_mode == "study-plan":
-            return StudyPlanMode()
-        elif selection_mode == "company":
-            return CompanyMode()
-        else:
+        if selection_mode not in practice_modes:
             raise ValueError(f"Unsupported mode: {selection_mode}")
+
+        module_name, class_name = practice_modes[selection_mode]
+        mode_class = getattr(importlib.import_module(module_name), class_name)
+        return mode_class()
@@ -0,0 +1,87 @@
+from handlers.file_handler import create_solution_file
+from utils import local_runner
+from utils.editor_launcher import launch_editor, wait_for_editor
+from utils.logger import LogLevel, log
+from utils.watch_and_submit import (
+    SolutionTracker,
+    log_session_status,
+    watch_solutions,
+)
+
+
+class SessionHandler:
+    def __init__(
+        self,
+        problems,
+        editor,
+        language,
+        time_limit,
+        debounce=0.5,
+        ignore_comments=False,
+        local_tests=True,
+        bench=False,
+    ):
+        """
+        Contest-like session: the solution files of all problems are created up
+        front and watched together, each one being submitted independently.
+        :param problems: Dictionaries with the `slug`, starter `code`,
+                         `difficulty` and `problem_details` of each problem.
+        """
+        self.problems = problems
+        self.editor = editor
+        self.language = language
+        self.time_limit = time_limit
+        self.debounce = debounce
+        self.ignore_comments = ignore_comments
+        self.local_tests = local_tests
+        self.bench = bench
+
+    def solve(self):
+        if self.local_tests:
+            local_runner.warm_up(self.language)
+
+        trackers = []
+        for problem in self.problems:
+            code_path = create_solution_file(
+                problem["slug"], problem["code"], self.language
+            )
+            log(f"📂 Template created: {code_path}", LogLevel.INFO)
+            trackers.append(
+                SolutionTracker(
+                    code_path,
+                    problem["slug"],
+                    self.language,
+                    ignore_comments=self.ignore_comments,
+                    problem_details=(
+                        problem["problem_details"] if self.local_tests else None
+                    ),
+                    bench=self.bench,
+                    difficulty=problem["difficulty"],
+                )
+            )
+
+        # Terminal editors and VS Code open all files at once, as buffers or tabs
+        if self.editor == "default":
+            editor_processes = [
+                launch_editor(self.editor, [tracker.code_path]) for tracker in trackers
+            ]
+        else:
+            editor_processes = [
+                launch_editor(self.editor, [tracker.code_path for tracker in trackers])
+            ]
+
+        log(
+            f"⏳ You have {self.time_limit} minutes to solve {len(trackers)} problems. Good luck!",
+            LogLevel.INFO,
+        )
+        log_session_status(trackers)
+        try:
+            watch_solutions(trackers, self.debounce, self.time_limit)
+            accepted_count = sum(tracker.accepted for tracker in trackers)
+            log(
+                f"🏆 Session over: {accepted_count}/{len(trackers)} problems accepted.",
+                LogLevel.INFO,
+            )
+        finally:
+            for editor_process in editor_processes:
+                wait_for_editor(editor_process)
@@ -1,33 +1,48 @@
-import subprocess
-
 from handlers.file_handler import create_solution_file
-from utils.editor_resolver import resolve_editor_command
+from utils import local_runner
+from utils.editor_launcher import launch_editor, wait_for_editor
 from utils.logger import LogLevel, log
 from utils.watch_and_submit import setup_file_watcher
 
 
-def _open_in_editor(editor, file_path):
-    open_command = resolve_editor_command(editor, file_path)
-    try:
-        subprocess.run(open_command, check=True, shell=True)
-        log(f"📂 Opened {file_path} in the editor.", LogLevel.INFO)
-    except subprocess.CalledProcessError as e:
-        log(f"❌ Failed to open file in the editor: {e}", LogLevel.ERROR)
-
-
 class SolutionHandler:
-    def __init__(self, problem, code, difficulty, editor, language, time_limit):
+    def __init__(
+        self,
+        problem,
+        code,
+        difficulty,
+        editor,
+        language,
+        time_limit,
+        debounce=0.5,
+        ignore_comments=False,
+        problem_details=None,
+        local_tests=True,
+        bench=False,
+    ):
         self.problem = problem
         self.code = code
         self.difficulty = difficulty
         self.editor = editor
         self.language = language
         self.time_limit = time_limit
+        self.debounce = debounce
+        self.ignore_comments = ignore_comments
+        self.problem_details = problem_details
+        self.local_tests = local_tests
+        self.bench = bench
 
     def solve(self):
+        if self.local_tests and self.problem_details:
+            local_runner.warm_up(self.language)
+
         code_path = self._create_file(self.language)
-        _open_in_editor(self.editor, code_path)
-        self._setup_watcher(code_path, self.language, self.time_limit)
+        # The editor runs alongside the watcher, so saves are submitted while editing
+        editor_process = launch_editor(self.editor, [code_path])
+        try:
+            self._setup_watcher(code_path, self.language, self.time_limit)
+        finally:
+            wait_for_editor(editor_process)
 
     def _create_file(self, language):
         code_path = create_solution_file(self.problem, self.code, language)
@@ -35,9 +50,19 @@ class SolutionHandler:
         return code_path
 
     def _setup_watcher(self, file_path, language, time_limit):
-        setup_file_watcher(file_path, self.problem, language, time_limit)
         log(
             f"⏳ You have {time_limit} minutes to solve the problem. Good luck!",
             LogLevel.INFO,
         )
         log(f"✨ Difficulty Level: {self.difficulty}", LogLevel.INFO)
+        setup_file_watcher(
+            file_path,
+            self.problem,
+            language,
+            time_limit,
+            debounce=self.debounce,
+            ignore_comments=self.ignore_comments,
+            problem_details=self.problem_details if self.local_tests else None,
+            bench=self.bench,
+            difficulty=self.difficulty,
+        )
@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+probe = """
+import json, sys
+import main
+from handlers.APIHandler import get_api
+from handlers.CacheHandler import get_cached_api
+from handlers.PracticeHandler import PracticeModeHandler
+
+mode = PracticeModeHandler.get_mode({mode!r})
+print(json.dumps({{
+    "mode": type(mode).__name__,
+    "modules": sorted(m for m in sys.modules if m.startswith("modes.")),
+    "requests": "requests" in sys.modules,
+    "numpy": "numpy" in sys.modules,
+    "html2text": "html2text" in sys.modules,
+    "clients": get_api.cache_info().currsize + get_cached_api.cache_info().currsize,
+}}))
+"""
+
+
+def run_probe(mode):
+    env = {key: value for key, value in os.environ.items()}
+    env.pop("LEETCODE_SESSION", None)
+    output = subprocess.run(
+        [sys.executable, "-c", probe.format(mode=mode)],
+        cwd=repo_root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestPracticeModeHandler(unittest.TestCase):
+
+    def test_only_selected_mode_is_imported(self):
+        """
+        Selecting a mode imports that mode alone and makes no API client.
+        """
+        result = run_probe("daily")
+
+        self.assertEqual(result["mode"], "DailyChallengeMode")
+        self.assertEqual(
+            result["modules"], ["modes.DailyChallengeMode", "modes.PracticeMode"]
+        )
+        self.assertFalse(result["requests"])
+        self.assertFalse(result["numpy"])
+        self.assertFalse(result["html2text"])
+        self.assertEqual(result["clients"], 0)
+
+    def test_company_mode_makes_no_request_at_import(self):
+        """
+        Company mode no longer fetches the company list while being imported.
+        """
+        result = run_probe("company")
+
+        self.assertEqual(result["mode"], "CompanyMode")
+        self.assertFalse(result["requests"])
+        self.assertEqual(result["clients"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,10 @@
-from services import CommandParser, SessionManager, InputsCollector, PracticeModeManager
+from services import (
+    CommandParser,
+    Daemon,
+    SessionManager,
+    InputsCollector,
+    PracticeModeManager,
+)
 from utils.logger import log, LogLevel
 
 
@@ -12,6 +18,33 @@ def main():
         # Validate and set the LeetCode session token
         SessionManager.initialize(cli_options)
 
+        if cli_options["command"] == "stats":
+            # Imported here since NumPy is only needed for the report
+            from scoring.stats import show_stats
+
+            show_stats()
+            return
+
+        if cli_options["command"] == "daemon":
+            # Keep sessions and caches warm for subsequent invocations
+            Daemon.serve()
+            return
+
+        # Let a running daemon select the problems, if there is one
+        selection = None
+        if not cli_options["no_daemon"]:
+            selection = Daemon.request_selection(cli_options)
+
+        if selection is not None:
+            print(selection["output"], end="")
+            if "error" in selection:
+                raise Exception(selection["error"])
+
+            # The daemon's inputs decide which code is written and run
+            InputsCollector.validate(selection["inputs"])
+            PracticeModeManager.solve(selection["inputs"], selection["problems"])
+            return
+
         # Collect & validate inputs and detect practice mode
         inputs = InputsCollector.collect(cli_options)
 
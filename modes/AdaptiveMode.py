@@ -0,0 +1,62 @@
+from handlers.CacheHandler import get_cached_api
+from modes.PracticeMode import PracticeMode
+from recommendations.adaptive import build_skill_model, select_adaptive_problem
+from recommendations.similarity import get_similarity_index
+from scoring.attempts import get_attempt_store
+from scoring.progress import filter_solved
+from utils.constants import difficulty_map
+from utils.logger import log, LogLevel
+
+
+class AdaptiveMode(PracticeMode):
+    def select(self, args):
+        log("Selected 📐 Adaptive Mode", LogLevel.INFO)
+        try:
+            # Reuse the same cached catalog and tag index as the recommendations
+            catalog = get_cached_api().fetch_problems(
+                limit=1000, difficulties=list(difficulty_map.keys())
+            )
+            index = get_similarity_index(catalog)
+
+            store = get_attempt_store()
+            events = store.get_problem_events()
+            model = build_skill_model(index, events, store.get_problem_tags())
+        except Exception as e:
+            log(f"Failed to rate your skills: {str(e)}", LogLevel.ERROR)
+            return []
+
+        solved = set()
+        if args["solved"] != "include":
+            solved = {
+                event["problem_slug"]
+                for event in events
+                if event["event"] == "verdict" and event["verdict"] == "Accepted"
+            }
+            # Problems solved on the account outside of Squidleet count as well
+            unsolved = {
+                problem["titleSlug"]
+                for problem in filter_solved(catalog, args["solved"])
+            }
+            solved.update(
+                problem["titleSlug"]
+                for problem in catalog
+                if problem["titleSlug"] not in unsolved
+            )
+
+        catalog_slugs = {problem["titleSlug"] for problem in catalog}
+        if args["solved"] == "deprioritize" and catalog_slugs <= solved:
+            log("Every problem was solved already, picking among them.", LogLevel.INFO)
+            solved = set()
+
+        problem = select_adaptive_problem(
+            model, target=args["target_success"], exclude=solved
+        )
+        if not problem:
+            log("No unsolved problems left in the catalog.", LogLevel.ERROR)
+            return []
+
+        log(
+            f"📐 Estimated chance of solving it: {problem['successProbability']:.0%}",
+            LogLevel.INFO,
+        )
+        return [problem]
@@ -1,18 +1,12 @@
 import random
 from typing import Optional, List, Dict, Any
 
-from handlers.APIHandler import api
-from handlers.CacheHandler import cached_api
-from modes.PracticeMode import (
-    PracticeMode,
-    log_problem_details,
-    open_in_browser,
-    create_and_solve_handler,
-)
+from api.filters import ProblemFilter
+from handlers.CacheHandler import get_cached_api
+from modes.PracticeMode import PracticeMode, get_problem_filter
+from scoring.progress import filter_solved
 from utils.logger import log, LogLevel
 
-company_names = api.get_company_names()
-
 
 def get_company(company_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -20,47 +14,64 @@ def get_company(company_name: str) -> Optional[Dict[str, Any]]:
     :param company_name: The name of the company (e.g., "facebook").
     :return: Company dictionary or None if not found.
     """
-    for company in company_names:
+    for company in get_cached_api().get_company_names():
         if company["name"].lower() == company_name.lower():
             return company
     return None
 
 
 def get_random_company_problem(
-    company_name: str,
-    duration: Optional[str] = None,
+    company_names: List[str],
+    durations: Optional[List[str]] = None,
     difficulties: Optional[List[str]] = None,
     tags: Optional[List[str]] = None,
+    solved_mode: str = "deprioritize",
+    match: str = "union",
+    problem_filter: Optional[ProblemFilter] = None,
 ) -> Optional[Dict[str, Any]]:
     """
-    Get a random problem from a specific company for a given duration.
-    :param company_name: The name of the company (e.g., "facebook").
-    :param duration: Duration to filter questions (e.g., "thirty-days", "three-months").
+    Get a random problem asked by some companies over given durations, picked
+    in proportion to how frequently it was asked.
+    :param company_names: The names of the companies (e.g., ["facebook"]).
+    :param durations: Durations to filter questions (e.g., ["thirty-days", "three-months"]).
     :param difficulties: Difficulty levels of the problems (e.g., "Easy", "Medium", "Hard").
     :param tags: Tags of the problems (e.g., "Array", "String").
+    :param solved_mode: How solved problems are handled (see `filter_solved`).
+    :param match: "union" for problems asked at any of the companies, or
+                  "intersection" for problems asked at all of them.
+    :param problem_filter: Other filters of the problems (e.g., acceptance rate).
     :return: A random problem dictionary or None if no problems are found.
     """
-    problems = cached_api.fetch_company_questions_for_duration(
-        company_name=company_name,
-        duration=duration,
+    problems = get_cached_api().fetch_questions_for_companies(
+        company_names=company_names,
+        durations=durations or ["all"],
         difficulties=difficulties,
         tags=tags,
+        match=match,
+        problem_filter=problem_filter,
     )
+    problems = filter_solved(problems, solved_mode)
 
     if not problems:
         return None
 
-    random_index = random.randint(0, len(problems) - 1)
-    return problems[random_index]
+    # Frequencies are only known with a premium session, otherwise pick uniformly
+    weights = [problem.get("frequency") or 0 for problem in problems]
+    if not any(weights):
+        weights = None
+    return random.choices(problems, weights=weights)[0]
 
 
 class CompanyMode(PracticeMode):
-    def handle(self, args):
-        company = get_company(args["company_name"])
+    def select(self, args):
+        companies = []
+        for company_name in args["company_names"]:
+            company = get_company(company_name)
 
-        if company is None:
-            log(f"❌ Company not found: ${args['company_name']}", LogLevel.ERROR)
-            raise ValueError(f"Company not found: {args['company_name']}")
+            if company is None:
+                log(f"❌ Company not found: ${company_name}", LogLevel.ERROR)
+                raise ValueError(f"Company not found: {company_name}")
+            companies.append(company)
 
         # Mapping of number words to their numeric values
         number_word_mapping = {
@@ -87,38 +98,36 @@ class CompanyMode(PracticeMode):
             "thirty": 30,
         }
 
-        log_msg = f"Selected 👔 Company Mode: Top questions asked at {company['name']}"
-        if args["duration"] and args["duration"].lower() != "all":
-            # Convert duration to numbers if it matches the mapping
-            duration_parts = (
-                args["duration"].lower().split("-")
-            )  # Split on dashes if necessary
-            numeric_duration = " ".join(
-                str(number_word_mapping.get(word, word)) for word in duration_parts
-            )
-            log_msg += f" in the last {numeric_duration}"
+        separator = " and " if args["company_match"] == "intersection" else " or "
+        company_names = separator.join(company["name"] for company in companies)
+        log_msg = f"Selected 👔 Company Mode: Top questions asked at {company_names}"
+        if "all" not in args["durations"]:
+            # Convert durations to numbers if they match the mapping
+            numeric_durations = [
+                " ".join(
+                    str(number_word_mapping.get(word, word))
+                    for word in duration.lower().split("-")  # Split on dashes
+                )
+                for duration in args["durations"]
+            ]
+            log_msg += f" in the last {' or '.join(numeric_durations)}"
         log(log_msg, LogLevel.INFO)
 
         try:
             problem = get_random_company_problem(
-                company_name=company["name"],
-                duration=args["duration"],
+                company_names=[company["name"] for company in companies],
+                durations=args["durations"],
                 difficulties=args["difficulties"],
                 tags=args["tags"],
-            )
-
-            if not problem:
-                log("No problems found for the selected criteria.", LogLevel.ERROR)
-                return
-
-            url = f"https://leetcode.com/problems/{problem['titleSlug']}"
-            log_problem_details(problem, problem["difficulty"], url)
-            open_in_browser(url, args.open_in_browser)
-            create_and_solve_handler(
-                problem["titleSlug"],
-                problem["codeSnippets"],
-                problem["difficulty"],
-                args,
+                solved_mode=args["solved"],
+                match=args["company_match"],
+                problem_filter=get_problem_filter(args),
             )
         except Exception as e:
             log(f"Failed to fetch company problem: {str(e)}", LogLevel.ERROR)
+            return []
+
+        if not problem:
+            log("No problems found for the selected criteria.", LogLevel.ERROR)
+            return []
+        return [problem]
@@ -1,25 +1,150 @@
-import html2text
-import markdown
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from utils.logger import log, LogLevel
+from api.filters import ProblemFilter, premium_modes
+from scoring.attempts import record_attempt
+from utils.constants import difficulty_map
+from utils.content_renderer import render_problem_content
+from utils.logger import capture_logs, log, LogLevel, print_logs
 
+from handlers.CacheHandler import get_cached_api
+from handlers.SessionHandler import SessionHandler
 from handlers.SolutionHandler import SolutionHandler
 
+# Problems prepared in the background while the current one is solved
+prefetch_count = 2
 
-def create_and_solve_handler(problem_slug, code_snippets, difficulty_label, args):
-    # Determine the starter code based on the chosen language
+# Fields needed to present and solve a problem, missing from some problem lists
+# (e.g., company and study plan lists)
+hydrated_fields = ["content", "codeSnippets"]
+
+
+def get_problem_filter(args):
+    """
+    Build the filter of problem lists from the acceptance rates, premium mode
+    and keywords of the inputs.
+    :param args: Collected inputs.
+    :return: ProblemFilter, or None without any filter, so that the shared
+             unfiltered lists are reused.
+    """
+    problem_filter = ProblemFilter(
+        min_ac_rate=args["min_ac_rate"],
+        max_ac_rate=args["max_ac_rate"],
+        paid_only=premium_modes[args["premium"]],
+        search=args["search"],
+    )
+    return None if problem_filter.is_empty() else problem_filter
+
+
+def hydrate_problems(problems):
+    """
+    Fill the fields missing from selected problems with their details, fetched
+    from the per-problem cache (and in batches, for those not cached yet).
+    :param problems: Selected problem dictionaries.
+    :return: Problem dictionaries with their details.
+    """
+    slugs = [
+        problem.get("titleSlug")
+        for problem in problems
+        if any(problem.get(field) is None for field in hydrated_fields)
+    ]
+    if not slugs:
+        return problems
+
+    try:
+        details = get_cached_api().fetch_problems_details(slugs)
+    except Exception as e:
+        log(f"Failed to fetch problem details: {str(e)}", LogLevel.ERROR)
+        return problems
+
+    hydrated_problems = []
+    for problem in problems:
+        problem_details = details.get(problem.get("titleSlug"), {})
+        hydrated_problems.append(
+            {
+                **problem,
+                **{
+                    field: value
+                    for field, value in problem_details.items()
+                    if problem.get(field) is None
+                },
+            }
+        )
+    return hydrated_problems
+
+
+def prepare_problem(problem):
+    """
+    Hydrate a problem and render its statement into the render cache, so that
+    presenting it is instant.
+    :param problem: Selected problem dictionary.
+    :return: Problem dictionary with its details.
+    """
+    problem = hydrate_problems([problem])[0]
+    content = problem.get("content")
+    if content:
+        try:
+            render_problem_content(problem.get("titleSlug"), content)
+        except Exception as e:
+            # Rendered again, and reported, once the problem is presented
+            log(f"Failed to prerender problem content: {str(e)}", LogLevel.DEBUG)
+    return problem
+
+
+def _prepare_in_background(problem):
+    """
+    Prepare a problem in a background thread, capturing what it logs so that
+    nothing is printed over the problem being solved (or its editor).
+    :param problem: Selected problem dictionary.
+    :return: Problem dictionary with its details, and the captured messages.
+    """
+    with capture_logs() as messages:
+        return prepare_problem(problem), messages
 
-    code = ""
+
+def prefetch_problems(problems, count=prefetch_count):
+    """
+    Prepare selected problems ahead of time: while a problem is solved, the
+    next `count` ones are fetched and rendered in the background.
+    :param problems: Selected problem dictionaries.
+    :param count: Problems prepared ahead of the current one.
+    :return: Iterator over the prepared problems, in order.
+    """
+    upcoming = iter(problems)
+    executor = ThreadPoolExecutor(max_workers=max(1, count))
+    try:
+        futures = deque(
+            executor.submit(_prepare_in_background, problem)
+            for _, problem in zip(range(count + 1), upcoming)
+        )
+        while futures:
+            problem, messages = futures.popleft().result()
+            next_problem = next(upcoming, None)
+            if next_problem is not None:
+                futures.append(executor.submit(_prepare_in_background, next_problem))
+            # Reported as the problem comes up, rather than mid-session
+            print_logs(messages)
+            yield problem
+    finally:
+        # Sessions ending early do not wait for the problems prepared ahead
+        executor.shutdown(wait=False)
+
+
+def get_starter_code(code_snippets, language):
+    # Determine the starter code based on the chosen language
     for item in code_snippets:
-        if item.get("lang").lower() == args["language"].lower():
-            code = item.get("code")
-            break
+        if item.get("lang").lower() == language.lower():
+            return item.get("code")
 
+    log(f"Starter code not found for language: {language}", LogLevel.ERROR)
+    return None
+
+
+def create_and_solve_handler(
+    problem_slug, code_snippets, difficulty_label, args, problem=None
+):
+    code = get_starter_code(code_snippets, args["language"])
     if not code:
-        log(
-            f"Starter code not found for language: {args['language']}",
-            LogLevel.ERROR,
-        )
         return
 
     handler = SolutionHandler(
@@ -29,9 +154,143 @@ def create_and_solve_handler(problem_slug, code_snippets, difficulty_label, args
         editor=args["editor"],
         language=args["language"],
         time_limit=args["time_limit"],
+        debounce=args["debounce"],
+        ignore_comments=args["ignore_comments"],
+        problem_details=problem,
+        local_tests=args["local_tests"],
+        bench=args["bench"],
     )
     handler.solve()
 
+    log_similar_problems(problem_slug, args["recommendations"])
+
+
+def log_similar_problems(problem_slug, count):
+    if count < 1:
+        return
+
+    # Imported here since NumPy is only needed once a problem has been solved
+    from recommendations.similarity import get_similarity_index
+
+    try:
+        # Reuse the same cached catalog as the random mode
+        catalog = get_cached_api().fetch_problems(
+            limit=1000, difficulties=list(difficulty_map.keys())
+        )
+        index = get_similarity_index(catalog)
+
+        problem = {"titleSlug": problem_slug}
+        if problem_slug not in index.slug_to_row:
+            problem = get_cached_api().fetch_problem(problem_slug)
+
+        similar_problems = index.most_similar(problem, count)
+    except Exception as e:
+        log(f"Failed to recommend similar problems: {str(e)}", LogLevel.ERROR)
+        return
+
+    if not similar_problems:
+        return
+
+    log("🧭 Similar problems to practice next:", LogLevel.INFO)
+    for similar in similar_problems:
+        difficulty_label = difficulty_map.get(
+            similar["difficulty"].lower(), similar["difficulty"]
+        )
+        url = f"https://leetcode.com/problems/{similar['titleSlug']}"
+        log(f"  • {similar['title']} ({difficulty_label}) {url}", LogLevel.INFO)
+
+
+def solve_problems(problems, args):
+    if args["contest"] and len(problems) > 1:
+        solve_contest(hydrate_problems(problems), args)
+        return
+
+    # Present each selected problem and solve it, one after another, while the
+    # next ones are prepared
+    for problem in prefetch_problems(problems):
+        slug = problem.get("titleSlug")
+        if not problem.get("difficulty"):
+            log(f"Problem with slug '{slug}' not found.", LogLevel.ERROR)
+            continue
+        try:
+            difficulty_label = difficulty_map.get(
+                problem["difficulty"].lower(), problem["difficulty"]
+            )
+            url = f"https://leetcode.com/problems/{slug}"
+            log_problem_details(problem, difficulty_label, url)
+            open_in_browser(url, args["open_in_browser"])
+            record_served(problem, args)
+            create_and_solve_handler(
+                slug,
+                problem.get("codeSnippets") or [],
+                difficulty_label,
+                args,
+                problem=problem,
+            )
+        except Exception as e:
+            log(f"Failed to process problem '{slug}': {str(e)}", LogLevel.ERROR)
+
+
+def solve_contest(problems, args):
+    # Present all problems up front, then solve them together like a contest
+    session_problems = []
+    for problem in problems:
+        slug = problem.get("titleSlug")
+        if not problem.get("difficulty"):
+            log(f"Problem with slug '{slug}' not found.", LogLevel.ERROR)
+            continue
+        try:
+            difficulty_label = difficulty_map.get(
+                problem["difficulty"].lower(), problem["difficulty"]
+            )
+            url = f"https://leetcode.com/problems/{slug}"
+            log_problem_details(problem, difficulty_label, url)
+            open_in_browser(url, args["open_in_browser"])
+            record_served(problem, args)
+
+            code = get_starter_code(problem.get("codeSnippets") or [], args["language"])
+            if code:
+                session_problems.append(
+                    {
+                        "slug": slug,
+                        "code": code,
+                        "difficulty": problem["difficulty"],
+                        "problem_details": problem,
+                    }
+                )
+        except Exception as e:
+            log(f"Failed to process problem '{slug}': {str(e)}", LogLevel.ERROR)
+
+    if not session_problems:
+        return
+
+    handler = SessionHandler(
+        problems=session_problems,
+        editor=args["editor"],
+        language=args["language"],
+        time_limit=args["time_limit"],
+        debounce=args["debounce"],
+        ignore_comments=args["ignore_comments"],
+        local_tests=args["local_tests"],
+        bench=args["bench"],
+    )
+    handler.solve()
+
+
+def record_served(problem, args):
+    # Problems merged from several companies list those that asked them, which
+    # the stats split again
+    companies = problem.get("companies") or [
+        name.strip() for name in (args.get("company_name") or "").split(",")
+    ]
+    record_attempt(
+        "served",
+        problem.get("titleSlug"),
+        difficulty=problem.get("difficulty"),
+        company=",".join(company for company in companies if company) or None,
+        tags=[tag["slug"] for tag in problem.get("topicTags") or [] if tag.get("slug")],
+    )
+
 
 def open_in_browser(url, open_flag):
     if open_flag:
@@ -54,17 +313,13 @@ def log_problem_details(problem, difficulty_label, url):
     if ac_rate is not None:
         log(f"📈 Acceptance Rate: {ac_rate:.2f}%", LogLevel.INFO)
 
-    # Assuming `content` is the Markdown content
+    # `content` is already HTML, so it is rendered straight to terminal text
     content = problem.get("content")
     if content:
         try:
-            html_content = markdown.markdown(content)
-
-            text_maker = html2text.HTML2Text()
-            text_maker.ignore_links = True
-            plain_text = text_maker.handle(html_content)
-
-            log(plain_text, LogLevel.INFO)
+            log(
+                render_problem_content(problem.get("titleSlug"), content), LogLevel.INFO
+            )
         except Exception as e:
             log(f"Failed to convert problem content: {str(e)}", LogLevel.ERROR)
 
@@ -73,5 +328,21 @@ class PracticeMode:
     def __init__(self):
         pass
 
-    def handle(self, args):
+    def select(self, args):
+        """
+        Select the problems to practice.
+        :param args: Collected inputs.
+        :return: A list of problem dictionaries (may be empty).
+        """
         raise NotImplementedError("This method should be implemented by subclasses.")
+
+    def solve(self, problems, args):
+        """
+        Solve the selected problems, whether selected here or by the daemon.
+        :param problems: Problem dictionaries returned by `select`.
+        :param args: Collected inputs.
+        """
+        solve_problems(problems, args)
+
+    def handle(self, args):
+        self.solve(self.select(args), args)
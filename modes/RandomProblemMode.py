@@ -1,26 +1,29 @@
 import random
 from typing import Optional, List, Dict, Any
 
-from handlers.CacheHandler import cached_api
-from modes.PracticeMode import (
-    PracticeMode,
-    log_problem_details,
-    open_in_browser,
-    create_and_solve_handler,
-)
-from utils.constants import difficulty_map
+from api.filters import ProblemFilter
+from handlers.CacheHandler import get_cached_api
+from modes.PracticeMode import PracticeMode, get_problem_filter
+from scoring.progress import filter_solved
 from utils.logger import log, LogLevel
 
 
 def get_random_problem(
     difficulties: Optional[List[str]] = None,
+    solved_mode: str = "deprioritize",
+    problem_filter: Optional[ProblemFilter] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Get a random problem from LeetCode.
     :param difficulties: Difficulty levels of the problems (e.g., "Easy", "Medium", "Hard").
+    :param solved_mode: How solved problems are handled (see `filter_solved`).
+    :param problem_filter: Other filters of the problems (e.g., acceptance rate).
     :return: A random problem dictionary or None if no problems are found.
     """
-    problems = cached_api.fetch_problems(limit=1000, difficulties=difficulties)
+    problems = get_cached_api().fetch_problems(
+        limit=1000, difficulties=difficulties, problem_filter=problem_filter
+    )
+    problems = filter_solved(problems, solved_mode)
 
     if not problems:
         return None
@@ -30,19 +33,19 @@ def get_random_problem(
 
 
 class RandomProblemMode(PracticeMode):
-    def handle(self, args):
+    def select(self, args):
         log("Selected 🎲 Random Problem Mode", LogLevel.INFO)
         try:
-            problem = get_random_problem(difficulties=args["difficulties"])
-            if not problem:
-                log("No problems found for the selected difficulties.", LogLevel.ERROR)
-                return
-            difficulty_label = difficulty_map[problem["difficulty"].lower()]
-            url = f"https://leetcode.com/problems/{problem['titleSlug']}"
-            log_problem_details(problem, difficulty_label, url)
-            open_in_browser(url, args["open_in_browser"])
-            create_and_solve_handler(
-                problem["titleSlug"], problem["codeSnippets"], difficulty_label, args
+            problem = get_random_problem(
+                difficulties=args["difficulties"],
+                solved_mode=args["solved"],
+                problem_filter=get_problem_filter(args),
             )
         except Exception as e:
             log(f"Failed to fetch random problem: {str(e)}", LogLevel.ERROR)
+            return []
+
+        if not problem:
+            log("No problems found for the selected difficulties.", LogLevel.ERROR)
+            return []
+        return [problem]
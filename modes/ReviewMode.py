@@ -0,0 +1,70 @@
+import time
+
+from handlers.CacheHandler import get_cached_api
+from modes.PracticeMode import PracticeMode, solve_problems
+from scoring.attempts import get_attempt_store
+from scoring.review import ReviewScheduler, split_attempts
+from utils.logger import log, LogLevel
+
+
+def load_review_scheduler() -> ReviewScheduler:
+    """
+    Schedule the reviews of the problems attempted so far.
+    :return: ReviewScheduler built from the attempt history.
+    """
+    return ReviewScheduler(get_attempt_store().get_problem_events())
+
+
+class ReviewMode(PracticeMode):
+    def select(self, args):
+        log("Selected 🔁 Review Mode", LogLevel.INFO)
+        return self._select_due(load_review_scheduler())
+
+    def solve(self, problems, args):
+        scheduler = load_review_scheduler()
+
+        # Review due problems one after another, rescheduling each one as soon
+        # as it is attempted
+        while problems:
+            slug = problems[0]["titleSlug"]
+            solve_problems(problems, args)
+
+            attempts = split_attempts(get_attempt_store().get_problem_events(slug))
+            if not attempts or not scheduler.review(slug, attempts[-1]):
+                log(
+                    f"Nothing was submitted for {slug}, ending the review.",
+                    LogLevel.INFO,
+                )
+                return
+            problems = self._select_due(scheduler)
+
+    @staticmethod
+    def _select_due(scheduler):
+        next_due = scheduler.next_due()
+        if next_due is None:
+            log(
+                "📭 No problems to review yet. Solve some problems in another mode first!",
+                LogLevel.INFO,
+            )
+            return []
+
+        slug, due_at = next_due
+        due_date = time.strftime("%Y-%m-%d %H:%M", time.localtime(due_at))
+        if due_at > time.time():
+            log(
+                f"🎉 Nothing to review right now. Next review: {slug} on {due_date}.",
+                LogLevel.INFO,
+            )
+            return []
+
+        log(f"🔁 Reviewing {slug}, due since {due_date}.", LogLevel.INFO)
+        try:
+            problem = get_cached_api().fetch_problem(slug)
+        except Exception as e:
+            log(f"Failed to fetch problem '{slug}': {str(e)}", LogLevel.ERROR)
+            return []
+
+        if not problem:
+            log(f"Problem with slug '{slug}' not found.", LogLevel.ERROR)
+            return []
+        return [problem]
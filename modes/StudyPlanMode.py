@@ -1,14 +1,9 @@
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 
-from handlers.CacheHandler import cached_api
-from modes.PracticeMode import (
-    PracticeMode,
-    log_problem_details,
-    create_and_solve_handler,
-    open_in_browser,
-)
-from utils.constants import difficulty_map
+from handlers.CacheHandler import get_cached_api
+from modes.PracticeMode import PracticeMode
+from scoring.progress import filter_solved
 from utils.logger import log, LogLevel
 
 
@@ -18,7 +13,7 @@ def get_study_plan_problems(slug: str) -> List[Dict[str, Any]]:
     :param slug: The slug of the study plan (e.g., "leetcode-75").
     :return: A list of dictionaries, each containing details of a problem.
     """
-    study_plan = cached_api.get_study_plan(slug)
+    study_plan = get_cached_api().get_study_plan(slug)
 
     if not study_plan:
         raise Exception(f"❌ Study plan not found for slug: {slug}")
@@ -35,38 +30,35 @@ def get_study_plan_problems(slug: str) -> List[Dict[str, Any]]:
     return problems
 
 
-def get_random_study_plan_problem(slug: str) -> Optional[Dict[str, Any]]:
+def get_random_study_plan_problems(
+    slug: str, count: int = 1, solved_mode: str = "deprioritize"
+) -> List[Dict[str, Any]]:
     """
-    Get a random problem from a specific study plan.
+    Get random problems from a specific study plan, in the order of the plan.
+    Their details are fetched once they are served (see `prefetch_problems`).
     :param slug: The slug of the study plan (e.g., "leetcode-75").
-    :return: A random problem dictionary or None if no problems are found.
+    :param count: Number of problems to get.
+    :param solved_mode: How solved problems are handled (see `filter_solved`).
+    :return: A list of problem dictionaries (empty if no problems are found).
     """
-    problems = get_study_plan_problems(slug)
+    problems = filter_solved(get_study_plan_problems(slug), solved_mode)
 
-    if not problems:
-        return None
-
-    random_index = random.randint(0, len(problems) - 1)
-    problem = problems[random_index]
-
-    # Get the problem in the right format
-    return cached_api.fetch_problem(problem["titleSlug"])
+    indices = random.sample(range(len(problems)), min(count, len(problems)))
+    return [problems[index] for index in sorted(indices)]
 
 
 class StudyPlanMode(PracticeMode):
-    def handle(self, args):
+    def select(self, args):
+        log(f"Selected 🎯 Study Plan Mode: {args['plan_name']}", LogLevel.INFO)
         try:
-            log(f"Selected 🎯 Study Plan Mode: {args['plan_name']}", LogLevel.INFO)
-            problem = get_random_study_plan_problem(args["plan_name"])
-            if not problem:
-                log("No problems found for the selected study plan.", LogLevel.ERROR)
-                return
-            difficulty_label = difficulty_map[problem["difficulty"].lower()]
-            url = f"https://leetcode.com/problems/{problem['titleSlug']}"
-            log_problem_details(problem, difficulty_label, url)
-            open_in_browser(url, args["open_in_browser"])
-            create_and_solve_handler(
-                problem["titleSlug"], problem["codeSnippets"], difficulty_label, args
+            problems = get_random_study_plan_problems(
+                args["plan_name"], count=args["count"], solved_mode=args["solved"]
             )
         except Exception as e:
             log(f"Failed to fetch random problem: {str(e)}", LogLevel.ERROR)
+            return []
+
+        if not problems:
+            log("No problems found for the selected study plan.", LogLevel.ERROR)
+            return []
+        return problems
@@ -0,0 +1,56 @@
+import unittest
+from unittest import mock
+
+import modes.AdaptiveMode as adaptive_mode
+from modes.AdaptiveMode import AdaptiveMode
+
+catalog = [{"titleSlug": "two-sum"}, {"titleSlug": "3sum"}]
+
+accepted = [
+    {"event": "verdict", "problem_slug": slug, "verdict": "Accepted"}
+    for slug in ["two-sum", "3sum"]
+]
+
+
+class TestAdaptiveMode(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch("modes.AdaptiveMode.get_cached_api"),
+            mock.patch("modes.AdaptiveMode.get_similarity_index"),
+            mock.patch("modes.AdaptiveMode.build_skill_model"),
+            mock.patch("modes.AdaptiveMode.get_attempt_store"),
+            # Nothing was solved on the account
+            mock.patch(
+                "modes.AdaptiveMode.filter_solved",
+                side_effect=lambda problems, _: problems,
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        store = adaptive_mode.get_attempt_store.return_value
+        store.get_problem_events.return_value = accepted
+        adaptive_mode.get_cached_api.return_value.fetch_problems.return_value = catalog
+
+    def get_excluded(self, solved_mode):
+        with mock.patch(
+            "modes.AdaptiveMode.select_adaptive_problem",
+            return_value={"titleSlug": "two-sum", "successProbability": 0.7},
+        ) as select_adaptive_problem:
+            AdaptiveMode().select({"solved": solved_mode, "target_success": 0.7})
+        return select_adaptive_problem.call_args[1]["exclude"]
+
+    def test_problems_solved_in_squidleet(self):
+        """
+        Problems accepted in the history are left out unless included, and
+        picked among once everything was solved.
+        """
+        self.assertEqual(self.get_excluded("exclude"), {"two-sum", "3sum"})
+        self.assertEqual(self.get_excluded("include"), set())
+        self.assertEqual(self.get_excluded("deprioritize"), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
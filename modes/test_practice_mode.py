@@ -0,0 +1,111 @@
+import threading
+import unittest
+from unittest import mock
+
+from modes.PracticeMode import hydrate_problems, prefetch_problems, record_served
+from utils.logger import log, LogLevel
+
+
+class TestHydrateProblems(unittest.TestCase):
+
+    def test_only_missing_fields_are_filled(self):
+        problems = [
+            {"titleSlug": "two-sum", "difficulty": "EASY", "frequency": 80.0},
+            {"titleSlug": "3sum", "content": "<p>3sum</p>", "codeSnippets": []},
+        ]
+        details = {
+            "two-sum": {
+                "titleSlug": "two-sum",
+                "difficulty": "Easy",
+                "content": "<p>two-sum</p>",
+                "codeSnippets": [{"lang": "Python3", "code": "class Solution:"}],
+            }
+        }
+        cached_api = mock.Mock()
+        cached_api.fetch_problems_details.return_value = details
+
+        with mock.patch("modes.PracticeMode.get_cached_api", return_value=cached_api):
+            hydrated = hydrate_problems(problems)
+
+        cached_api.fetch_problems_details.assert_called_once_with(["two-sum"])
+        self.assertEqual(hydrated[0]["content"], "<p>two-sum</p>")
+        self.assertEqual(hydrated[0]["difficulty"], "EASY")
+        self.assertEqual(hydrated[0]["frequency"], 80.0)
+        self.assertIs(hydrated[1]["codeSnippets"], problems[1]["codeSnippets"])
+
+    def test_complete_problems_are_not_fetched(self):
+        problems = [{"titleSlug": "3sum", "content": "", "codeSnippets": []}]
+        with mock.patch("modes.PracticeMode.get_cached_api") as get_cached_api:
+            self.assertEqual(hydrate_problems(problems), problems)
+        get_cached_api.assert_not_called()
+
+
+class TestRecordServed(unittest.TestCase):
+
+    def test_companies_of_the_problem_are_recorded(self):
+        problem = {"titleSlug": "two-sum", "companies": ["amazon", "google"]}
+        with mock.patch("modes.PracticeMode.record_attempt") as record_attempt:
+            record_served(problem, {"company_name": "amazon,google,meta"})
+
+        self.assertEqual(record_attempt.call_args[1]["company"], "amazon,google")
+
+
+class TestPrefetchProblems(unittest.TestCase):
+
+    def test_next_problems_are_prepared_while_solving(self):
+        """
+        The problems after the current one are prepared before it is solved,
+        and the problems come back in order.
+        """
+        problems = [{"titleSlug": f"problem-{i}"} for i in range(5)]
+        prepared = []
+        all_prepared = threading.Event()
+
+        def prepare_problem(problem):
+            prepared.append(problem["titleSlug"])
+            if len(prepared) == 3:
+                all_prepared.set()
+            return {**problem, "content": "<p>Prepared</p>"}
+
+        with mock.patch(
+            "modes.PracticeMode.prepare_problem", side_effect=prepare_problem
+        ):
+            served = prefetch_problems(problems, count=2)
+            first = next(served)
+            # The current problem and the next two are prepared up front
+            self.assertTrue(all_prepared.wait(5))
+            rest = list(served)
+
+        self.assertEqual(
+            [problem["titleSlug"] for problem in [first, *rest]],
+            [problem["titleSlug"] for problem in problems],
+        )
+        self.assertTrue(all(problem["content"] for problem in rest))
+
+    def test_background_logs_are_printed_with_their_problem(self):
+        """
+        Messages logged while preparing a problem are printed once it comes up,
+        never in the middle of the current one.
+        """
+
+        def prepare_problem(problem):
+            log(f"Preparing {problem['titleSlug']}", LogLevel.INFO)
+            return problem
+
+        problems = [{"titleSlug": f"problem-{i}"} for i in range(3)]
+        with mock.patch(
+            "modes.PracticeMode.prepare_problem", side_effect=prepare_problem
+        ):
+            with mock.patch("builtins.print") as print_mock:
+                served = prefetch_problems(problems, count=2)
+                next(served)
+                printed = [call.args[0] for call in print_mock.call_args_list]
+                list(served)
+                all_printed = [call.args[0] for call in print_mock.call_args_list]
+
+        self.assertEqual(printed, ["Preparing problem-0"])
+        self.assertEqual(all_printed, [f"Preparing problem-{i}" for i in range(3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import time
+import unittest
+from unittest import mock
+
+from services import PracticeModeManager
+
+
+def attempt(slug, at, verdict):
+    return [
+        {"event": "served", "problem_slug": slug, "created_at": at},
+        {
+            "event": "verdict",
+            "problem_slug": slug,
+            "verdict": verdict,
+            "created_at": at,
+        },
+    ]
+
+
+class FakeAttemptStore:
+    def __init__(self, events):
+        self.events = events
+
+    def get_problem_events(self, problem_slug=None):
+        return [
+            event
+            for event in self.events
+            if problem_slug is None or event["problem_slug"] == problem_slug
+        ]
+
+
+class TestReviewMode(unittest.TestCase):
+
+    def test_selections_of_the_daemon_are_reviewed_one_after_another(self):
+        """
+        Problems selected elsewhere (e.g., by the daemon) are rescheduled, and
+        the next due problems reviewed, until none is due.
+        """
+        store = FakeAttemptStore(
+            attempt("two-sum", 0, "Wrong Answer") + attempt("3sum", 1, "Wrong Answer")
+        )
+        solved = []
+
+        def solve_problems(problems, args):
+            slug = problems[0]["titleSlug"]
+            solved.append(slug)
+            store.events += attempt(slug, time.time(), "Accepted")
+
+        patches = [
+            mock.patch("modes.ReviewMode.get_attempt_store", return_value=store),
+            mock.patch("modes.ReviewMode.solve_problems", side_effect=solve_problems),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        with mock.patch("modes.ReviewMode.get_cached_api") as get_cached_api:
+            get_cached_api.return_value.fetch_problem.side_effect = lambda slug: {
+                "titleSlug": slug
+            }
+            PracticeModeManager.solve(
+                {"practice_mode": "review"}, [{"titleSlug": "two-sum"}]
+            )
+
+        self.assertEqual(solved, ["two-sum", "3sum"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import random
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from recommendations.similarity import SimilarityIndex
+from scoring.review import get_attempt_quality, split_attempts
+
+# Elo ratings: a skill rating higher than a problem's by `rating_scale` makes
+# solving it 10 times likelier than failing it
+initial_rating = 1500.0
+rating_scale = 400.0
+k_factor = 32.0
+
+# Success probability aimed at by default: hard enough to learn from, easy
+# enough to keep going
+target_success_rate = 0.7
+
+# Problems closest to the target, among which one is picked at random
+candidate_count = 10
+
+
+def get_problem_ratings(ac_rates: np.ndarray) -> np.ndarray:
+    """
+    Rate problems from their acceptance rates, so that a new player
+    (`initial_rating`) is expected to solve each one as often as it is accepted.
+    :param ac_rates: Acceptance rates in percent (NaN when unknown).
+    :return: Elo rating of each problem.
+    """
+    acceptance = np.clip(np.nan_to_num(ac_rates / 100, nan=0.5), 0.01, 0.99)
+    return initial_rating + rating_scale * np.log10((1 - acceptance) / acceptance)
+
+
+def expected_success(skill_ratings, problem_ratings):
+    return 1 / (1 + 10 ** ((problem_ratings - skill_ratings) / rating_scale))
+
+
+class SkillModel:
+    def __init__(self, index: SimilarityIndex):
+        """
+        Elo rating of the player for each topic tag of a catalog. The skill on
+        a problem is the mean rating of its tags, and each attempt moves the
+        ratings of its tags towards the outcome.
+        :param index: Similarity index of the catalog, whose tag columns are reused.
+        """
+        self.index = index
+        tag_count = len(index.tag_to_column)
+        self.incidence = index.vectors[:, :tag_count] > 0
+        self.tag_counts = self.incidence.sum(axis=1)
+        self.problem_ratings = get_problem_ratings(
+            np.array(
+                [problem.get("acRate") or np.nan for problem in index.problems],
+                dtype=float,
+            )
+        )
+        self.tag_ratings = np.full(tag_count, initial_rating)
+
+    def _describe(self, slug: str, tags: List[str]):
+        row = self.index.slug_to_row.get(slug)
+        if row is not None:
+            return np.flatnonzero(self.incidence[row]), self.problem_ratings[row]
+
+        # Problems outside of the catalog are rated like an average problem
+        columns = [
+            self.index.tag_to_column[tag]
+            for tag in tags
+            if tag in self.index.tag_to_column
+        ]
+        return np.array(columns, dtype=int), initial_rating
+
+    def update(self, slug: str, tags: List[str], outcome: float):
+        """
+        Update the ratings after an attempt.
+        :param slug: Slug of the problem.
+        :param tags: Tag slugs of the problem, used when it is not in the catalog.
+        :param outcome: 1 for a clean solve, 0 for a failure, or in between.
+        """
+        columns, problem_rating = self._describe(slug, tags)
+        if not len(columns):
+            return
+        skill = self.tag_ratings[columns].mean()
+        expected = expected_success(skill, problem_rating)
+        self.tag_ratings[columns] += k_factor * (outcome - expected)
+
+    def success_probabilities(self) -> np.ndarray:
+        """
+        Estimate the probability of solving each problem of the catalog at once.
+        :return: Success probability of each catalog problem.
+        """
+        # Untagged problems get the average skill over all tags
+        average_skill = (
+            self.tag_ratings.mean() if len(self.tag_ratings) else initial_rating
+        )
+        skills = np.divide(
+            self.incidence @ self.tag_ratings,
+            self.tag_counts,
+            out=np.full(len(self.tag_counts), average_skill),
+            where=self.tag_counts > 0,
+        )
+        return expected_success(skills, self.problem_ratings)
+
+
+def get_attempt_outcome(attempt: List[Dict[str, Any]]) -> Optional[float]:
+    """
+    Score an attempt for rating: 1 for a clean solve down to 0 for a failure.
+    :param attempt: Events of the attempt.
+    :return: Outcome from 0 to 1, or None if nothing was submitted.
+    """
+    quality = get_attempt_quality(attempt)
+    if quality is None:
+        return None
+    return min(1.0, max(0.0, (quality - 1) / 4))
+
+
+def build_skill_model(
+    index: SimilarityIndex,
+    events: List[Dict[str, Any]],
+    problem_tags: Dict[str, List[str]],
+) -> SkillModel:
+    """
+    Rate the player by replaying the attempts of the history in order.
+    :param index: Similarity index of the catalog.
+    :param events: Attempt events of all problems, oldest first.
+    :param problem_tags: Tag slugs by problem slug, for problems not in the catalog.
+    :return: SkillModel with the ratings after the last attempt.
+    """
+    events_by_slug = {}
+    for event in events:
+        events_by_slug.setdefault(event["problem_slug"], []).append(event)
+
+    attempts = [
+        (attempt[0]["created_at"], slug, attempt)
+        for slug, problem_events in events_by_slug.items()
+        for attempt in split_attempts(problem_events)
+    ]
+    attempts.sort(key=lambda item: item[0])
+
+    model = SkillModel(index)
+    for _, slug, attempt in attempts:
+        outcome = get_attempt_outcome(attempt)
+        if outcome is not None:
+            model.update(slug, problem_tags.get(slug, []), outcome)
+    return model
+
+
+def select_adaptive_problem(
+    model: SkillModel,
+    target: float = target_success_rate,
+    exclude: Optional[List[str]] = None,
+    rng: Optional[random.Random] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Pick a problem whose success probability is close to the target.
+    :param model: Skill model of the player.
+    :param target: Success probability aimed at, between 0 and 1.
+    :param exclude: Slugs that must not be picked (e.g., solved problems).
+    :param rng: Random number generator picking among the closest problems.
+    :return: Problem dictionary with its `successProbability`, or None if
+             every problem is excluded.
+    """
+    probabilities = model.success_probabilities()
+    distances = np.abs(probabilities - target)
+
+    excluded_rows = [
+        model.index.slug_to_row[slug]
+        for slug in exclude or []
+        if slug in model.index.slug_to_row
+    ]
+    distances[excluded_rows] = np.inf
+
+    count = min(candidate_count, int(np.isfinite(distances).sum()))
+    if count < 1:
+        return None
+
+    candidates = np.argpartition(distances, count - 1)[:count]
+    row = (rng or random).choice(list(candidates))
+    return {
+        **model.index.problems[row],
+        "successProbability": float(probabilities[row]),
+    }
@@ -0,0 +1,152 @@
+import hashlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.constants import difficulty_map
+
+# Relative weight of the difficulty columns compared to a single topic tag
+difficulty_weight = 0.5
+
+difficulty_columns = list(difficulty_map.keys())
+
+# Similarity indexes keyed by catalog version, built once and reused
+_indexes: Dict[str, "SimilarityIndex"] = {}
+
+
+def get_catalog_version(catalog: List[Dict[str, Any]]) -> str:
+    """
+    Compute a version fingerprint for a problem catalog.
+    :param catalog: List of problem dictionaries (as returned by `fetch_problems`).
+    :return: MD5 hash of every problem's slug, difficulty and topic tags.
+    """
+    digest = hashlib.md5()
+    for problem in catalog:
+        tags = ",".join(tag.get("slug", "") for tag in problem.get("topicTags") or [])
+        line = f"{problem.get('titleSlug')}|{problem.get('difficulty')}|{tags}\n"
+        digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SimilarityIndex:
+    def __init__(self, catalog: List[Dict[str, Any]]):
+        """
+        Build a row-normalized problem-by-feature matrix from a problem catalog.
+        Features are one column per topic tag plus one column per difficulty.
+        :param catalog: List of problem dictionaries with `topicTags` and `difficulty`.
+        """
+        self.problems = catalog
+        self.slug_to_row = {
+            problem["titleSlug"]: row for row, problem in enumerate(catalog)
+        }
+
+        tag_slugs = sorted(
+            {
+                tag["slug"]
+                for problem in catalog
+                for tag in problem.get("topicTags") or []
+                if tag.get("slug")
+            }
+        )
+        self.tag_to_column = {slug: column for column, slug in enumerate(tag_slugs)}
+        self.width = len(tag_slugs) + len(difficulty_columns)
+
+        # Collect the non-zero coordinates first and fill the matrix in one go
+        rows, columns, values = [], [], []
+        for row, problem in enumerate(catalog):
+            for column, value in self._features(problem):
+                rows.append(row)
+                columns.append(column)
+                values.append(value)
+
+        matrix = np.zeros((len(catalog), self.width), dtype=np.float32)
+        matrix[rows, columns] = values
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.vectors = matrix / norms
+
+    def _features(self, problem: Dict[str, Any]) -> List[tuple]:
+        """
+        List the (column, value) pairs describing a problem.
+        :param problem: Problem dictionary.
+        :return: Non-zero feature coordinates known to this index.
+        """
+        features = []
+        for tag in problem.get("topicTags") or []:
+            column = self.tag_to_column.get(tag.get("slug"))
+            if column is not None:
+                features.append((column, 1.0))
+
+        difficulty = (problem.get("difficulty") or "").lower()
+        if difficulty in difficulty_columns:
+            column = len(self.tag_to_column) + difficulty_columns.index(difficulty)
+            features.append((column, difficulty_weight))
+
+        return features
+
+    def vectorize(self, problem: Dict[str, Any]) -> np.ndarray:
+        """
+        Build the normalized feature vector of a problem.
+        Problems from the catalog reuse their precomputed row.
+        :param problem: Problem dictionary.
+        :return: Unit-length feature vector (all zeros if nothing is known).
+        """
+        row = self.slug_to_row.get(problem.get("titleSlug"))
+        if row is not None:
+            return self.vectors[row]
+
+        vector = np.zeros(self.width, dtype=np.float32)
+        for column, value in self._features(problem):
+            vector[column] = value
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def most_similar(
+        self,
+        problem: Dict[str, Any],
+        k: int = 3,
+        exclude: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the top-k catalog problems by cosine similarity.
+        :param problem: Problem dictionary to find neighbours for.
+        :param k: Number of problems to return.
+        :param exclude: Slugs that must not be recommended (the problem itself is always excluded).
+        :return: Problem dictionaries ordered by similarity, each with a `similarity` score.
+        """
+        if k < 1 or not self.problems:
+            return []
+
+        scores = self.vectors @ self.vectorize(problem)
+
+        excluded = set(exclude or []) | {problem.get("titleSlug")}
+        excluded_rows = [
+            self.slug_to_row[slug] for slug in excluded if slug in self.slug_to_row
+        ]
+        scores[excluded_rows] = -np.inf
+
+        k = min(k, len(self.problems) - len(excluded_rows))
+        if k < 1:
+            return []
+
+        top_rows = np.argpartition(-scores, k - 1)[:k]
+        top_rows = top_rows[np.argsort(-scores[top_rows], kind="stable")]
+
+        return [
+            {**self.problems[row], "similarity": float(scores[row])} for row in top_rows
+        ]
+
+
+def get_similarity_index(catalog: List[Dict[str, Any]]) -> SimilarityIndex:
+    """
+    Get the similarity index for a catalog, building it only when the catalog changes.
+    :param catalog: List of problem dictionaries.
+    :return: SimilarityIndex for the catalog version.
+    """
+    version = get_catalog_version(catalog)
+    if version not in _indexes:
+        _indexes.clear()  # Only the latest catalog version is worth keeping
+        _indexes[version] = SimilarityIndex(catalog)
+    return _indexes[version]
@@ -0,0 +1,78 @@
+import random
+import unittest
+from unittest import mock
+
+from recommendations.adaptive import build_skill_model, select_adaptive_problem
+from recommendations.similarity import SimilarityIndex
+
+
+def make_problem(slug, ac_rate, tags):
+    return {
+        "titleSlug": slug,
+        "difficulty": "Medium",
+        "acRate": ac_rate,
+        "topicTags": [{"slug": tag} for tag in tags],
+    }
+
+
+def make_attempt(slug, at, verdicts):
+    events = [{"event": "served", "problem_slug": slug, "created_at": at}]
+    events += [
+        {"event": "verdict", "problem_slug": slug, "verdict": verdict, "created_at": at}
+        for verdict in verdicts
+    ]
+    return events
+
+
+class TestAdaptiveSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SimilarityIndex(
+            [
+                make_problem("easy-array", 80, ["array"]),
+                make_problem("hard-array", 20, ["array"]),
+                make_problem("easy-graph", 80, ["graph"]),
+                make_problem("hard-graph", 20, ["graph"]),
+            ]
+        )
+
+    def test_ratings_follow_attempts_per_tag(self):
+        """
+        Solving array problems raises the array rating alone.
+        """
+        events = []
+        for day in range(5):
+            events += make_attempt(f"array-{day}", day, ["Accepted"])
+        events += make_attempt("easy-graph", 10, ["Wrong Answer"])
+
+        model = build_skill_model(
+            self.index, events, {f"array-{day}": ["array"] for day in range(5)}
+        )
+        array, graph = (
+            model.tag_ratings[self.index.tag_to_column[tag]]
+            for tag in ("array", "graph")
+        )
+        self.assertGreater(array, 1500)
+        self.assertLess(graph, 1500)
+
+        probabilities = dict(
+            zip(
+                (problem["titleSlug"] for problem in self.index.problems),
+                model.success_probabilities(),
+            )
+        )
+        self.assertGreater(probabilities["hard-array"], probabilities["hard-graph"])
+
+    def test_selection_is_near_the_target(self):
+        model = build_skill_model(self.index, [], {})
+        with mock.patch("recommendations.adaptive.candidate_count", 1):
+            problem = select_adaptive_problem(
+                model, target=0.8, exclude=["easy-array"], rng=random.Random(0)
+            )
+
+        self.assertEqual(problem["titleSlug"], "easy-graph")
+        self.assertAlmostEqual(problem["successProbability"], 0.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import time
+import unittest
+
+from recommendations.similarity import (
+    SimilarityIndex,
+    get_catalog_version,
+    get_similarity_index,
+)
+
+
+def make_problem(slug, difficulty, tags):
+    return {
+        "title": slug.replace("-", " ").title(),
+        "titleSlug": slug,
+        "difficulty": difficulty,
+        "topicTags": [{"name": tag.title(), "slug": tag} for tag in tags],
+    }
+
+
+class TestSimilarityIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = [
+            make_problem("two-sum", "Easy", ["array", "hash-table"]),
+            make_problem("three-sum", "Medium", ["array", "two-pointers", "sorting"]),
+            make_problem("four-sum", "Medium", ["array", "two-pointers", "sorting"]),
+            make_problem("contains-duplicate", "Easy", ["array", "hash-table"]),
+            make_problem("word-ladder", "Hard", ["breadth-first-search", "string"]),
+        ]
+
+    def test_most_similar_ranks_by_shared_tags(self):
+        """
+        Problems sharing tags and difficulty rank first, and the query is excluded.
+        """
+        index = SimilarityIndex(self.catalog)
+        similar = index.most_similar(self.catalog[1], k=2)
+
+        self.assertEqual(similar[0]["titleSlug"], "four-sum")
+        self.assertAlmostEqual(similar[0]["similarity"], 1.0, places=5)
+        self.assertNotIn("three-sum", [problem["titleSlug"] for problem in similar])
+
+    def test_most_similar_for_problem_outside_catalog(self):
+        """
+        Problems missing from the catalog are vectorized from their tags.
+        """
+        index = SimilarityIndex(self.catalog)
+        problem = make_problem("group-anagrams", "Easy", ["array", "hash-table"])
+        similar = index.most_similar(problem, k=2)
+
+        self.assertEqual(
+            {problem["titleSlug"] for problem in similar},
+            {"two-sum", "contains-duplicate"},
+        )
+
+    def test_most_similar_respects_exclusions_and_k(self):
+        """
+        Excluded slugs are never returned and k is capped by the catalog size.
+        """
+        index = SimilarityIndex(self.catalog)
+        similar = index.most_similar(self.catalog[0], k=10, exclude=["four-sum"])
+
+        slugs = [problem["titleSlug"] for problem in similar]
+        self.assertEqual(len(slugs), 3)
+        self.assertNotIn("four-sum", slugs)
+
+    def test_index_is_reused_per_catalog_version(self):
+        """
+        The index is rebuilt only when the catalog content changes.
+        """
+        first = get_similarity_index(self.catalog)
+        self.assertIs(get_similarity_index(list(self.catalog)), first)
+
+        changed = self.catalog + [make_problem("jump-game", "Medium", ["greedy"])]
+        self.assertNotEqual(
+            get_catalog_version(changed), get_catalog_version(self.catalog)
+        )
+        self.assertIsNot(get_similarity_index(changed), first)
+
+    def test_query_over_large_catalog_is_fast(self):
+        """
+        A top-k query over thousands of problems stays within milliseconds.
+        """
+        tags = [f"tag-{i}" for i in range(70)]
+        difficulties = ["Easy", "Medium", "Hard"]
+        catalog = [
+            make_problem(
+                f"problem-{i}",
+                difficulties[i % 3],
+                [tags[(i * 7 + j) % len(tags)] for j in range(i % 4 + 1)],
+            )
+            for i in range(5000)
+        ]
+        index = SimilarityIndex(catalog)
+
+        start = time.perf_counter()
+        similar = index.most_similar(catalog[42], k=5)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(similar), 5)
+        self.assertLess(elapsed, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
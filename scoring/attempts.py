@@ -0,0 +1,294 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.logger import log, LogLevel
+from utils.storage import get_data_dir
+
+schema = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    problem_slug TEXT,
+    difficulty TEXT,
+    verdict TEXT,
+    company TEXT,
+    details TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS problems (
+    problem_slug TEXT PRIMARY KEY,
+    difficulty TEXT,
+    tags TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value NUMERIC NOT NULL
+);
+"""
+
+# Columns added to the attempts table after it was first released, added to
+# older databases when they are opened
+added_columns = {"company": "TEXT"}
+
+
+class AttemptTransaction:
+    def __init__(self, connection: sqlite3.Connection):
+        """
+        Changes to the attempt store made atomically, see `AttemptStore.transaction`.
+        """
+        self._connection = connection
+
+    def get(self, name: str) -> float:
+        """
+        Get the value of a counter.
+        :param name: Name of the counter (e.g., "score" or "served:easy").
+        :return: Value of the counter, 0 if it was never set.
+        """
+        row = self._connection.execute(
+            "SELECT value FROM counters WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def set(self, name: str, value: float) -> float:
+        self._connection.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+            (name, value),
+        )
+        return value
+
+    def increment(self, name: str, amount: float = 1) -> float:
+        return self.set(name, self.get(name) + amount)
+
+    def append(
+        self,
+        event: str,
+        problem_slug: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        verdict: Optional[str] = None,
+        company: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Append an attempt event and update its counters: the total count of the
+        event, its count per difficulty and its count per topic tag. Verdicts
+        are counted per verdict (e.g., "verdict:Accepted:easy").
+        :param event: Kind of event (e.g., "served", "submitted" or "verdict").
+        :param problem_slug: Slug of the problem.
+        :param difficulty: Difficulty of the problem, remembered from earlier
+                           events of the problem when not given.
+        :param tags: Topic tag slugs of the problem, remembered like the difficulty.
+        :param verdict: Verdict of a submission.
+        :param company: Company the problem was served for (company mode).
+        :param details: Other data of the event, stored as JSON.
+        """
+        difficulty = difficulty.lower() if difficulty else None
+        if problem_slug:
+            difficulty, tags = self._remember_problem(problem_slug, difficulty, tags)
+
+        self._connection.execute(
+            "INSERT INTO attempts "
+            "(event, problem_slug, difficulty, verdict, company, details, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                event,
+                problem_slug,
+                difficulty,
+                verdict,
+                company.lower() if company else None,
+                json.dumps(details) if details is not None else None,
+                time.time(),
+            ),
+        )
+
+        counter = f"{event}:{verdict}" if verdict else event
+        self.increment(counter)
+        if difficulty:
+            self.increment(f"{counter}:{difficulty}")
+        for tag in tags or []:
+            self.increment(f"{counter}:tag:{tag}")
+
+    def _remember_problem(self, problem_slug, difficulty, tags):
+        row = self._connection.execute(
+            "SELECT difficulty, tags FROM problems WHERE problem_slug = ?",
+            (problem_slug,),
+        ).fetchone()
+        if row is not None:
+            difficulty = difficulty or row[0]
+            tags = tags if tags is not None else json.loads(row[1])
+
+        self._connection.execute(
+            "INSERT INTO problems (problem_slug, difficulty, tags) VALUES (?, ?, ?) "
+            "ON CONFLICT (problem_slug) DO UPDATE SET "
+            "difficulty = excluded.difficulty, tags = excluded.tags",
+            (problem_slug, difficulty, json.dumps(tags or [])),
+        )
+        return difficulty, tags
+
+
+class AttemptStore:
+    def __init__(self, db_path: Path):
+        """
+        Append-only log of the problems served, the submissions and their
+        verdicts, stored in SQLite. Counters (score, streak, counts per
+        difficulty and per tag) are updated in the same transaction as each
+        appended event, so reading them takes a single lookup. Transactions
+        take the write lock up front, so concurrent sessions never lose updates.
+        :param db_path: Path of the SQLite database.
+        """
+        self.db_path = db_path
+        # Transactions are managed explicitly, see `transaction`
+        self._connection = sqlite3.connect(
+            str(db_path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(schema)
+        self._migrate()
+        self._lock = threading.RLock()
+
+    def _migrate(self):
+        # Checked again once the database is locked, since sessions may open it at once
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {
+                row[1]
+                for row in self._connection.execute("PRAGMA table_info(attempts)")
+            }
+            for name, column_type in added_columns.items():
+                if name not in columns:
+                    self._connection.execute(
+                        f"ALTER TABLE attempts ADD COLUMN {name} {column_type}"
+                    )
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Read and update counters and append events atomically, e.g.:
+
+            with store.transaction() as transaction:
+                transaction.increment("score", 10)
+
+        :return: Context manager yielding an AttemptTransaction.
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield AttemptTransaction(self._connection)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def record(self, event: str, problem_slug: Optional[str] = None, **kwargs):
+        """
+        Append an attempt event, see `AttemptTransaction.append`.
+        """
+        with self.transaction() as transaction:
+            transaction.append(event, problem_slug, **kwargs)
+
+    def get_counter(self, name: str) -> float:
+        """
+        Get the value of a counter.
+        :param name: Name of the counter.
+        :return: Value of the counter, 0 if it was never set.
+        """
+        with self._lock:
+            return AttemptTransaction(self._connection).get(name)
+
+    def get_counters(self, prefix: str = "") -> Dict[str, float]:
+        """
+        Get the counters whose name starts with a prefix.
+        :param prefix: Prefix of the names (e.g., "served:tag:").
+        :return: Values of the counters by name.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, value FROM counters WHERE substr(name, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+        return dict(rows)
+
+    def get_history(self) -> List[tuple]:
+        """
+        Get every event of the log, oldest first.
+        :return: Tuples of the event, problem slug, difficulty, verdict and
+                 company (empty strings when unknown) and the time of the event.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT event, COALESCE(problem_slug, ''), "
+                "COALESCE(difficulty, ''), COALESCE(verdict, ''), "
+                "COALESCE(company, ''), created_at FROM attempts ORDER BY id"
+            ).fetchall()
+
+    def get_problem_events(
+        self, problem_slug: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the events of the problems, oldest first.
+        :param problem_slug: Problem to get the events of (None for all problems).
+        :return: Dictionaries with the `event`, `problem_slug`, `verdict`,
+                 `details` and `created_at` of each event.
+        """
+        query = (
+            "SELECT event, problem_slug, verdict, details, created_at FROM attempts "
+            "WHERE problem_slug IS NOT NULL"
+        )
+        parameters = ()
+        if problem_slug is not None:
+            query += " AND problem_slug = ?"
+            parameters = (problem_slug,)
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY id", parameters)
+            return [
+                {
+                    "event": event,
+                    "problem_slug": slug,
+                    "verdict": verdict,
+                    "details": json.loads(details) if details else {},
+                    "created_at": created_at,
+                }
+                for event, slug, verdict, details, created_at in rows.fetchall()
+            ]
+
+    def get_problem_tags(self) -> Dict[str, List[str]]:
+        """
+        Get the topic tags of the problems in the log.
+        :return: Tag slugs by problem slug.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT problem_slug, tags FROM problems"
+            ).fetchall()
+        return {problem_slug: json.loads(tags) for problem_slug, tags in rows}
+
+
+@lru_cache(maxsize=None)
+def get_attempt_store() -> AttemptStore:
+    """
+    Get the shared attempt store, stored in the data directory.
+    :return: AttemptStore instance.
+    """
+    return AttemptStore(get_data_dir() / "attempts.db")
+
+
+def record_attempt(event: str, problem_slug: Optional[str] = None, **kwargs):
+    """
+    Append an attempt event to the shared store. Failures are only logged, since
+    they should never interrupt practice.
+    """
+    try:
+        get_attempt_store().record(event, problem_slug, **kwargs)
+    except Exception as e:
+        log(f"Failed to record {event} of {problem_slug}: {str(e)}", LogLevel.ERROR)
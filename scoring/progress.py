@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import log, LogLevel
+from utils.storage import get_data_dir
+
+solved_status = "SOLVED"
+attempted_status = "ATTEMPTED"
+
+# How solved problems are handled when selecting problems
+solved_modes = ["include", "exclude", "deprioritize"]
+
+# Seconds before the progress is synced again from LeetCode
+sync_interval = 600
+
+# Problems fetched per progress page
+sync_page_size = 100
+
+# Shared progress, kept across selections by long-lived processes (e.g., the daemon)
+_progress: Optional["ProgressBitmap"] = None
+_progress_lock = threading.Lock()
+
+
+class ProgressBitmap:
+    def __init__(self, path: Path):
+        """
+        Solved and attempted problems of the account, as two bitmaps indexed by
+        the frontend ID of the problems, so a problem is checked in O(1) and
+        thousands of them fit in a few hundred bytes. They are stored in the data
+        directory and synced incrementally: only problems submitted to since the
+        latest submission already seen are fetched.
+        :param path: Path of the file storing the bitmaps.
+        """
+        self.path = path
+        self.solved = bytearray()
+        self.attempted = bytearray()
+        self.watermark = ""  # `lastSubmittedAt` of the latest submission seen
+        self.synced_at = 0.0
+
+        if path.exists():
+            with open(path, "r") as file:
+                data = json.load(file)
+            self.solved = bytearray.fromhex(data["solved"])
+            self.attempted = bytearray.fromhex(data["attempted"])
+            self.watermark = data["watermark"]
+            self.synced_at = data["synced_at"]
+
+    @staticmethod
+    def _get_bit(bitmap: bytearray, question_id: int) -> bool:
+        byte = question_id >> 3
+        return byte < len(bitmap) and bool(bitmap[byte] & (1 << (question_id & 7)))
+
+    @staticmethod
+    def _set_bit(bitmap: bytearray, question_id: int, value: bool):
+        byte = question_id >> 3
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte + 1 - len(bitmap)))
+        if value:
+            bitmap[byte] |= 1 << (question_id & 7)
+        else:
+            bitmap[byte] &= ~(1 << (question_id & 7)) & 0xFF
+
+    def get_status(self, question_id: Any) -> Optional[str]:
+        """
+        Get the status of a problem.
+        :param question_id: Frontend ID of the problem (e.g., "1" for Two Sum).
+        :return: "SOLVED", "ATTEMPTED", or None if it was never submitted to
+                 or its ID is unknown.
+        """
+        try:
+            question_id = int(question_id)
+        except (TypeError, ValueError):
+            return None
+        if self._get_bit(self.solved, question_id):
+            return solved_status
+        if self._get_bit(self.attempted, question_id):
+            return attempted_status
+        return None
+
+    def set_status(self, question_id: Any, status: Optional[str]):
+        question_id = int(question_id)
+        self._set_bit(self.solved, question_id, status == solved_status)
+        self._set_bit(self.attempted, question_id, status == attempted_status)
+
+    def sync(self, fetch_page: Callable[[int, int], Dict[str, Any]]) -> int:
+        """
+        Fetch the problems submitted to since the last sync.
+        :param fetch_page: Returns a page of progress from a skip and a limit
+                           (see `LeetCodeAPI.fetch_progress_questions`).
+        :return: Number of problems updated.
+        """
+        newest = self.watermark
+        updated = 0
+        skip = 0
+        caught_up = False
+        while not caught_up:
+            page = fetch_page(skip, sync_page_size)
+            questions = page.get("questions") or []
+            for question in questions:
+                submitted_at = question.get("lastSubmittedAt") or ""
+                # Problems are sorted by their latest submission, so the rest is known
+                if self.watermark and submitted_at and submitted_at <= self.watermark:
+                    caught_up = True
+                    break
+                newest = max(newest, submitted_at)
+                # Some problems have no numeric ID, like `get_status` they are unknown
+                try:
+                    question_id = int(question.get("frontendId"))
+                except (TypeError, ValueError):
+                    log(
+                        f"Skipping progress of problem {question.get('frontendId')!r}",
+                        LogLevel.DEBUG,
+                    )
+                    continue
+                self.set_status(question_id, question.get("questionStatus"))
+                updated += 1
+
+            skip += len(questions)
+            if not questions or skip >= page.get("totalNum", 0):
+                break
+
+        self.watermark = newest
+        self.synced_at = time.time()
+        return updated
+
+    def save(self):
+        # Write to a temporary file first so concurrent sessions never read partial JSON
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w") as file:
+            json.dump(
+                {
+                    "solved": self.solved.hex(),
+                    "attempted": self.attempted.hex(),
+                    "watermark": self.watermark,
+                    "synced_at": self.synced_at,
+                },
+                file,
+            )
+        os.replace(temp_path, self.path)
+
+
+def get_progress() -> ProgressBitmap:
+    """
+    Get the shared progress of the account, synced from LeetCode when it is
+    older than `sync_interval` and the session is authenticated.
+    :return: ProgressBitmap instance.
+    """
+    global _progress
+    with _progress_lock:
+        if _progress is None:
+            _progress = ProgressBitmap(get_data_dir() / "progress.json")
+
+        if not os.getenv("LEETCODE_SESSION"):
+            log("Not syncing solved problems without a session.", LogLevel.DEBUG)
+        elif time.time() - _progress.synced_at > sync_interval:
+            from handlers.APIHandler import get_api
+
+            try:
+                updated = _progress.sync(get_api().fetch_progress_questions)
+                _progress.save()
+                log(f"🔄 Synced the status of {updated} problem(s).", LogLevel.DEBUG)
+            except Exception as e:
+                log(f"Failed to sync solved problems: {str(e)}", LogLevel.WARN)
+        return _progress
+
+
+def filter_solved(
+    problems: List[Dict[str, Any]], solved_mode: str = "deprioritize"
+) -> List[Dict[str, Any]]:
+    """
+    Leave out the problems already solved on the account, using the local bitmap
+    rather than a request per problem.
+    :param problems: Problem dictionaries with their `questionFrontendId`.
+    :param solved_mode: "include" to keep solved problems, "exclude" to leave
+                        them out, or "deprioritize" to leave them out unless
+                        every problem was solved.
+    :return: The problems to select from.
+    """
+    if solved_mode == "include" or not problems:
+        return problems
+
+    progress = get_progress()
+    unsolved = [
+        problem
+        for problem in problems
+        if progress.get_status(problem.get("questionFrontendId")) != solved_status
+    ]
+    log(
+        f"Leaving out {len(problems) - len(unsolved)} solved problem(s).",
+        LogLevel.DEBUG,
+    )
+
+    if solved_mode == "deprioritize" and not unsolved:
+        log("Every problem was solved already, picking among them.", LogLevel.INFO)
+        return problems
+    return unsolved
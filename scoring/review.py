@@ -0,0 +1,148 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.indexed_heap import IndexedHeap
+
+day = 24 * 3600
+
+# SM-2 ease factors: intervals grow by the ease, which drops with poor recalls
+initial_ease = 2.5
+min_ease = 1.3
+
+# Qualities of a recall, from 0 to 5, below which the problem is relearned
+passing_quality = 3
+
+
+def split_attempts(events: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Split the events of a problem into attempts, each one starting when the
+    problem is served.
+    :param events: Events of a single problem, oldest first.
+    :return: Events of each attempt.
+    """
+    attempts = []
+    for event in events:
+        if event["event"] == "served" or not attempts:
+            attempts.append([])
+        attempts[-1].append(event)
+    return attempts
+
+
+def get_attempt_quality(attempt: List[Dict[str, Any]]) -> Optional[int]:
+    """
+    Grade an attempt like an SM-2 recall: 5 when the first submission is
+    accepted, one less for each of the first two rejected submissions, at most
+    3 when accepted late, and 1 when never accepted.
+    :param attempt: Events of the attempt.
+    :return: Quality from 0 to 5, or None if nothing was submitted.
+    """
+    verdicts = [event["verdict"] for event in attempt if event["event"] == "verdict"]
+    scores = [event["details"] for event in attempt if event["event"] == "scored"]
+    if not verdicts and not scores:
+        return None
+
+    if "Accepted" in verdicts:
+        rejected = verdicts.index("Accepted")
+    elif any(not score.get("expired") for score in scores):
+        # Solved with a verdict reused from the cache, which older versions did
+        # not record as a verdict
+        rejected = len(verdicts)
+    else:
+        return 1
+
+    quality = 5 - min(rejected, 2)
+    if any(not score.get("completed_in_time", True) for score in scores):
+        quality = min(quality, passing_quality)
+    return quality
+
+
+def schedule_review(
+    state: Optional[Dict[str, float]], quality: int, reviewed_at: float
+) -> Dict[str, float]:
+    """
+    Schedule the next review of a problem with SM-2.
+    :param state: Review state of the problem (None if it was never reviewed).
+    :param quality: Quality of the attempt, from 0 to 5.
+    :param reviewed_at: Time of the attempt.
+    :return: New review state, with the `repetitions`, `interval` (days),
+             `ease` and `due_at` time of the problem.
+    """
+    state = state or {"repetitions": 0, "interval": 0, "ease": initial_ease}
+    repetitions, interval, ease = state["repetitions"], state["interval"], state["ease"]
+
+    if quality >= passing_quality:
+        if repetitions == 0:
+            interval = 1
+        elif repetitions == 1:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+        repetitions += 1
+    else:
+        # Failed problems are relearned from the start, and come back first
+        repetitions, interval = 0, 1
+
+    ease = max(min_ease, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return {
+        "repetitions": repetitions,
+        "interval": interval,
+        "ease": ease,
+        "due_at": reviewed_at + interval * day,
+    }
+
+
+class ReviewScheduler:
+    def __init__(self, events: List[Dict[str, Any]]):
+        """
+        Spaced repetition of the problems attempted so far, scheduled with SM-2
+        from their attempts. Due dates are kept in an indexed min-heap, so the
+        next due problem is found in O(1), popped in O(log n) and rescheduled
+        in O(log n) after each attempt.
+        :param events: Attempt events of all problems, oldest first
+                       (see `AttemptStore.get_problem_events`).
+        """
+        events_by_slug = {}
+        for event in events:
+            events_by_slug.setdefault(event["problem_slug"], []).append(event)
+
+        self.states: Dict[str, Dict[str, float]] = {}
+        for slug, problem_events in events_by_slug.items():
+            for attempt in split_attempts(problem_events):
+                self._review(slug, attempt)
+
+        self.heap = IndexedHeap(
+            (slug, (state["due_at"], slug)) for slug, state in self.states.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def _review(self, slug: str, attempt: List[Dict[str, Any]]) -> bool:
+        quality = get_attempt_quality(attempt)
+        if quality is None:
+            return False
+        self.states[slug] = schedule_review(
+            self.states.get(slug), quality, attempt[-1]["created_at"]
+        )
+        return True
+
+    def next_due(self) -> Optional[Tuple[str, float]]:
+        """
+        Get the problem due the soonest.
+        :return: Tuple of its slug and due time, or None if nothing is tracked.
+        """
+        if not self.heap:
+            return None
+        slug, (due_at, _) = self.heap.peek()
+        return slug, due_at
+
+    def review(self, slug: str, attempt: List[Dict[str, Any]]) -> bool:
+        """
+        Reschedule a problem after an attempt.
+        :param slug: Slug of the problem.
+        :param attempt: Events of the attempt.
+        :return: True if the problem was rescheduled, False if nothing was submitted.
+        """
+        if not self._review(slug, attempt):
+            return False
+        self.heap.push(slug, (self.states[slug]["due_at"], slug))
+        return True
@@ -1,78 +1,89 @@
-import os
-import json
+from scoring.attempts import get_attempt_store
 from utils.logger import log, LogLevel
 
-problem_count_file_path = "/tmp/squidleet-problem-count.json"
 default_problem_count = {"easy": 0, "medium": 0, "hard": 0}
-
-score = 0
-streak = 0
+base_points = {"easy": 10, "medium": 20, "hard": 30}
 
 
 def load_problem_count():
     try:
-        if not os.path.exists(problem_count_file_path):
-            with open(problem_count_file_path, "w") as file:
-                json.dump(default_problem_count, file, indent=2)
-            return default_problem_count
-
-        with open(problem_count_file_path, "r") as file:
-            return json.load(file)
+        counters = get_attempt_store().get_counters("available:")
+        return {
+            difficulty: counters.get(f"available:{difficulty}", count)
+            for difficulty, count in default_problem_count.items()
+        }
     except Exception as e:
         log(f"Failed to load problem count: {str(e)}", LogLevel.ERROR)
-        return default_problem_count
+        return dict(default_problem_count)
 
 
 def update_problem_count(difficulty, count):
-    try:
-        problem_count = load_problem_count()
+    if difficulty not in default_problem_count:
+        log(f"Invalid difficulty: {difficulty}", LogLevel.WARN)
+        return
 
-        if difficulty not in problem_count:
-            log(f"Invalid difficulty: {difficulty}", LogLevel.WARN)
-            return
+    if count < 0:
+        log(f"Problem count cannot be negative for '{difficulty}'.", LogLevel.WARN)
+        return
 
-        if count < 0:
-            log(f"Problem count cannot be negative for '{difficulty}'.", LogLevel.WARN)
-            return
-
-        problem_count[difficulty] = count
-
-        with open(problem_count_file_path, "w") as file:
-            json.dump(problem_count, file, indent=2)
+    try:
+        with get_attempt_store().transaction() as transaction:
+            transaction.set(f"available:{difficulty}", count)
 
         log(f"Problem count updated: {difficulty} = {count}", LogLevel.INFO)
     except Exception as e:
         log(f"Failed to update problem count: {str(e)}", LogLevel.ERROR)
 
 
-def update_score(difficulty, completed_in_time):
-    global score, streak
-    base_points = {"easy": 10, "medium": 20, "hard": 30}
+def get_score():
+    """
+    Get the total score and the current streak, kept across sessions.
+    :return: Tuple of the score and the streak.
+    """
+    store = get_attempt_store()
+    return store.get_counter("score"), store.get_counter("streak")
+
+
+def update_score(difficulty, completed_in_time, problem_slug=None, solved=True):
+    """
+    Score a problem and update the streak.
+    :param difficulty: Difficulty of the problem ("easy", "medium" or "hard").
+    :param completed_in_time: Whether the problem was solved within the time limit,
+                              which keeps the streak going.
+    :param problem_slug: Slug of the problem, recorded with the score.
+    :param solved: False when the time ran out before the problem was solved,
+                   which earns no points and leaves the available count as is.
+    """
+    completed_in_time = completed_in_time and solved
+    if difficulty not in base_points:
+        log(f"Invalid difficulty: {difficulty}", LogLevel.WARN)
+        return
 
     try:
-        problem_count = load_problem_count()
-
-        if difficulty not in problem_count:
-            log(f"Invalid difficulty: {difficulty}", LogLevel.WARN)
-            return
-
-        current_count = problem_count[difficulty]
-
-        if current_count <= 0:
-            log(
-                f"No more problems available for difficulty '{difficulty}'.",
-                LogLevel.WARN,
+        # The streak is read and updated in one transaction, so concurrent
+        # sessions never score from the same streak
+        with get_attempt_store().transaction() as transaction:
+            streak = transaction.get("streak")
+            current_count = transaction.get(f"available:{difficulty}")
+
+            # Problems get rarer as the available ones run out, when they are counted
+            rarity_factor = 50 / current_count if current_count > 0 else 1
+            streak_multiplier = 1 + streak * 0.1
+            points = round(base_points[difficulty] * rarity_factor * streak_multiplier)
+            if not solved:
+                points = 0
+
+            score = transaction.increment("score", points)
+            streak = transaction.set("streak", streak + 1 if completed_in_time else 0)
+            if solved and current_count > 0:
+                transaction.increment(f"available:{difficulty}", -1)
+
+            details = {"points": points, "completed_in_time": completed_in_time}
+            if not solved:
+                details["expired"] = True
+            transaction.append(
+                "scored", problem_slug, difficulty=difficulty, details=details
             )
-            return
-
-        rarity_factor = 50 / current_count if current_count else 1
-        streak_multiplier = 1 + streak * 0.1
-        points = round(base_points[difficulty] * rarity_factor * streak_multiplier)
-
-        score += points
-        streak = streak + 1 if completed_in_time else 0
-
-        update_problem_count(difficulty, current_count - 1)
 
         log(
             f"🏆 Score: {score}, 🔥 Streak: {streak} (+{points} points), ✨ Difficulty: {difficulty}",
@@ -0,0 +1,296 @@
+import time
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from api.filters import get_tag_slug
+from scoring.attempts import AttemptStore, get_attempt_store
+from utils.constants import difficulty_map
+from utils.logger import log, LogLevel
+from utils.timer import format_duration
+
+# Percentiles of the solve times shown in the report
+solve_time_percentiles = [50, 90]
+
+# Trends are shown per week, over the latest weeks
+trend_period = 7 * 24 * 3600
+trend_periods = 8
+
+# Tags and companies with the most submissions shown in the report
+max_group_rows = 10
+
+history_columns = ["event", "slug", "difficulty", "verdict", "company", "time"]
+
+
+def load_history(store: AttemptStore) -> Dict[str, np.ndarray]:
+    """
+    Load the attempt log as one array per column.
+    :param store: Attempt store to read.
+    :return: Arrays of the `event`, `slug`, `difficulty`, `verdict`, `company`
+             and `time` of every event, oldest first.
+    """
+    rows = store.get_history()
+    if not rows:
+        return {
+            column: np.array([], dtype=float if column == "time" else str)
+            for column in history_columns
+        }
+
+    columns = list(zip(*rows))
+    history = {
+        column: np.array(values, dtype=str)
+        for column, values in zip(history_columns[:-1], columns)
+    }
+    history["time"] = np.array(columns[-1], dtype=float)
+    return history
+
+
+def get_tag_names(topic_tags) -> Dict[str, str]:
+    """
+    Map topic tag slugs to their names.
+    :param topic_tags: Tag names, as returned by `get_topic_tags`.
+    :return: Tag names by slug (e.g., "hash-table" to "Hash Table").
+    """
+    return {get_tag_slug(name): name for name in topic_tags}
+
+
+def _latest_serving(slug_codes, times, served) -> np.ndarray:
+    """
+    Find when the problem of each event was last served, which starts the
+    attempt the event belongs to.
+    :return: Index of the serving event of each event, -1 if there is none.
+    """
+    served_indexes = np.flatnonzero(served)
+    if not len(served_indexes):
+        return np.full(len(times), -1)
+
+    # Sorting by problem then time lets a single search find the latest serving
+    span = times.max() - times.min() + 1
+    keys = slug_codes * span + (times - times.min())
+    order = np.argsort(keys[served_indexes], kind="stable")
+    positions = np.searchsorted(keys[served_indexes][order], keys, side="right") - 1
+
+    sessions = np.where(positions >= 0, served_indexes[order][positions], -1)
+    same_problem = slug_codes[sessions] == slug_codes
+    return np.where((positions >= 0) & same_problem, sessions, -1)
+
+
+def _summarize(
+    groups: np.ndarray,
+    labels: List[str],
+    served: np.ndarray,
+    submitted: np.ndarray,
+    accepted: np.ndarray,
+    solved: np.ndarray,
+    solve_times: np.ndarray,
+) -> List[Dict[str, Any]]:
+    """
+    Compute the statistics of groups of events at once.
+    :param groups: Boolean matrix of the groups (columns) of each event (rows).
+    :param labels: Label of each group.
+    :param served: Mask of the events serving a problem.
+    :param submitted: Mask of the verdicts.
+    :param accepted: Mask of the accepted verdicts.
+    :param solved: Mask of the first accepted verdict of each attempt.
+    :param solve_times: Seconds from serving to acceptance of each solved event.
+    :return: Statistics of each group that has events.
+    """
+    served_counts = groups[served].sum(axis=0)
+    submitted_counts = groups[submitted].sum(axis=0)
+    accepted_counts = groups[accepted].sum(axis=0)
+
+    # Times outside of a group are NaN, so all groups are handled in one call
+    group_times = np.where(groups[solved], solve_times[solved, None], np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # Groups never solved
+        percentiles = np.nanpercentile(
+            group_times, solve_time_percentiles, axis=0
+        ).reshape(len(solve_time_percentiles), len(labels))
+        acceptance = accepted_counts / submitted_counts
+
+    return [
+        {
+            "label": label,
+            "served": int(served_counts[column]),
+            "submissions": int(submitted_counts[column]),
+            "accepted": int(accepted_counts[column]),
+            "acceptance": float(acceptance[column]),
+            "solve_times": [float(value) for value in percentiles[:, column]],
+        }
+        for column, label in enumerate(labels)
+        if served_counts[column] or submitted_counts[column]
+    ]
+
+
+def _one_hot(codes: np.ndarray, width: int) -> np.ndarray:
+    groups = np.zeros((len(codes), width), dtype=bool)
+    valid = codes >= 0
+    groups[np.flatnonzero(valid), codes[valid]] = True
+    return groups
+
+
+def _top_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = sorted(rows, key=lambda row: (-row["submissions"], -row["served"]))
+    return rows[:max_group_rows]
+
+
+def compute_stats(
+    history: Dict[str, np.ndarray],
+    problem_tags: Dict[str, List[str]],
+    tag_names: Optional[Dict[str, str]] = None,
+    now: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Compute the practice statistics from the attempt history.
+    :param history: Columns of the attempt log, see `load_history`.
+    :param problem_tags: Tag slugs by problem slug.
+    :param tag_names: Tag names by slug, shown instead of the slugs.
+    :param now: Time the trends end at (defaults to the current time).
+    :return: Report with the `total` statistics and the statistics by
+             `difficulty`, `tag`, `company` and `trend` (week).
+    """
+    tag_names = tag_names or {}
+    now = time.time() if now is None else now
+    times = history["time"]
+    if not len(times):
+        return {
+            "total": None,
+            "difficulty": [],
+            "tag": [],
+            "company": [],
+            "trend": [],
+        }
+
+    slugs, slug_codes = np.unique(history["slug"], return_inverse=True)
+    served = history["event"] == "served"
+    submitted = history["event"] == "verdict"
+    accepted = submitted & (history["verdict"] == "Accepted")
+
+    # An attempt is solved by its first accepted verdict
+    sessions = _latest_serving(slug_codes, times, served)
+    solved = np.zeros(len(times), dtype=bool)
+    attempt_acceptances = np.flatnonzero(accepted & (sessions >= 0))
+    _, first = np.unique(sessions[attempt_acceptances], return_index=True)
+    solved[attempt_acceptances[first]] = True
+    solve_times = np.where(solved, times - times[sessions], np.nan)
+
+    def summarize(groups, labels):
+        return _summarize(
+            groups, labels, served, submitted, accepted, solved, solve_times
+        )
+
+    difficulties = list(difficulty_map.keys())
+    difficulty_codes = np.full(len(times), -1)
+    for code, difficulty in enumerate(difficulties):
+        difficulty_codes[history["difficulty"] == difficulty] = code
+    by_difficulty = summarize(
+        _one_hot(difficulty_codes, len(difficulties)),
+        [difficulty_map[difficulty] for difficulty in difficulties],
+    )
+
+    tags = sorted({tag for slug in slugs for tag in problem_tags.get(slug, [])})
+    tag_columns = {tag: column for column, tag in enumerate(tags)}
+    incidence = np.zeros((len(slugs), len(tags)), dtype=bool)
+    for row, slug in enumerate(slugs):
+        incidence[row, [tag_columns[tag] for tag in problem_tags.get(slug, [])]] = True
+    by_tag = summarize(incidence[slug_codes], [tag_names.get(tag, tag) for tag in tags])
+
+    # Companies are known from the serving of each attempt, as a comma-separated
+    # list when a problem was asked at several of the companies practiced for
+    session_companies = np.where(sessions >= 0, history["company"][sessions], "")
+    company_lists, company_list_codes = np.unique(
+        session_companies, return_inverse=True
+    )
+    company_lists = [
+        [company for company in company_list.split(",") if company]
+        for company_list in company_lists
+    ]
+    companies = sorted({company for names in company_lists for company in names})
+    company_columns = {company: column for column, company in enumerate(companies)}
+    company_incidence = np.zeros((len(company_lists), len(companies)), dtype=bool)
+    for row, names in enumerate(company_lists):
+        company_incidence[row, [company_columns[company] for company in names]] = True
+    by_company = summarize(
+        company_incidence[company_list_codes],
+        [company.capitalize() for company in companies],
+    )
+
+    ages = np.floor((now - times) / trend_period).astype(int)
+    recent = (ages >= 0) & (ages < trend_periods)
+    periods = np.where(recent, trend_periods - 1 - ages, -1)
+    trend = summarize(
+        _one_hot(periods, trend_periods),
+        [
+            time.strftime(
+                "%Y-%m-%d",
+                time.localtime(now - (trend_periods - period) * trend_period),
+            )
+            for period in range(trend_periods)
+        ],
+    )
+
+    total = summarize(np.ones((len(times), 1), dtype=bool), ["Total"])
+    return {
+        "total": total[0] if total else None,
+        "difficulty": by_difficulty,
+        "tag": _top_rows(by_tag),
+        "company": _top_rows(by_company),
+        "trend": trend,
+    }
+
+
+def _format_row(row: Dict[str, Any]) -> str:
+    text = f"{row['label']}: {row['served']} served"
+    if row["submissions"]:
+        text += (
+            f", {row['accepted']}/{row['submissions']} submissions accepted "
+            f"({row['acceptance']:.0%})"
+        )
+    solve_times = [
+        f"p{percentile} {format_duration(value)}"
+        for percentile, value in zip(solve_time_percentiles, row["solve_times"])
+        if not np.isnan(value)
+    ]
+    if solve_times:
+        text += f", solved in {' / '.join(solve_times)}"
+    return text
+
+
+def log_stats(report: Dict[str, Any], score: float = 0, streak: float = 0):
+    if report["total"] is None:
+        log("📊 No attempts recorded yet. Solve a few problems first!", LogLevel.INFO)
+        return
+
+    log(f"📊 {_format_row(report['total'])}", LogLevel.INFO)
+    log(f"🏆 Score: {score}, 🔥 Streak: {streak}", LogLevel.INFO)
+
+    for key, title in [
+        ("difficulty", "✨ By difficulty"),
+        ("tag", "🏷️ By tag"),
+        ("company", "🏢 By company"),
+        ("trend", "📈 By week"),
+    ]:
+        if not report[key]:
+            continue
+        log(f"{title}:", LogLevel.INFO)
+        for row in report[key]:
+            log(f"  • {_format_row(row)}", LogLevel.INFO)
+
+
+def show_stats():
+    """
+    Log the practice statistics computed from the recorded attempts.
+    """
+    store = get_attempt_store()
+
+    try:
+        from handlers.CacheHandler import get_cached_api
+
+        tag_names = get_tag_names(get_cached_api().get_topic_tags())
+    except Exception as e:
+        log(f"Failed to fetch topic tags, showing slugs: {str(e)}", LogLevel.DEBUG)
+        tag_names = {}
+
+    report = compute_stats(load_history(store), store.get_problem_tags(), tag_names)
+    log_stats(report, store.get_counter("score"), store.get_counter("streak"))
@@ -0,0 +1,110 @@
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scoring.attempts import AttemptStore
+from scoring.score import get_score, update_problem_count, update_score
+
+
+class TestAttemptStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "attempts.db"
+        self.store = AttemptStore(self.db_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_counters_are_updated_with_each_event(self):
+        """
+        Later events of a problem are counted under the tags it was served with.
+        """
+        self.store.record(
+            "served", "two-sum", difficulty="Easy", tags=["array", "hash-table"]
+        )
+        self.store.record("verdict", "two-sum", verdict="Wrong Answer")
+        self.store.record("verdict", "two-sum", verdict="Accepted")
+
+        self.assertEqual(self.store.get_counter("served:easy"), 1)
+        self.assertEqual(self.store.get_counter("verdict:Accepted:easy"), 1)
+        self.assertEqual(
+            self.store.get_counters("verdict:Wrong Answer:tag:"),
+            {
+                "verdict:Wrong Answer:tag:array": 1,
+                "verdict:Wrong Answer:tag:hash-table": 1,
+            },
+        )
+
+    def test_concurrent_sessions_lose_no_updates(self):
+        """
+        Sessions with their own connection to the same database score atomically.
+        """
+        stores = {}
+
+        def solve():
+            stores[threading.get_ident()] = AttemptStore(self.db_path)
+            for _ in range(25):
+                update_score("easy", completed_in_time=True)
+
+        threads = [threading.Thread(target=solve) for _ in range(4)]
+        with mock.patch(
+            "scoring.score.get_attempt_store",
+            side_effect=lambda: stores.get(threading.get_ident(), self.store),
+        ):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            score, streak = get_score()
+        self.assertEqual(streak, 100)
+        # Each problem is worth 10 points, plus 1 per problem of streak before it
+        self.assertEqual(score, sum(round(10 * (1 + i * 0.1)) for i in range(100)))
+        self.assertEqual(self.store.get_counter("scored:easy"), 100)
+
+    def test_expired_problems_earn_no_points(self):
+        """
+        Problems not solved in time reset the streak without scoring.
+        """
+        with mock.patch("scoring.score.get_attempt_store", return_value=self.store):
+            update_problem_count("easy", 50)
+            update_score("easy", completed_in_time=True, problem_slug="two-sum")
+            update_score(
+                "easy", completed_in_time=False, problem_slug="3sum", solved=False
+            )
+            score, streak = get_score()
+
+        self.assertEqual((score, streak), (10, 0))
+        self.assertEqual(self.store.get_counter("available:easy"), 49)
+        events = self.store.get_problem_events("3sum")
+        self.assertEqual(
+            events[-1]["details"],
+            {"points": 0, "completed_in_time": False, "expired": True},
+        )
+
+    def test_databases_of_older_versions_are_migrated(self):
+        """
+        Attempt logs created before the company column existed keep working.
+        """
+        db_path = Path(self.temp_dir.name) / "old-attempts.db"
+        connection = sqlite3.connect(str(db_path))
+        connection.execute(
+            "CREATE TABLE attempts (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "event TEXT NOT NULL, problem_slug TEXT, difficulty TEXT, "
+            "verdict TEXT, details TEXT, created_at REAL NOT NULL)"
+        )
+        connection.commit()
+        connection.close()
+
+        store = AttemptStore(db_path)
+        store.record("served", "two-sum", difficulty="Easy", company="Google")
+        self.assertEqual(store.get_history()[0][4], "google")
+        # Opening a migrated database again changes nothing
+        AttemptStore(db_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
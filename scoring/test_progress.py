@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scoring.progress import ProgressBitmap, filter_solved
+
+
+def make_question(question_id, submitted_at, status):
+    return {
+        "frontendId": str(question_id),
+        "lastSubmittedAt": submitted_at,
+        "questionStatus": status,
+    }
+
+
+class TestProgressBitmap(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "progress.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_sync_only_fetches_new_submissions(self):
+        """
+        Problems are fetched newest first until the last submission already seen.
+        """
+        questions = [
+            make_question(15, "2024-03-01T00:00:00", "ATTEMPTED"),
+            make_question(1, "2024-02-01T00:00:00", "SOLVED"),
+        ]
+        pages = []
+
+        def fetch_page(skip, limit):
+            pages.append(skip)
+            return {"totalNum": len(questions), "questions": questions[skip:][:1]}
+
+        with mock.patch("scoring.progress.sync_page_size", 1):
+            progress = ProgressBitmap(self.path)
+            self.assertEqual(progress.sync(fetch_page), 2)
+            progress.save()
+
+            questions.insert(0, make_question(15, "2024-04-01T00:00:00", "SOLVED"))
+            progress = ProgressBitmap(self.path)
+            pages.clear()
+            self.assertEqual(progress.sync(fetch_page), 1)
+
+        self.assertEqual(pages, [0, 1])
+        self.assertEqual(progress.get_status("15"), "SOLVED")
+        self.assertEqual(progress.get_status(1), "SOLVED")
+        self.assertIsNone(progress.get_status(2))
+        self.assertIsNone(progress.get_status(None))
+
+    def test_problems_without_numeric_ids_are_skipped(self):
+        questions = [
+            make_question("LCP 01", "2024-03-01T00:00:00", "SOLVED"),
+            make_question(1, "2024-02-01T00:00:00", "SOLVED"),
+        ]
+        progress = ProgressBitmap(self.path)
+
+        self.assertEqual(
+            progress.sync(lambda skip, limit: {"totalNum": 2, "questions": questions}),
+            1,
+        )
+        self.assertEqual(progress.get_status(1), "SOLVED")
+        self.assertEqual(progress.watermark, "2024-03-01T00:00:00")
+
+    def test_filter_solved(self):
+        progress = ProgressBitmap(self.path)
+        progress.set_status(1, "SOLVED")
+        progress.set_status(2, "ATTEMPTED")
+        problems = [{"questionFrontendId": str(i)} for i in (1, 2, 3)]
+
+        with mock.patch("scoring.progress.get_progress", return_value=progress):
+            self.assertEqual(filter_solved(problems, "exclude"), problems[1:])
+            self.assertEqual(filter_solved(problems[:1], "exclude"), [])
+            self.assertEqual(filter_solved(problems[:1], "deprioritize"), problems[:1])
+            self.assertEqual(filter_solved(problems, "include"), problems)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from scoring.review import ReviewScheduler, day, get_attempt_quality
+
+
+def attempt(slug, at, verdicts, completed_in_time=True):
+    events = [{"event": "served", "problem_slug": slug, "created_at": at}]
+    for verdict in verdicts:
+        events.append(
+            {
+                "event": "verdict",
+                "problem_slug": slug,
+                "verdict": verdict,
+                "created_at": at,
+            }
+        )
+    if "Accepted" in verdicts:
+        events.append(
+            {
+                "event": "scored",
+                "problem_slug": slug,
+                "details": {"completed_in_time": completed_in_time},
+                "created_at": at,
+            }
+        )
+    return events
+
+
+class TestReviewScheduler(unittest.TestCase):
+
+    def test_failed_problems_come_back_first(self):
+        events = (
+            attempt("two-sum", 0, ["Accepted"])
+            + attempt("lru-cache", 0, ["Wrong Answer", "Time Limit Exceeded"])
+            + attempt("two-sum", 1 * day, ["Accepted"])
+            + attempt("3sum", 0, [])  # Served, but nothing was submitted
+        )
+        scheduler = ReviewScheduler(events)
+
+        self.assertEqual(len(scheduler), 2)
+        self.assertEqual(scheduler.next_due(), ("lru-cache", 1 * day))
+        self.assertEqual(scheduler.states["two-sum"]["due_at"], 7 * day)
+
+    def test_review_reschedules_the_problem(self):
+        scheduler = ReviewScheduler(attempt("two-sum", 0, ["Wrong Answer"]))
+        scheduler.review("two-sum", attempt("two-sum", day, ["Accepted"])[1:])
+
+        self.assertEqual(scheduler.next_due(), ("two-sum", 2 * day))
+        self.assertFalse(scheduler.review("two-sum", []))
+
+    def test_solves_without_recorded_verdicts_are_accepted(self):
+        """
+        Solutions accepted through the verdict cache, recorded without their
+        verdict, are graded like accepted ones.
+        """
+        solved = attempt("two-sum", 0, ["Wrong Answer", "Accepted"])
+        del solved[2]  # The cached "Accepted" verdict
+        expired = attempt("two-sum", 0, ["Wrong Answer"]) + [
+            {
+                "event": "scored",
+                "problem_slug": "two-sum",
+                "details": {"completed_in_time": False, "expired": True},
+                "created_at": 0,
+            }
+        ]
+
+        self.assertEqual(get_attempt_quality(solved), 4)
+        self.assertEqual(get_attempt_quality(expired), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scoring.attempts import AttemptStore
+from scoring.stats import compute_stats, get_tag_names, load_history
+
+
+class TestStats(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = AttemptStore(Path(self.temp_dir.name) / "attempts.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def record(self, at, event, problem_slug, **kwargs):
+        with mock.patch("scoring.attempts.time.time", return_value=at):
+            self.store.record(event, problem_slug, **kwargs)
+
+    def test_report_groups_attempts(self):
+        """
+        Solve times run from serving to the first accepted verdict of each attempt.
+        """
+        day = 24 * 3600
+        self.record(0, "served", "two-sum", difficulty="Easy", tags=["array"])
+        self.record(60, "verdict", "two-sum", verdict="Wrong Answer")
+        self.record(120, "verdict", "two-sum", verdict="Accepted")
+        self.record(180, "verdict", "two-sum", verdict="Accepted")
+        self.record(
+            day, "served", "lru-cache", difficulty="Medium", company="Amazon", tags=[]
+        )
+        self.record(day + 600, "verdict", "lru-cache", verdict="Accepted")
+        # Served for both companies, which asked it
+        self.record(20 * day, "served", "two-sum", company="amazon,google")
+        self.record(20 * day + 30, "verdict", "two-sum", verdict="Accepted")
+
+        report = compute_stats(
+            load_history(self.store),
+            self.store.get_problem_tags(),
+            get_tag_names({"Array"}),
+            now=70 * day,
+        )
+
+        total = report["total"]
+        self.assertEqual((total["served"], total["submissions"]), (3, 5))
+        self.assertEqual(total["accepted"], 4)
+        self.assertEqual(total["solve_times"][0], 120)
+
+        easy, medium = report["difficulty"]
+        self.assertEqual((easy["label"], easy["served"]), ("Easy", 2))
+        self.assertAlmostEqual(easy["acceptance"], 0.75)
+        self.assertEqual(medium["solve_times"], [600, 600])
+
+        (array,) = report["tag"]
+        self.assertEqual((array["label"], array["submissions"]), ("Array", 4))
+
+        amazon, google = report["company"]
+        self.assertEqual((amazon["label"], amazon["served"]), ("Amazon", 2))
+        self.assertEqual(amazon["solve_times"][0], 315)
+        self.assertEqual((google["label"], google["served"]), ("Google", 1))
+
+        # Only the latest attempt falls within the weeks shown
+        self.assertEqual([week["served"] for week in report["trend"]], [1])
+        self.assertEqual(report["trend"][0]["solve_times"][0], 30)
+
+    def test_empty_history(self):
+        report = compute_stats(load_history(self.store), {})
+        self.assertIsNone(report["total"])
+
+
+if __name__ == "__main__":
+    unittest.main()
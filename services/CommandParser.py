@@ -3,11 +3,27 @@ import argparse
 
 def parse():
     parser = argparse.ArgumentParser(description="🦑 SquidLeet CLI Tool")
+    parser.add_argument(
+        "command",
+        type=str,
+        nargs="?",
+        choices=["practice", "daemon", "stats"],
+        help="Run a practice session (default), start the background daemon or show practice stats",
+        default="practice",
+    )
     parser.add_argument("--leetcode-session", type=str, help="LeetCode session token")
     parser.add_argument(
         "--practice-mode",
         type=str,
-        choices=["custom", "random", "study-plan", "daily", "company"],
+        choices=[
+            "custom",
+            "random",
+            "study-plan",
+            "daily",
+            "company",
+            "review",
+            "adaptive",
+        ],
         help="Practice mode",
         default="random",
     )
@@ -32,7 +48,14 @@ def parse():
     parser.add_argument(
         "--company-name",
         type=str,
-        help="Company name for company mode (e.g., 'amazon', 'google')",
+        help="Company name for company mode, or comma-separated names (e.g., 'amazon,google')",
+    )
+    parser.add_argument(
+        "--company-match",
+        type=str,
+        choices=["union", "intersection"],
+        help="Whether company mode serves problems asked at any or all of the companies",
+        default="union",
     )
     parser.add_argument(
         "--tags",
@@ -42,9 +65,50 @@ def parse():
     parser.add_argument(
         "--duration",
         type=str,
-        help="Duration for company mode (e.g., 'thirty-days', 'three-months', 'six-months', 'more-than-six-months', 'all')",
+        help="Duration for company mode, or comma-separated durations (e.g., 'thirty-days', 'three-months', 'six-months', 'more-than-six-months', 'all')",
         default="all",
     )
+    parser.add_argument(
+        "--min-ac-rate",
+        type=float,
+        help="Lowest acceptance rate of the problems in random and company modes, in percent",
+    )
+    parser.add_argument(
+        "--max-ac-rate",
+        type=float,
+        help="Highest acceptance rate of the problems in random and company modes, in percent",
+    )
+    parser.add_argument(
+        "--premium",
+        type=str,
+        choices=["include", "exclude", "only"],
+        help="Whether premium problems are served in random and company modes",
+        default="include",
+    )
+    parser.add_argument(
+        "--search",
+        type=str,
+        help="Keywords the titles of the problems must contain in random and company modes",
+    )
+    parser.add_argument(
+        "--solved",
+        type=str,
+        choices=["include", "exclude", "deprioritize"],
+        help="Whether problems already solved on your account are served: always, never, or only once all others are",
+        default="deprioritize",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        help="Number of problems served one after another in study plan mode",
+        default=1,
+    )
+    parser.add_argument(
+        "--target-success",
+        type=float,
+        help="Chance of solving the problems picked in adaptive mode (between 0 and 1)",
+        default=0.7,
+    )
     parser.add_argument(
         "--language", type=str, help="Programming language to use", default="python3"
     )
@@ -54,9 +118,46 @@ def parse():
     parser.add_argument(
         "--editor", type=str, help="Editor to use for files", default="default"
     )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        help="Seconds a saved file must stay unchanged before it is submitted",
+        default=0.5,
+    )
+    parser.add_argument(
+        "--ignore-comments",
+        action="store_true",
+        help="Ignore comments and whitespace when checking whether code changed",
+    )
+    parser.add_argument(
+        "--no-local-tests",
+        action="store_true",
+        help="Submit without running the examples locally first",
+    )
+    parser.add_argument(
+        "--contest",
+        action="store_true",
+        help="Work on all selected problems at once, submitting each independently",
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Benchmark the solution locally and estimate its complexity before submitting",
+    )
+    parser.add_argument(
+        "--recommendations",
+        type=int,
+        help="Number of similar problems to suggest after solving (0 to disable)",
+        default=3,
+    )
     parser.add_argument(
         "--open-in-browser", action="store_true", help="Open the problem in a browser"
     )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Select problems in this process even if a daemon is running",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
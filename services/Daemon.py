@@ -0,0 +1,187 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+from typing import Any, Dict, Optional
+
+from utils.logger import log, LogLevel
+from utils.storage import get_data_dir
+
+# Selections may hit the network on a cold cache, so the client waits generously
+request_timeout = 60
+
+
+def get_socket_path() -> str:
+    """
+    Get the path of the daemon's socket, in a directory only the current user
+    can access: `$XDG_RUNTIME_DIR`, or `run` in the data directory.
+    :return: Path of the Unix socket.
+    """
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        runtime_dir = get_data_dir() / "run"
+        runtime_dir.mkdir(mode=0o700, exist_ok=True)
+        os.chmod(runtime_dir, 0o700)
+    return os.path.join(runtime_dir, "squidleet.sock")
+
+
+def select_problems(cli_options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect inputs and select problems, capturing everything logged meanwhile.
+    :param cli_options: Parsed CLI options sent by the client.
+    :return: The collected `inputs`, selected `problems` (with their details)
+             and logged `output`, or an `error` message if the selection failed.
+    """
+    from handlers.PracticeHandler import PracticeModeHandler
+    from modes.PracticeMode import hydrate_problems
+    from services import InputsCollector
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            inputs = InputsCollector.collect(cli_options)
+            mode = PracticeModeHandler.get_mode(inputs["practice_mode"])
+            # Details are fetched by the warm daemon rather than the client,
+            # which also tells unknown slugs apart before they are served
+            problems = hydrate_problems(mode.select(inputs))
+    except Exception as e:
+        return {"error": str(e), "output": output.getvalue()}
+
+    return {"inputs": inputs, "problems": problems, "output": output.getvalue()}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if request["action"] == "ping":
+                response = {"pong": True}
+            elif request["action"] == "select":
+                response = select_problems(request["cli_options"])
+            else:
+                raise ValueError(f"Unknown action: {request['action']}")
+        except Exception as e:
+            response = {"error": f"Invalid daemon request: {str(e)}", "output": ""}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def create_server(path: str) -> socketserver.UnixStreamServer:
+    """
+    Create the daemon's Unix socket server, replacing a stale socket file.
+    :param path: Path of the Unix socket.
+    :return: Server ready to serve requests one at a time.
+    """
+    if os.path.exists(path):
+        if _send_request({"action": "ping"}, path, timeout=1) is not None:
+            raise Exception(f"❌ A SquidLeet daemon is already running on {path}")
+        os.remove(path)
+
+    server = socketserver.UnixStreamServer(path, _RequestHandler)
+    os.chmod(path, 0o600)  # Only the current user may talk to the daemon
+    return server
+
+
+def warm_up():
+    """
+    Load the API session and the most used cached data into memory.
+    """
+    from handlers.CacheHandler import get_cached_api
+    from utils.constants import difficulty_map
+
+    cached_api = get_cached_api()
+    warm_ups = {
+        "API session": lambda: cached_api.api,
+        "problem catalog": lambda: cached_api.fetch_problems(
+            limit=1000, difficulties=list(difficulty_map.keys())
+        ),
+        "daily challenge": cached_api.fetch_daily_challenge,
+    }
+    for name, warm_up_func in warm_ups.items():
+        try:
+            warm_up_func()
+            log(f"🔥 Warmed up {name}", LogLevel.DEBUG)
+        except Exception as e:
+            log(f"Failed to warm up {name}: {str(e)}", LogLevel.WARN)
+
+
+def serve(path: Optional[str] = None):
+    """
+    Run the daemon until interrupted.
+    :param path: Path of the Unix socket (see `get_socket_path` by default).
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise Exception("❌ The daemon requires Unix domain sockets.")
+
+    path = path or get_socket_path()
+    warm_up()
+    server = create_server(path)
+    log(f"👂 SquidLeet daemon listening on {path}", LogLevel.INFO)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log("👋 SquidLeet daemon stopped", LogLevel.INFO)
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _send_request(
+    request: Dict[str, Any], path: str, timeout: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Send a request to the daemon and wait for its response.
+    :param request: JSON serializable request with an `action`.
+    :param path: Path of the Unix socket.
+    :param timeout: Seconds to wait for the daemon's response.
+    :return: The daemon's response, or None if no daemon is reachable.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+
+    # Anyone could have created the socket, and the daemon decides which code
+    # is written and run, so only a daemon of the current user is trusted
+    try:
+        owner = os.stat(path).st_uid
+    except OSError:
+        return None
+    if owner != os.getuid():
+        log(f"Ignoring daemon socket {path}, owned by another user", LogLevel.WARN)
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as response:
+                line = response.readline()
+    except OSError as e:
+        log(f"Daemon unavailable, running locally: {str(e)}", LogLevel.DEBUG)
+        return None
+
+    return json.loads(line) if line else None
+
+
+def request_selection(
+    cli_options: Dict[str, Any],
+    path: Optional[str] = None,
+    timeout: float = request_timeout,
+) -> Optional[Dict[str, Any]]:
+    """
+    Ask a running daemon to select problems.
+    :param cli_options: Parsed CLI options.
+    :param path: Path of the Unix socket (see `get_socket_path` by default).
+    :param timeout: Seconds to wait for the daemon's response.
+    :return: The daemon's response, or None if no daemon is reachable.
+    """
+    # The daemon uses the session it was started with
+    options = {k: v for k, v in cli_options.items() if k != "leetcode_session"}
+    return _send_request(
+        {"action": "select", "cli_options": options},
+        path or get_socket_path(),
+        timeout,
+    )
@@ -1,7 +1,10 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from handlers.APIHandler import api
+from api.filters import premium_modes
+from handlers.CacheHandler import get_cached_api
 from handlers.file_handler import available_languages
+from scoring.progress import solved_modes
 
 
 def collect(cli_options):
@@ -21,14 +24,33 @@ def collect(cli_options):
             problems = problems.split(",")
 
     company_name = cli_options.get("company_name", "")
+    company_names = [name.strip() for name in (company_name or "").split(",")]
+    company_match = cli_options.get("company_match", "union")
     tags = cli_options.get("tags", "")
+
+    if tags:
+        tags = [tag.strip() for tag in tags.split(",")]
     duration = cli_options.get("duration", "all")
+    durations = [part.strip() for part in (duration or "all").split(",")]
     log_level = cli_options.get("log_level", "INFO")
     plan_name = cli_options.get("study_plan", "top-interview-150")
     language = cli_options.get("language", "python")
     time_limit = cli_options.get("time_limit", 45)
     editor = cli_options.get("editor", "default")
     open_in_browser = cli_options.get("open_in_browser", False)
+    recommendations = cli_options.get("recommendations", 3)
+    debounce = cli_options.get("debounce", 0.5)
+    ignore_comments = cli_options.get("ignore_comments", False)
+    local_tests = not cli_options.get("no_local_tests", False)
+    bench = cli_options.get("bench", False)
+    contest = cli_options.get("contest", False)
+    target_success = cli_options.get("target_success", 0.7)
+    count = cli_options.get("count", 1)
+    solved = cli_options.get("solved", "deprioritize")
+    min_ac_rate = cli_options.get("min_ac_rate")
+    max_ac_rate = cli_options.get("max_ac_rate")
+    premium = cli_options.get("premium", "include")
+    search = cli_options.get("search")
 
     inputs = {
         "practice_mode": practice_mode,
@@ -36,21 +58,37 @@ def collect(cli_options):
         "plan_name": plan_name,
         "problems": problems,
         "company_name": company_name,
+        "company_names": [name for name in company_names if name],
+        "company_match": company_match,
         "tags": tags,
         "duration": duration,
+        "durations": durations,
         "language": language,
         "time_limit": time_limit,
         "editor": editor,
         "open_in_browser": open_in_browser,
+        "recommendations": recommendations,
+        "debounce": debounce,
+        "ignore_comments": ignore_comments,
+        "local_tests": local_tests,
+        "bench": bench,
+        "contest": contest,
+        "target_success": target_success,
+        "count": count,
+        "solved": solved,
+        "min_ac_rate": min_ac_rate,
+        "max_ac_rate": max_ac_rate,
+        "premium": premium,
+        "search": search,
         "log_level": log_level,
     }
 
-    _validate(inputs)
+    validate(inputs)
 
     return inputs
 
 
-def _validate(inputs):
+def validate(inputs):
     validate_practice_mode(inputs["practice_mode"])
     validate_company_mode(inputs)
     validate_difficulties(inputs)
@@ -59,14 +97,38 @@ def _validate(inputs):
     validate_language(inputs["language"])
     validate_time_limit(inputs["time_limit"])
     validate_editor(inputs["editor"])
+    validate_recommendations(inputs["recommendations"])
+    validate_debounce(inputs["debounce"])
+    validate_target_success(inputs["target_success"])
+    validate_count(inputs["count"])
+    validate_solved(inputs["solved"])
+    validate_problem_filter(inputs)
     validate_log_level(inputs["log_level"])
 
+    # Checks against LeetCode data may need the network on a cold cache, so
+    # they run concurrently rather than one round trip after another
+    remote_checks = [validate_company_name, validate_tags]
+    get_cached_api()  # Create the shared client before the threads race for it
+    with ThreadPoolExecutor(max_workers=len(remote_checks)) as executor:
+        futures = [executor.submit(check, inputs) for check in remote_checks]
+
+    for future in futures:
+        future.result()  # Re-raise validation errors in order
+
 
 def validate_practice_mode(practice_mode):
     if not practice_mode:
         raise ValueError("Practice mode is required.")
 
-    valid_modes = ["company", "random", "custom", "study-plan"]
+    valid_modes = [
+        "company",
+        "random",
+        "custom",
+        "study-plan",
+        "daily",
+        "review",
+        "adaptive",
+    ]
     if practice_mode not in valid_modes:
         raise ValueError(f"Invalid practice mode. Use one of: {', '.join(valid_modes)}")
 
@@ -76,15 +138,13 @@ def validate_company_mode(inputs):
         if os.environ.get("LEETCODE_SESSION") is None:
             raise ValueError("Company mode requires an authenticated session.")
 
-        company_name = inputs.get("company_name")
-        if not company_name:
+        if not inputs.get("company_names"):
             raise ValueError("Company name is required for Company mode.")
 
-        company_names = api.get_company_names()
-        valid_company_names = [company["name"].lower() for company in company_names]
-        if company_name.lower() not in valid_company_names:
+        valid_matches = ["union", "intersection"]
+        if inputs["company_match"] not in valid_matches:
             raise ValueError(
-                f"Invalid company name. Supported companies: {', '.join(valid_company_names)}"
+                f"Invalid company match. Use one of: {', '.join(valid_matches)}"
             )
 
     if inputs["company_name"] and inputs["practice_mode"] != "company":
@@ -93,16 +153,14 @@ def validate_company_mode(inputs):
     if inputs["tags"] and inputs["practice_mode"] != "company":
         raise ValueError("Tags are only allowed in Company mode.")
 
-    if inputs["duration"] and inputs["practice_mode"] != "company":
+    # "all" is the default duration, so it is accepted in every mode
+    if (
+        inputs["duration"]
+        and inputs["duration"] != "all"
+        and inputs["practice_mode"] != "company"
+    ):
         raise ValueError("Duration is only allowed in Company mode.")
 
-    if inputs["tags"]:
-        topic_tags = api.get_topic_tags()
-        valid_tags = [tag.lower() for tag in topic_tags]
-        standardized_tags = [tag.lower() for tag in inputs["tags"]]
-        if any(tag not in valid_tags for tag in standardized_tags):
-            raise ValueError(f"Invalid tags. Supported tags: {', '.join(valid_tags)}")
-
     valid_durations = [
         "thirty-days",
         "three-months",
@@ -110,10 +168,37 @@ def validate_company_mode(inputs):
         "more-than-six-months",
         "all",
     ]
-    if inputs["duration"] and inputs["duration"] not in valid_durations:
-        raise ValueError(
-            f"Invalid duration: {inputs['duration']}. Must be one of {', '.join(valid_durations)}."
-        )
+    for duration in inputs["durations"]:
+        if duration not in valid_durations:
+            raise ValueError(
+                f"Invalid duration: {duration}. Must be one of {', '.join(valid_durations)}."
+            )
+
+
+def validate_company_name(inputs):
+    # Validate the company name against the cached company list
+    if inputs["practice_mode"] != "company":
+        return
+
+    company_names = get_cached_api().get_company_names()
+    valid_company_names = [company["name"].lower() for company in company_names]
+    for company_name in inputs["company_names"]:
+        if company_name.lower() not in valid_company_names:
+            raise ValueError(
+                f"Invalid company name: {company_name}. Supported companies: {', '.join(valid_company_names)}"
+            )
+
+
+def validate_tags(inputs):
+    # Validate the tags against the cached topic tags
+    if not inputs["tags"]:
+        return
+
+    topic_tags = get_cached_api().get_topic_tags()
+    valid_tags = [tag.lower() for tag in topic_tags]
+    standardized_tags = [tag.lower() for tag in inputs["tags"]]
+    if any(tag not in valid_tags for tag in standardized_tags):
+        raise ValueError(f"Invalid tags. Supported tags: {', '.join(valid_tags)}")
 
 
 def validate_difficulties(inputs):
@@ -161,6 +246,64 @@ def validate_editor(editor):
         raise ValueError(f"Invalid editor. Use one of: {', '.join(valid_editors)}")
 
 
+def validate_recommendations(recommendations):
+    # Validate that the number of recommendations is a non-negative integer
+    if not isinstance(recommendations, int) or recommendations < 0:
+        raise ValueError("Recommendations must be a non-negative integer.")
+
+
+def validate_debounce(debounce):
+    # Validate that the debounce window is a non-negative number of seconds
+    if not isinstance(debounce, (int, float)) or debounce < 0:
+        raise ValueError("Debounce must be a non-negative number of seconds.")
+
+
+def validate_target_success(target_success):
+    # Validate that the target success rate is a probability, excluding certainties
+    if not isinstance(target_success, (int, float)) or not 0 < target_success < 1:
+        raise ValueError("Target success rate must be between 0 and 1 (exclusive).")
+
+
+def validate_count(count):
+    # Validate that the number of problems served is a positive integer
+    if not isinstance(count, int) or count < 1:
+        raise ValueError("Count must be a positive integer.")
+
+
+def validate_solved(solved):
+    # Validate how solved problems are handled
+    if solved not in solved_modes:
+        raise ValueError(f"Invalid solved mode. Use one of: {', '.join(solved_modes)}")
+
+
+def validate_problem_filter(inputs):
+    # Validate the filters of problem lists, which only Random and Company modes use
+    filtered = (
+        inputs["min_ac_rate"] is not None
+        or inputs["max_ac_rate"] is not None
+        or inputs["premium"] != "include"
+        or inputs["search"]
+    )
+    if filtered and inputs["practice_mode"] not in ["random", "company"]:
+        raise ValueError(
+            "Acceptance rates, premium and search are only allowed in Random and Company modes."
+        )
+
+    if inputs["premium"] not in premium_modes:
+        raise ValueError(
+            f"Invalid premium mode. Use one of: {', '.join(premium_modes)}"
+        )
+
+    ac_rates = [inputs["min_ac_rate"], inputs["max_ac_rate"]]
+    for ac_rate in ac_rates:
+        if ac_rate is not None and (
+            not isinstance(ac_rate, (int, float)) or not 0 <= ac_rate <= 100
+        ):
+            raise ValueError("Acceptance rates must be between 0 and 100.")
+    if None not in ac_rates and ac_rates[0] > ac_rates[1]:
+        raise ValueError("Minimum acceptance rate exceeds the maximum.")
+
+
 def validate_log_level(log_level):
     # Validate logging levels
     valid_log_levels = ["DEBUG", "INFO", "WARN", "ERROR"]
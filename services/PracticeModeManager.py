@@ -4,3 +4,9 @@ from handlers.PracticeHandler import PracticeModeHandler
 def handle(inputs):
     mode_handler = PracticeModeHandler.get_mode(inputs["practice_mode"])
     mode_handler.handle(inputs)
+
+
+def solve(inputs, problems):
+    # Solve problems that were already selected (e.g., by the daemon)
+    mode_handler = PracticeModeHandler.get_mode(inputs["practice_mode"])
+    mode_handler.solve(problems, inputs)
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from services import Daemon
+
+
+class TestDaemon(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Serve the daemon on a temporary socket in a background thread.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "squidleet.sock")
+        self.server = Daemon.create_server(self.path)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def test_selection_round_trip(self):
+        """
+        The client receives the daemon's selection, without the session token.
+        """
+        selection = {
+            "inputs": {"practice_mode": "custom"},
+            "problems": [{"titleSlug": "two-sum"}],
+            "output": "Selected 🧩 Custom Practice Mode\n",
+        }
+        with mock.patch.object(
+            Daemon, "select_problems", return_value=selection
+        ) as select_problems:
+            start = time.perf_counter()
+            response = Daemon.request_selection(
+                {"practice_mode": "custom", "leetcode_session": "secret"},
+                path=self.path,
+            )
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(response, selection)
+        select_problems.assert_called_once_with({"practice_mode": "custom"})
+        self.assertLess(elapsed, 0.05)
+
+    def test_selection_errors_are_returned(self):
+        """
+        Invalid options are reported back to the client instead of killing the daemon.
+        """
+        response = Daemon.request_selection(
+            {"practice_mode": "unknown"}, path=self.path
+        )
+
+        self.assertIn("Invalid practice mode", response["error"])
+
+    def test_selected_problems_are_hydrated(self):
+        """
+        The daemon fetches the details of the selected problems itself.
+        """
+        details = {"two-sum": {"difficulty": "Easy", "content": "<p>Two Sum</p>"}}
+        with mock.patch("modes.PracticeMode.get_cached_api") as get_cached_api:
+            get_cached_api.return_value.fetch_problems_details.return_value = details
+            response = Daemon.select_problems(
+                {"practice_mode": "custom", "problems": "two-sum,unknown"}
+            )
+
+        self.assertEqual(
+            response["problems"],
+            [
+                {"titleSlug": "two-sum", **details["two-sum"]},
+                {"titleSlug": "unknown"},
+            ],
+        )
+
+    def test_second_daemon_refuses_to_start(self):
+        """
+        A live socket is never replaced by a new daemon.
+        """
+        with self.assertRaises(Exception):
+            Daemon.create_server(self.path)
+
+    def test_sockets_of_other_users_are_ignored(self):
+        """
+        A socket squatted by another user is never talked to.
+        """
+        with mock.patch.object(Daemon.os, "getuid", return_value=os.getuid() + 1):
+            response = Daemon.request_selection(
+                {"practice_mode": "custom"}, path=self.path
+            )
+
+        self.assertIsNone(response)
+
+    def test_socket_is_private(self):
+        with mock.patch.dict(
+            "os.environ",
+            {"XDG_RUNTIME_DIR": "", "SQUIDLEET_DATA_DIR": self.temp_dir.name},
+        ):
+            path = Daemon.get_socket_path()
+
+        self.assertEqual(os.path.dirname(path), os.path.join(self.temp_dir.name, "run"))
+        self.assertEqual(os.stat(os.path.dirname(path)).st_mode & 0o777, 0o700)
+
+    def test_no_daemon_running(self):
+        """
+        Without a daemon the client falls back to local selection.
+        """
+        missing_path = os.path.join(self.temp_dir.name, "missing.sock")
+        self.assertIsNone(Daemon.request_selection({}, path=missing_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+
+from services import InputsCollector
+
+
+class TestRemoteValidation(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.dict("os.environ", {"LEETCODE_SESSION": "session"}),
+            mock.patch("services.InputsCollector.get_cached_api"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        cached_api = InputsCollector.get_cached_api.return_value
+        cached_api.get_company_names.return_value = [{"name": "Google"}]
+        cached_api.get_topic_tags.return_value = {"Array", "Hash Table"}
+        self.cached_api = cached_api
+
+    def collect(self, company_name, tags):
+        return InputsCollector.collect(
+            {"practice_mode": "company", "company_name": company_name, "tags": tags}
+        )
+
+    def test_valid_company_and_tags(self):
+        inputs = self.collect("google", "array,hash table")
+
+        self.assertEqual(inputs["company_names"], ["google"])
+        self.assertEqual(inputs["tags"], ["array", "hash table"])
+
+    def test_errors_of_the_parallel_checks_are_raised(self):
+        with self.assertRaisesRegex(ValueError, "Invalid tags"):
+            self.collect("google", "array,magic")
+        # Checks fail in order, whichever thread finishes first
+        with self.assertRaisesRegex(ValueError, "Invalid company name: meta"):
+            self.collect("meta", "magic")
+
+    def test_failures_to_fetch_are_raised(self):
+        self.cached_api.get_topic_tags.side_effect = ConnectionError("Offline")
+        with self.assertRaisesRegex(ConnectionError, "Offline"):
+            self.collect("google", "array")
+
+
+class TestProblemFilterValidation(unittest.TestCase):
+
+    def collect(self, **cli_options):
+        with mock.patch("services.InputsCollector.get_cached_api"):
+            return InputsCollector.collect(
+                {"practice_mode": "random", "difficulties": "easy", **cli_options}
+            )
+
+    def test_filters_of_random_mode(self):
+        inputs = self.collect(min_ac_rate=30.0, premium="exclude", search="sum")
+
+        self.assertEqual(inputs["min_ac_rate"], 30.0)
+        self.assertEqual(inputs["premium"], "exclude")
+
+    def test_invalid_filters_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "between 0 and 100"):
+            self.collect(max_ac_rate=120.0)
+        with self.assertRaisesRegex(ValueError, "exceeds the maximum"):
+            self.collect(min_ac_rate=60.0, max_ac_rate=40.0)
+        with self.assertRaisesRegex(ValueError, "only allowed in Random and Company"):
+            self.collect(practice_mode="daily", search="sum")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+import html
+import math
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from utils.local_runner import get_meta_data, local_runner_languages, run_job
+from utils.logger import log, LogLevel
+
+# Candidate complexities, from the slowest growing to the fastest
+complexity_models = [
+    ("O(1)", lambda n: 1.0),
+    ("O(log n)", lambda n: math.log2(n)),
+    ("O(n)", lambda n: float(n)),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n^2)", lambda n: float(n) ** 2),
+    ("O(n^3)", lambda n: float(n) ** 3),
+]
+
+# Typical complexity allowed by the largest input size of the constraints
+expected_bounds = [
+    (25, None),  # Exponential solutions are fine
+    (500, "O(n^3)"),
+    (10**4, "O(n^2)"),
+    (10**6, "O(n log n)"),
+]
+
+# Seconds a solution may typically take on the largest input
+time_limit_seconds = 1.0
+
+# Input sizes are doubled from the smallest one up to the largest one
+min_bench_size = 8
+max_bench_size = 2**16
+
+# Fitting needs a few points to tell the models apart
+min_fit_sizes = 4
+
+# Variations below these are measurement noise rather than growth
+time_noise = 1e-5
+memory_noise = 4096
+
+
+def get_max_input_size(content: str) -> Optional[int]:
+    """
+    Find the largest input size in a problem's constraints
+    (e.g., `1 <= nums.length <= 10<sup>4</sup>`).
+    :param content: HTML content of the problem.
+    :return: The largest bound on a length or `n`, or None if there is none.
+    """
+    text = re.sub(r"<sup>\s*(\d+)\s*</sup>", r"^\1", content or "")
+    text = html.unescape(re.sub(r"<[^>]+>", "", text))
+
+    number = r"(?:(\d+)\s*\*\s*)?(\d+)(?:\^(\d+))?"
+    max_size = None
+    for match in re.finditer(
+        rf"(?:\.length|\blength\b|\b[nm]\b)\s*(?:<=|≤)\s*{number}", text
+    ):
+        factor, base, exponent = match.groups()
+        size = int(base) ** int(exponent) if exponent else int(base)
+        size *= int(factor) if factor else 1
+        max_size = size if max_size is None else max(max_size, size)
+    return max_size
+
+
+def get_expected_complexity(max_size: Optional[int]) -> Optional[str]:
+    """
+    Get the complexity a solution is expected to need for the given input size.
+    :param max_size: Largest input size of the constraints.
+    :return: Complexity label, or None if anything goes.
+    """
+    if max_size is None:
+        return None
+
+    for bound, complexity in expected_bounds:
+        if max_size <= bound:
+            return complexity
+    return "O(n)"
+
+
+def fit_complexity(
+    sizes: List[int], values: List[float], noise: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Fit `value ≈ a * f(n) + b` for each candidate complexity with least squares.
+    :param sizes: Input sizes.
+    :param values: Measured values (e.g., seconds or bytes) for each size.
+    :param noise: Variation below which the values are considered constant.
+    :return: The best fitting `complexity` with its `coefficient` and `intercept`.
+    """
+    # Imported here since NumPy is only needed once a benchmark ran
+    import numpy as np
+
+    measured = np.array(values, dtype=float)
+    if measured.max() - measured.min() <= noise:
+        return {
+            "complexity": "O(1)",
+            "coefficient": 0.0,
+            "intercept": float(measured.mean()),
+            "error": 0.0,
+        }
+
+    # Errors are relative, so small sizes weigh as much as large ones
+    weights = 1 / np.maximum(np.abs(measured), noise or 1e-12)
+
+    best_fit = None
+    for label, function in complexity_models:
+        features = np.array([function(size) for size in sizes], dtype=float)
+        matrix = np.column_stack([features, np.ones(len(sizes))])
+        (coefficient, intercept), *_ = np.linalg.lstsq(
+            matrix * weights[:, None], measured * weights, rcond=None
+        )
+        if label != "O(1)" and coefficient <= 0:
+            continue  # Decreasing with the size, not a meaningful fit
+
+        residuals = (matrix @ [coefficient, intercept] - measured) * weights
+        error = float(np.sum(residuals**2))
+        # Prefer slower growing models unless a faster one fits clearly better
+        if best_fit is None or error < best_fit["error"] * 0.5:
+            best_fit = {
+                "complexity": label,
+                "coefficient": float(coefficient),
+                "intercept": float(intercept),
+                "error": error,
+            }
+    return best_fit
+
+
+def _predict(fit: Dict[str, Any], size: int) -> float:
+    function = dict(complexity_models)[fit["complexity"]]
+    return fit["coefficient"] * function(size) + fit["intercept"]
+
+
+def _is_beyond(complexity: str, expected: Optional[str]) -> bool:
+    if expected is None:
+        return False
+    labels = [label for label, _ in complexity_models]
+    return labels.index(complexity) > labels.index(expected)
+
+
+def run_benchmark(
+    code_path: str,
+    problem: Dict[str, Any],
+    language: str,
+    time_budget: float = 10,
+) -> Optional[Dict[str, Any]]:
+    """
+    Benchmark a solution locally on generated inputs of growing size.
+    :param code_path: Path of the solution file.
+    :param problem: Problem dictionary with `metaData` and `content`.
+    :param language: Programming language of the solution.
+    :param time_budget: Seconds the benchmark may take.
+    :return: Measurements, fitted `time` and `memory` complexities, the expected
+             one, and whether the solution looks `too_slow`;
+             or None if the solution cannot be benchmarked locally.
+    """
+    if language not in local_runner_languages:
+        return None
+
+    meta_data = get_meta_data(problem)
+    if meta_data is None:
+        return None
+
+    max_size = get_max_input_size(problem.get("content"))
+    largest = min(max_size or max_bench_size, max_bench_size)
+    sizes = []
+    size = min_bench_size
+    while size < largest:
+        sizes.append(size)
+        size *= 2
+    sizes.append(largest)
+
+    job = {
+        "kind": "bench",
+        "code_path": os.path.abspath(code_path),
+        "meta_data": meta_data,
+        "sizes": sizes,
+        "time_budget": time_budget,
+    }
+    report = {
+        "measurements": [],
+        "error": None,
+        "max_size": max_size,
+        "expected": get_expected_complexity(max_size),
+        "time": None,
+        "memory": None,
+        "predicted_time": None,
+        "too_slow": False,
+    }
+    # Some time on top of the budget for the size running when it runs out
+    timeout = time_budget * 2
+    try:
+        measurements = run_job(job, timeout)
+    except TimeoutError:
+        report["error"] = f"Timed out after {timeout}s"
+        return report
+    except Exception as e:
+        report["error"] = str(e)
+        return report
+
+    report["measurements"] = measurements
+    report["error"] = next((m["error"] for m in measurements if m["error"]), None)
+
+    valid = [m for m in measurements if m["error"] is None]
+    if len(valid) < min_fit_sizes:
+        return report
+
+    sizes = [m["size"] for m in valid]
+    report["time"] = fit_complexity(sizes, [m["time"] for m in valid], time_noise)
+    report["memory"] = fit_complexity(
+        sizes, [m["peak_memory"] for m in valid], memory_noise
+    )
+    if max_size:
+        report["predicted_time"] = _predict(report["time"], max_size)
+    report["too_slow"] = (
+        _is_beyond(report["time"]["complexity"], report["expected"])
+        or (report["predicted_time"] or 0) > time_limit_seconds
+    )
+    return report
+
+
+def log_benchmark(report: Dict[str, Any]):
+    for measurement in report["measurements"]:
+        if measurement["error"]:
+            continue
+        log(
+            f"⏱️ n = {measurement['size']}: {measurement['time'] * 1000:.2f} ms, "
+            f"{measurement['peak_memory'] / 1024:.1f} KiB",
+            LogLevel.DEBUG,
+        )
+
+    if report["error"]:
+        log(f"Benchmark stopped: {report['error']}", LogLevel.WARN)
+    if report["time"] is None:
+        log("Not enough measurements to estimate the complexity.", LogLevel.WARN)
+        return
+
+    log(
+        f"📈 Estimated complexity: {report['time']['complexity']} time, "
+        f"{report['memory']['complexity']} memory",
+        LogLevel.INFO,
+    )
+    if report["predicted_time"] is not None:
+        log(
+            f"📈 Estimated time for n = {report['max_size']}: "
+            f"{max(report['predicted_time'], 0) * 1000:.1f} ms",
+            LogLevel.INFO,
+        )
+    if report["too_slow"]:
+        log(
+            f"⚠️ The solution looks too slow for the constraints "
+            f"(expected {report['expected'] or 'any complexity'}) and may exceed the time limit.",
+            LogLevel.WARN,
+        )
@@ -0,0 +1,60 @@
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict
+
+# Rendered statements live next to the cached API responses
+render_cache_dir = Path(tempfile.gettempdir()) / "cached_leetcode_api" / "rendered"
+
+# Statements rendered during this process, keyed like the files on disk
+_rendered: Dict[str, str] = {}
+
+
+def _get_render_key(problem_slug: str, content: str) -> str:
+    """
+    Build the cache key of a rendered statement.
+    :param problem_slug: Slug of the problem.
+    :param content: HTML content of the problem.
+    :return: Key combining the slug and the MD5 hash of the content.
+    """
+    content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
+    return f"{problem_slug or 'unknown'}-{content_hash}"
+
+
+def render_problem_content(problem_slug: str, content: str) -> str:
+    """
+    Render a problem's HTML content as plain terminal text.
+    Results are cached per slug and content hash, in memory and on disk,
+    so a problem is only ever rendered once until its content changes.
+    :param problem_slug: Slug of the problem (e.g., "two-sum").
+    :param content: HTML content of the problem.
+    :return: Plain text rendering of the content.
+    """
+    render_key = _get_render_key(problem_slug, content)
+    if render_key in _rendered:
+        return _rendered[render_key]
+
+    cache_file = render_cache_dir / f"{render_key}.txt"
+    if cache_file.exists():
+        plain_text = cache_file.read_text(encoding="utf-8")
+    else:
+        # Imported here since html2text is only needed on a cache miss
+        import html2text
+
+        text_maker = html2text.HTML2Text()
+        text_maker.ignore_links = True
+        plain_text = text_maker.handle(content)
+
+        # Written to a temporary file first, as other threads (e.g., prefetching)
+        # and processes (e.g., the daemon) may read the render meanwhile
+        render_cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(
+            f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_file.write_text(plain_text, encoding="utf-8")
+        os.replace(temp_file, cache_file)
+
+    _rendered[render_key] = plain_text
+    return plain_text
@@ -0,0 +1,81 @@
+import os
+import shlex
+import subprocess
+import threading
+from typing import List, Optional
+
+from utils.editor_resolver import resolve_editor_command
+from utils.logger import hold_logs, log, LogLevel, release_logs
+
+# Editors running inside the terminal rather than in their own window
+terminal_editors = ["vim", "nvim", "nano"]
+
+
+def _release_logs_on_exit(process: subprocess.Popen):
+    process.wait()
+    release_logs()
+    log("📝 Editor closed.", LogLevel.INFO)
+
+
+def launch_editor(editor: str, code_paths: List[str]) -> Optional[subprocess.Popen]:
+    """
+    Open files in an editor without waiting for it to exit, so saves are
+    submitted while editing.
+    Terminal editors open in a split pane inside tmux. Otherwise they take over
+    this terminal, and logs are held back until they exit.
+    :param editor: Name of the editor.
+    :param code_paths: Paths of the files to open.
+    :return: The editor process when it runs in this terminal, which must exit
+             before the session does, otherwise None.
+    """
+    file_paths = " ".join(code_paths)
+    # The paths share a shell command line, so spaces in them must be quoted
+    if os.name == "nt":
+        quoted_paths = subprocess.list2cmdline(code_paths)
+    else:
+        quoted_paths = " ".join(shlex.quote(code_path) for code_path in code_paths)
+    try:
+        open_command = resolve_editor_command(editor, quoted_paths)
+
+        if editor not in terminal_editors:
+            subprocess.Popen(
+                open_command,
+                shell=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            log(f"📂 Opened {file_paths} in the editor.", LogLevel.INFO)
+            return None
+
+        if os.environ.get("TMUX"):
+            subprocess.run(["tmux", "split-window", "-h", open_command], check=True)
+            log(f"📂 Opened {file_paths} in a tmux pane.", LogLevel.INFO)
+            return None
+
+        log(
+            f"📂 Opening {file_paths} in {editor}. Logs are shown once it exits, "
+            f"run inside tmux to see them while editing.",
+            LogLevel.INFO,
+        )
+        hold_logs()
+        process = subprocess.Popen(open_command, shell=True)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        release_logs()
+        log(f"❌ Failed to open file in the editor: {e}", LogLevel.ERROR)
+        return None
+
+    threading.Thread(target=_release_logs_on_exit, args=(process,), daemon=True).start()
+    return process
+
+
+def wait_for_editor(process: Optional[subprocess.Popen]):
+    """
+    Wait for an editor running in this terminal to exit, so it keeps the
+    terminal until the user is done with it.
+    :param process: Editor process returned by `launch_editor`.
+    """
+    if process is not None and process.poll() is None:
+        process.wait()
+        release_logs()
@@ -0,0 +1,225 @@
+import ctypes
+import ctypes.util
+import os
+import platform
+import select
+import struct
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from utils.logger import log, LogLevel
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# A save either closes the written file or renames a temporary file over it
+watch_mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+event_header = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class PollingFileWatcher:
+    def __init__(self, paths: Iterable[str], interval: float = 1.0):
+        """
+        Watch files by comparing their modification times at a fixed interval.
+        :param paths: Paths of the files to watch.
+        :param interval: Seconds between two checks.
+        """
+        self.interval = interval
+        self.paths = [os.path.abspath(path) for path in paths]
+        self._mtimes = {path: self._get_mtime(path) for path in self.paths}
+        self._woken = threading.Event()
+
+    @staticmethod
+    def _get_mtime(path: str) -> Optional[float]:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def add(self, path: str):
+        """
+        Start watching another file.
+        :param path: Path of the file.
+        """
+        path = os.path.abspath(path)
+        if path not in self._mtimes:
+            self.paths.append(path)
+            self._mtimes[path] = self._get_mtime(path)
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Block until a watched file changes, the timeout expires or `wake` is called.
+        :param timeout: Seconds to wait at most (None waits forever).
+        :return: Absolute paths of the changed files (empty on timeout or wake up).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = []
+            for path in self.paths:
+                mtime = self._get_mtime(path)
+                if mtime != self._mtimes[path]:
+                    self._mtimes[path] = mtime
+                    changed.append(path)
+            if changed:
+                return changed
+
+            wait_time = self.interval
+            if deadline is not None:
+                wait_time = min(wait_time, deadline - time.monotonic())
+                if wait_time <= 0:
+                    return []
+
+            if self._woken.wait(wait_time):
+                self._woken.clear()
+                return []
+
+    def wake(self):
+        """
+        Interrupt a pending `wait` from another thread.
+        """
+        self._woken.set()
+
+    def close(self):
+        pass
+
+
+class InotifyFileWatcher:
+    def __init__(self, paths: Iterable[str]):
+        """
+        Watch files with Linux inotify, so saves are reported as they happen
+        without waking up in between.
+        Parent directories are watched since editors often save by renaming.
+        :param paths: Paths of the files to watch.
+        """
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        # Self-pipe used by `wake` to interrupt a blocking `wait`
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        os.set_blocking(self._wake_write, False)
+        # Descriptors may be reused once closed, so late wake ups must not write
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+        self.paths = []
+        self._directories = {}  # Watch descriptor -> directory
+        for path in paths:
+            self.add(path)
+
+    def add(self, path: str):
+        """
+        Start watching another file.
+        :param path: Path of the file.
+        """
+        path = os.path.abspath(path)
+        if path in self.paths:
+            return
+
+        directory = os.path.dirname(path)
+        if directory not in self._directories.values():
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), watch_mask
+            )
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {path}")
+            self._directories[wd] = directory
+        self.paths.append(path)
+
+    def _read_events(self) -> List[str]:
+        changed = []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = event_header.unpack_from(data, offset)
+            offset += event_header.size
+            name = data[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped, so assume every file changed
+                return list(self.paths)
+
+            directory = self._directories.get(wd)
+            if directory is not None and name:
+                path = os.path.join(directory, os.fsdecode(name))
+                if path in self.paths and path not in changed:
+                    changed.append(path)
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Block until a watched file changes, the timeout expires or `wake` is called.
+        :param timeout: Seconds to wait at most (None waits forever).
+        :return: Absolute paths of the changed files (empty on timeout or wake up).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+
+            readable, _, _ = select.select(
+                [self._fd, self._wake_read], [], [], remaining
+            )
+            if self._wake_read in readable:
+                try:
+                    while os.read(self._wake_read, 1024):
+                        pass
+                except BlockingIOError:
+                    pass
+                return []
+            if not readable:
+                return []
+
+            changed = self._read_events()
+            if changed:
+                return changed  # Otherwise the events were for other files
+
+    def wake(self):
+        """
+        Interrupt a pending `wait` from another thread.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            try:
+                os.write(self._wake_write, b"\0")
+            except BlockingIOError:
+                pass  # A wake up is already pending
+
+    def close(self):
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            for fd in (self._fd, self._wake_read, self._wake_write):
+                os.close(fd)
+
+
+def create_file_watcher(paths: Iterable[str]):
+    """
+    Create the most efficient file watcher available on this platform.
+    :param paths: Paths of the files to watch.
+    :return: An inotify watcher on Linux, otherwise a polling watcher.
+    """
+    paths = list(paths)
+    if platform.system() == "Linux":
+        try:
+            return InotifyFileWatcher(paths)
+        except (OSError, AttributeError, TypeError) as e:
+            log(f"inotify unavailable, polling for changes: {str(e)}", LogLevel.DEBUG)
+    return PollingFileWatcher(paths)
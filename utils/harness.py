@@ -0,0 +1,329 @@
+"""
+Harness running a LeetCode Python solution against a list of test cases.
+
+It only depends on the standard library. Its only entry point is `run_job`,
+called by the worker pool (`utils/worker_pool.py`), which preloads the module.
+
+A job is a JSON object:
+    {
+        "code_path": "solutions/two-sum.py",
+        "meta_data": {"name": "twoSum", "params": [...], "return": {...}},
+        "cases": [[[2, 7, 11, 15], 9], ...]
+    }
+and the result is one {"output", "error", "time"} object per case.
+
+A job with `"kind": "bench"` runs the solution on generated inputs instead:
+    {
+        "kind": "bench",
+        "code_path": "solutions/two-sum.py",
+        "meta_data": {...},
+        "sizes": [16, 32, 64, ...],
+        "time_budget": 10
+    }
+and the result is one {"size", "time", "peak_memory", "error"} object per
+size, stopping early once the time budget is spent.
+"""
+
+import math
+import random
+import string
+import time
+import traceback
+import tracemalloc
+
+# Names LeetCode makes available to Python solutions without imports
+leetcode_prelude = """
+from typing import *
+from collections import *
+from heapq import *
+from bisect import *
+from functools import *
+from itertools import *
+from math import *
+import collections, heapq, bisect, functools, itertools, math, re, string, random
+"""
+
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+def to_list_node(values):
+    head = ListNode()
+    node = head
+    for value in values:
+        node.next = ListNode(value)
+        node = node.next
+    return head.next
+
+
+def from_list_node(node):
+    values = []
+    while node is not None:
+        values.append(node.val)
+        node = node.next
+    return values
+
+
+def to_tree_node(values):
+    if not values or values[0] is None:
+        return None
+
+    root = TreeNode(values[0])
+    queue = [root]
+    index = 1
+    for node in queue:
+        for side in ("left", "right"):
+            if index >= len(values):
+                return root
+            if values[index] is not None:
+                child = TreeNode(values[index])
+                setattr(node, side, child)
+                queue.append(child)
+            index += 1
+    return root
+
+
+def from_tree_node(root):
+    values = []
+    queue = [root]
+    for node in queue:
+        if node is None:
+            values.append(None)
+            continue
+        values.append(node.val)
+        queue.append(node.left)
+        queue.append(node.right)
+
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def to_argument(value, value_type):
+    """
+    Convert a JSON value to the type a solution expects.
+    :param value: JSON value of the argument.
+    :param value_type: LeetCode type of the argument (e.g., "ListNode", "integer[]").
+    :return: Argument for the solution method.
+    """
+    if value_type == "ListNode":
+        return to_list_node(value)
+    if value_type == "TreeNode":
+        return to_tree_node(value)
+    if value_type == "ListNode[]":
+        return [to_list_node(item) for item in value]
+    if value_type == "TreeNode[]":
+        return [to_tree_node(item) for item in value]
+    return value
+
+
+def from_result(value):
+    """
+    Convert a solution's return value to JSON.
+    :param value: Value returned by the solution.
+    :return: JSON compatible value.
+    """
+    if isinstance(value, ListNode):
+        return from_list_node(value)
+    if isinstance(value, TreeNode):
+        return from_tree_node(value)
+    if isinstance(value, (list, tuple)):
+        return [from_result(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(from_result(item) for item in value)
+    return value
+
+
+def load_solution(code_path):
+    """
+    Load a solution file in a fresh namespace.
+    :param code_path: Path of the solution file.
+    :return: The `Solution` class defined by the file.
+    """
+    with open(code_path, "r") as file:
+        source = file.read()
+
+    namespace = {"__name__": "solution", "ListNode": ListNode, "TreeNode": TreeNode}
+    exec(leetcode_prelude, namespace)
+    exec(compile(source, code_path, "exec"), namespace)
+    return namespace["Solution"]
+
+
+def run_cases(job):
+    """
+    Run a solution against test cases.
+    :param job: Job description (see the module docstring).
+    :return: One result per case with its `output`, `error` and `time` in seconds.
+    """
+    meta_data = job["meta_data"]
+    params = meta_data.get("params", [])
+    return_type = meta_data.get("return", {}).get("type")
+    # In-place problems (void return) are judged on one of their arguments
+    output_index = meta_data.get("output", {}).get("paramindex", 0)
+
+    try:
+        solution_class = load_solution(job["code_path"])
+    except Exception:
+        error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+        return [{"output": None, "error": error, "time": 0.0} for _ in job["cases"]]
+
+    results = []
+    for case in job["cases"]:
+        arguments = [
+            to_argument(value, param.get("type")) for value, param in zip(case, params)
+        ]
+        start = time.perf_counter()
+        try:
+            method = getattr(solution_class(), meta_data["name"])
+            output = method(*arguments)
+            if return_type == "void":
+                output = arguments[output_index]
+            results.append(
+                {
+                    "output": from_result(output),
+                    "error": None,
+                    "time": time.perf_counter() - start,
+                }
+            )
+        except Exception:
+            error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+            results.append(
+                {"output": None, "error": error, "time": time.perf_counter() - start}
+            )
+    return results
+
+
+def generate_value(value_type, size, rng, sized=True):
+    """
+    Generate a random JSON value of a LeetCode type.
+    :param value_type: LeetCode type (e.g., "integer[]", "string", "TreeNode").
+    :param size: Input size, i.e. the length of arrays, strings and lists.
+    :param rng: Random number generator.
+    :param sized: Whether scalars carry the size, e.g. `n` in `climbStairs(n)`.
+    :return: Generated value.
+    """
+    if value_type.endswith("[][]") or value_type.startswith("list<list<"):
+        # Matrices hold about `size` elements in total
+        side = max(1, math.isqrt(size))
+        element_type = value_type[:-4] if value_type.endswith("[][]") else "integer"
+        if value_type.startswith("list<list<"):
+            element_type = value_type[len("list<list<") : -2]
+        return [
+            [generate_value(element_type, size, rng, False) for _ in range(side)]
+            for _ in range(side)
+        ]
+    if value_type.endswith("[]") or value_type.startswith("list<"):
+        element_type = (
+            value_type[:-2] if value_type.endswith("[]") else value_type[5:-1]
+        )
+        if element_type == "string":
+            return [
+                "".join(rng.choices(string.ascii_lowercase, k=5)) for _ in range(size)
+            ]
+        return [generate_value(element_type, size, rng, False) for _ in range(size)]
+    if value_type in ("ListNode", "TreeNode"):
+        return [rng.randint(-size, size) for _ in range(size)]
+    if value_type in ("integer", "long"):
+        return size if sized else rng.randint(0, size)
+    if value_type == "double":
+        return rng.uniform(0, size)
+    if value_type == "boolean":
+        return rng.random() < 0.5
+    if value_type == "character":
+        return rng.choice(string.ascii_lowercase)
+    if value_type == "string":
+        return "".join(rng.choices(string.ascii_lowercase, k=size))
+    raise ValueError(f"Cannot generate inputs of type {value_type}")
+
+
+def run_bench(job):
+    """
+    Time a solution and measure its peak memory on inputs of growing size.
+    :param job: Job description (see the module docstring).
+    :return: One result per size with its `time` in seconds, `peak_memory` in bytes and `error`.
+    """
+    meta_data = job["meta_data"]
+    param_types = [param.get("type", "") for param in meta_data.get("params", [])]
+    # Scalars only carry the size when no array, string or list does
+    sized_scalars = all(
+        value_type in ("integer", "long", "double", "boolean", "character")
+        for value_type in param_types
+    )
+    solution_class = load_solution(job["code_path"])
+    deadline = time.perf_counter() + job.get("time_budget", 10)
+
+    def make_arguments(size):
+        # The same seed per size, since solutions may change their arguments in place
+        rng = random.Random(size)
+        return [
+            to_argument(
+                generate_value(value_type, size, rng, sized_scalars), value_type
+            )
+            for value_type in param_types
+        ]
+
+    results = []
+    last_duration = 0.0
+    for size in job["sizes"]:
+        # Doubling the size of a quadratic solution takes four times as long
+        size_start = time.perf_counter()
+        if size_start + last_duration * 4 > deadline:
+            break
+
+        try:
+            # Fast calls are repeated, keeping the best time to reduce noise
+            best_time = None
+            total_time = 0.0
+            for _ in range(50):
+                arguments = make_arguments(size)
+                method = getattr(solution_class(), meta_data["name"])
+                start = time.perf_counter()
+                method(*arguments)
+                elapsed = time.perf_counter() - start
+                best_time = elapsed if best_time is None else min(best_time, elapsed)
+                total_time += elapsed
+                if total_time > 0.02:
+                    break
+
+            # Tracing slows the solution down, so memory is measured on its own run
+            arguments = make_arguments(size)
+            method = getattr(solution_class(), meta_data["name"])
+            tracemalloc.start()
+            try:
+                method(*arguments)
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        except Exception:
+            error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+            results.append(
+                {"size": size, "time": None, "peak_memory": None, "error": error}
+            )
+            break
+
+        results.append(
+            {"size": size, "time": best_time, "peak_memory": peak_memory, "error": None}
+        )
+        last_duration = time.perf_counter() - size_start
+    return results
+
+
+def run_job(job):
+    """
+    Run a job.
+    :param job: Job description (see the module docstring).
+    :return: The job's results.
+    """
+    if job.get("kind") == "bench":
+        return run_bench(job)
+    return run_cases(job)
@@ -0,0 +1,107 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class IndexedHeap:
+    def __init__(self, items: Optional[Iterable[Tuple[Hashable, Any]]] = None):
+        """
+        Min-heap of keys by priority that also indexes the position of each key,
+        so the priority of a key can be changed or the key removed in O(log n),
+        besides pushing and popping.
+        :param items: Initial (key, priority) pairs, heapified in O(n).
+        """
+        self._heap: List[Tuple[Any, Hashable]] = []
+        self._positions: Dict[Hashable, int] = {}
+        for key, priority in items or []:
+            if key in self._positions:
+                self._heap[self._positions[key]] = (priority, key)
+            else:
+                self._positions[key] = len(self._heap)
+                self._heap.append((priority, key))
+        for position in reversed(range(len(self._heap) // 2)):
+            self._sift_down(position)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def priority(self, key: Hashable) -> Any:
+        return self._heap[self._positions[key]][0]
+
+    def push(self, key: Hashable, priority: Any):
+        """
+        Add a key, or change its priority if it is already in the heap.
+        :param key: Key to add.
+        :param priority: Priority of the key, the lowest one being popped first.
+        """
+        position = self._positions.get(key)
+        if position is None:
+            position = len(self._heap)
+            self._positions[key] = position
+            self._heap.append((priority, key))
+            self._sift_up(position)
+            return
+
+        previous = self._heap[position][0]
+        self._heap[position] = (priority, key)
+        if priority < previous:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        """
+        Get the key with the lowest priority without removing it.
+        :return: Tuple of the key and its priority.
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty heap")
+        priority, key = self._heap[0]
+        return key, priority
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """
+        Remove the key with the lowest priority.
+        :return: Tuple of the key and its priority.
+        """
+        key, priority = self.peek()
+        self.remove(key)
+        return key, priority
+
+    def remove(self, key: Hashable):
+        position = self._positions.pop(key)
+        last = self._heap.pop()
+        if position == len(self._heap):
+            return
+
+        # The last entry fills the hole, then moves to where it belongs
+        self._heap[position] = last
+        self._positions[last[1]] = position
+        self._sift_up(position)
+        self._sift_down(self._positions[last[1]])
+
+    def _swap(self, i: int, j: int):
+        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
+        self._positions[self._heap[i][1]] = i
+        self._positions[self._heap[j][1]] = j
+
+    def _sift_up(self, position: int):
+        while position > 0:
+            parent = (position - 1) // 2
+            if not self._heap[position][0] < self._heap[parent][0]:
+                break
+            self._swap(position, parent)
+            position = parent
+
+    def _sift_down(self, position: int):
+        size = len(self._heap)
+        while True:
+            smallest = position
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size and self._heap[child][0] < self._heap[smallest][0]:
+                    smallest = child
+            if smallest == position:
+                return
+            self._swap(position, smallest)
+            position = smallest
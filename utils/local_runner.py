@@ -0,0 +1,195 @@
+import html
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from utils.logger import log, LogLevel
+from utils.worker_pool import get_worker_pool
+
+# Languages the local harness can run
+local_runner_languages = ["python", "python3"]
+
+
+def get_meta_data(problem: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a problem's `metaData`, describing the solution method and its parameters.
+    :param problem: Problem dictionary.
+    :return: Parsed metadata, or None if missing or for design problems.
+    """
+    try:
+        meta_data = json.loads(problem.get("metaData") or "null")
+    except ValueError:
+        return None
+
+    # Design problems call a sequence of methods and are not supported locally
+    if not meta_data or meta_data.get("systemdesign") or "name" not in meta_data:
+        return None
+    return meta_data
+
+
+def parse_example_testcases(example_testcases: str, params_count: int) -> List[list]:
+    """
+    Parse `exampleTestcases`, which lists one JSON argument per line.
+    :param example_testcases: Example test cases of the problem.
+    :param params_count: Number of parameters of the solution method.
+    :return: Arguments of each test case.
+    """
+    lines = [line for line in (example_testcases or "").splitlines() if line.strip()]
+    if params_count < 1:
+        return []
+
+    cases = []
+    for start in range(0, len(lines) - params_count + 1, params_count):
+        cases.append([json.loads(line) for line in lines[start : start + params_count]])
+    return cases
+
+
+def parse_expected_outputs(content: str) -> List[Optional[Any]]:
+    """
+    Extract the expected outputs of the examples from a problem statement.
+    :param content: HTML content of the problem.
+    :return: Expected output of each example, None where it could not be parsed.
+    """
+    expected_outputs = []
+    for match in re.finditer(
+        r"Output:?\s*</strong>:?(.*?)(?:\n|</p>|</pre>|<strong>)",
+        content or "",
+        flags=re.DOTALL,
+    ):
+        text = html.unescape(re.sub(r"<[^>]+>", "", match.group(1))).strip()
+        try:
+            expected_outputs.append(json.loads(text))
+        except ValueError:
+            expected_outputs.append(None)
+    return expected_outputs
+
+
+def _normalize_output(value: Any, any_order: bool) -> Any:
+    if isinstance(value, float):
+        return round(value, 5)
+    if isinstance(value, list):
+        items = [_normalize_output(item, any_order) for item in value]
+        if any_order:
+            items.sort(key=json.dumps)
+        return items
+    return value
+
+
+def outputs_match(output: Any, expected: Any, any_order: bool = False) -> bool:
+    """
+    Compare a local output with the expected one.
+    :param output: Output of the solution.
+    :param expected: Expected output.
+    :param any_order: Whether the problem accepts answers in any order.
+    :return: True if the outputs match.
+    """
+    return _normalize_output(output, any_order) == _normalize_output(
+        expected, any_order
+    )
+
+
+def warm_up(language: str):
+    """
+    Start the worker pool in the background, so the first local run is fast.
+    :param language: Programming language of the session.
+    """
+    if language in local_runner_languages:
+        threading.Thread(target=get_worker_pool().start, daemon=True).start()
+
+
+def run_job(job: Dict[str, Any], timeout: float) -> Any:
+    """
+    Run a harness job on the warm worker pool.
+    :param job: Harness job (see `utils/harness.py`).
+    :param timeout: Seconds the whole job may take.
+    :return: The job's results.
+    """
+    results = get_worker_pool().run(job, timeout)
+    if isinstance(results, dict) and "error" in results:
+        raise Exception(results["error"])
+    return results
+
+
+def run_examples(
+    code_path: str, problem: Dict[str, Any], language: str, timeout: float = 10
+) -> Optional[Dict[str, Any]]:
+    """
+    Run a solution against the problem's example test cases locally.
+    :param code_path: Path of the solution file.
+    :param problem: Problem dictionary with `exampleTestcases`, `metaData` and `content`.
+    :param language: Programming language of the solution.
+    :param timeout: Seconds all examples may take together.
+    :return: Whether all examples `passed` and the result of each case,
+             or None if the examples cannot run locally.
+    """
+    if language not in local_runner_languages:
+        return None
+
+    meta_data = get_meta_data(problem)
+    if meta_data is None:
+        return None
+
+    cases = parse_example_testcases(
+        problem.get("exampleTestcases"), len(meta_data.get("params", []))
+    )
+    if not cases:
+        return None
+
+    job = {
+        "code_path": os.path.abspath(code_path),
+        "meta_data": meta_data,
+        "cases": cases,
+    }
+    try:
+        results = run_job(job, timeout)
+    except TimeoutError:
+        results = [
+            {"output": None, "error": f"Timed out after {timeout}s", "time": timeout}
+            for _ in cases
+        ]
+    except Exception as e:
+        results = [{"output": None, "error": str(e), "time": 0.0} for _ in cases]
+
+    content = problem.get("content") or ""
+    any_order = "any order" in content.lower()
+    expected_outputs = parse_expected_outputs(content)
+
+    for index, result in enumerate(results):
+        result["input"] = cases[index]
+        result["expected"] = (
+            expected_outputs[index] if index < len(expected_outputs) else None
+        )
+        if result["error"]:
+            result["passed"] = False
+        elif result["expected"] is None:
+            result["passed"] = True  # Nothing to compare with, it ran fine
+        else:
+            result["passed"] = outputs_match(
+                result["output"], result["expected"], any_order
+            )
+
+    return {
+        "passed": all(result["passed"] for result in results),
+        "results": results,
+    }
+
+
+def log_local_results(local_results: Dict[str, Any]):
+    results = local_results["results"]
+    passed_count = sum(result["passed"] for result in results)
+    for index, result in enumerate(results, start=1):
+        if result["passed"]:
+            log(
+                f"✅ Example {index} passed ({result['time'] * 1000:.1f} ms)",
+                LogLevel.INFO,
+            )
+        elif result["error"]:
+            log(f"❌ Example {index} failed: {result['error']}", LogLevel.ERROR)
+        else:
+            log(
+                f"❌ Example {index} failed: expected {json.dumps(result['expected'])}, got {json.dumps(result['output'])}",
+                LogLevel.ERROR,
+            )
+    log(f"🧪 Local examples: {passed_count}/{len(results)} passed", LogLevel.INFO)
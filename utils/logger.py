@@ -1,5 +1,9 @@
+import contextlib
 import datetime
 import os
+import threading
+from typing import List
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -22,6 +26,72 @@ LOG_LEVEL_PRIORITY = {
 }
 
 
+# Messages held back while another program (e.g., vim) owns the terminal
+_held_messages = None
+_held_lock = threading.Lock()
+
+# Messages captured per thread, for work done in the background
+_captured = threading.local()
+
+
+def hold_logs():
+    """
+    Hold back log messages until `release_logs` is called.
+    """
+    global _held_messages
+    with _held_lock:
+        if _held_messages is None:
+            _held_messages = []
+
+
+def release_logs():
+    """
+    Print the messages held back since `hold_logs` and log directly again.
+    """
+    global _held_messages
+    with _held_lock:
+        messages, _held_messages = _held_messages or [], None
+    for message in messages:
+        _print(message)
+
+
+@contextlib.contextmanager
+def capture_logs():
+    """
+    Capture the messages logged by the current thread instead of printing them,
+    so that background work reports once its result is used.
+    :return: Context manager yielding the list of captured messages, to pass to
+             `print_logs`.
+    """
+    messages = []
+    _captured.messages = messages
+    try:
+        yield messages
+    finally:
+        _captured.messages = None
+
+
+def print_logs(messages: List[str]):
+    """
+    Print messages captured by `capture_logs`, held back like any other.
+    :param messages: Captured messages.
+    """
+    for message in messages:
+        _print(message)
+
+
+def _print(message: str):
+    captured = getattr(_captured, "messages", None)
+    if captured is not None:
+        captured.append(message)
+        return
+    with _held_lock:
+        if _held_messages is not None:
+            _held_messages.append(message)
+            return
+    print(message)
+
+
 def log(message: str, level: str = LogLevel.INFO):
     # Get the configured logging level or default to INFO if not set
     configured_level = os.getenv("LOGGING_LEVEL", LogLevel.INFO)
@@ -32,15 +102,15 @@ def log(message: str, level: str = LogLevel.INFO):
         if show_detailed_logs:
             timestamp = datetime.datetime.now().isoformat()
             if level == LogLevel.DEBUG:
-                print(f"🐞 [{timestamp}] [{level}] {message}")
+                _print(f"🐞 [{timestamp}] [{level}] {message}")
             elif level == LogLevel.INFO:
-                print(f"ℹ️ [{timestamp}] [{level}] {message}")
+                _print(f"ℹ️ [{timestamp}] [{level}] {message}")
             elif level == LogLevel.WARN:
-                print(f"⚠️ [{timestamp}] [{level}] {message}")
+                _print(f"⚠️ [{timestamp}] [{level}] {message}")
             elif level == LogLevel.ERROR:
-                print(f"❌ [{timestamp}] [{level}] {message}")
+                _print(f"❌ [{timestamp}] [{level}] {message}")
 
             return
 
         # Log message without timestamp or level
-        print(message)
+        _print(message)
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Tuple
+
+# Items requested per page by default
+default_page_size = 100
+
+
+def paginate(
+    fetch_page: Callable[[int, int], Tuple[List[Any], bool]],
+    page_size: int = default_page_size,
+) -> Iterator[Any]:
+    """
+    Stream the items of a paginated list, following its `hasMore` flag. The
+    next page is fetched in the background while the current one is consumed,
+    so pages after the first add little latency.
+    :param fetch_page: Returns the items of a page and whether more pages follow,
+                       from a skip and a limit.
+    :param page_size: Items requested per page.
+    :return: Iterator over the items of all pages.
+    """
+    if page_size < 1:
+        raise ValueError("❌ Page size must be positive.")
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        skip = 0
+        future = executor.submit(fetch_page, skip, page_size)
+        while future is not None:
+            items, has_more = future.result()
+            # Pages are counted by the server, whatever was filtered out of them
+            skip += page_size
+            future = executor.submit(fetch_page, skip, page_size) if has_more else None
+            yield from items
+    finally:
+        # Consumers stopping early do not wait for the prefetched page
+        executor.shutdown(wait=False)
@@ -0,0 +1,16 @@
+import os
+from pathlib import Path
+
+
+def get_data_dir() -> Path:
+    """
+    Get the directory of data that must outlive temporary files (e.g., queued
+    submissions), creating it if needed.
+    Set `SQUIDLEET_DATA_DIR` to use another directory than `~/.squidleet`.
+    :return: Path of the data directory.
+    """
+    data_dir = Path(
+        os.getenv("SQUIDLEET_DATA_DIR") or Path.home() / ".squidleet"
+    ).expanduser()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
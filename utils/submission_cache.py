@@ -0,0 +1,130 @@
+import hashlib
+import io
+import json
+import re
+import tempfile
+import tokenize
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Verdicts live next to the cached API responses
+result_cache_dir = Path(tempfile.gettempdir()) / "cached_leetcode_api" / "results"
+
+# Verdicts that identical code always gets again. Others (e.g., "Time Limit
+# Exceeded" or "Internal Error") may change on a new run, so they are not cached.
+deterministic_verdicts = ["Accepted", "Wrong Answer", "Compile Error"]
+
+# Languages whose comments start with `#` (all others use `//` and `/* */`)
+hash_comment_languages = ["python", "python3", "ruby"]
+
+# Languages where indentation is significant and must survive normalization
+indentation_languages = ["python", "python3"]
+
+
+def _strip_python_comments(code: str) -> str:
+    """
+    Remove comments from Python code using the tokenizer, so `#` inside strings is kept.
+    :param code: Python source code.
+    :return: Source code without comments.
+    """
+    lines = code.splitlines(keepends=True)
+    tokens = tokenize.generate_tokens(io.StringIO(code).readline)
+    for token in tokens:
+        if token.type == tokenize.COMMENT:
+            row, column = token.start
+            line = lines[row - 1]
+            lines[row - 1] = line[:column] + line[token.end[1] :]
+    return "".join(lines)
+
+
+def normalize_code(code: str, language: str, ignore_comments: bool = False) -> str:
+    """
+    Normalize code before hashing, so saves that do not change it are detected.
+    :param code: Source code.
+    :param language: Programming language of the code (e.g., "python3").
+    :param ignore_comments: Whether comments and insignificant whitespace are ignored.
+    :return: Normalized source code.
+    """
+    if not ignore_comments:
+        return code
+
+    if language in hash_comment_languages:
+        try:
+            if language in indentation_languages:
+                code = _strip_python_comments(code)
+            else:
+                code = re.sub(r"#[^\n]*", "", code)
+        except (tokenize.TokenError, IndentationError):
+            code = re.sub(r"#[^\n]*", "", code)
+    else:
+        code = re.sub(r"/\*.*?\*/", "", code, flags=re.DOTALL)
+        code = re.sub(r"//[^\n]*", "", code)
+
+    keep_indentation = language in indentation_languages
+    lines = []
+    for line in code.splitlines():
+        if not line.strip():
+            continue
+        indentation = line[: len(line) - len(line.lstrip())] if keep_indentation else ""
+        lines.append(indentation + " ".join(line.split()))
+    return "\n".join(lines)
+
+
+def get_code_hash(code: str, language: str, ignore_comments: bool = False) -> str:
+    """
+    Hash code for submission deduplication.
+    :param code: Source code.
+    :param language: Programming language of the code (e.g., "python3").
+    :param ignore_comments: Whether comments and insignificant whitespace are ignored.
+    :return: SHA-256 hash of the normalized code.
+    """
+    normalized = normalize_code(code, language, ignore_comments)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _get_result_file(problem_slug: str, language: str, code_hash: str) -> Path:
+    return result_cache_dir / f"{problem_slug}-{language}-{code_hash}.json"
+
+
+def get_cached_result(
+    problem_slug: str, language: str, code_hash: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the verdict of a previous submission of identical code.
+    :param problem_slug: Slug of the problem.
+    :param language: Programming language of the submission.
+    :param code_hash: Hash of the submitted code.
+    :return: The cached submission result, or None if the code was never judged.
+    """
+    result_file = _get_result_file(problem_slug, language, code_hash)
+    if not result_file.exists():
+        return None
+
+    try:
+        with open(result_file, "r") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Older versions cached every verdict
+    if result.get("status_msg") not in deterministic_verdicts:
+        return None
+    return result
+
+
+def cache_result(
+    problem_slug: str, language: str, code_hash: str, result: Dict[str, Any]
+) -> None:
+    """
+    Remember the verdict of a submission, if identical code always gets it.
+    :param problem_slug: Slug of the problem.
+    :param language: Programming language of the submission.
+    :param code_hash: Hash of the submitted code.
+    :param result: Submission result returned by the judge.
+    """
+    if result.get("status_msg") not in deterministic_verdicts:
+        return
+
+    result_cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(_get_result_file(problem_slug, language, code_hash), "w") as f:
+        json.dump(result, f)
@@ -0,0 +1,274 @@
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from api.LeetCodeAPI import RateLimitError
+from utils.logger import log, LogLevel
+from utils.storage import get_data_dir
+from utils.submission_cache import deterministic_verdicts
+
+# Delays between retries, doubled after every failure
+min_retry_delay = 1.0
+max_retry_delay = 60.0
+
+# Attempts before giving up on errors other than connectivity or rate limits
+max_attempts = 3
+
+schema = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    problem_slug TEXT NOT NULL,
+    language TEXT NOT NULL,
+    code_hash TEXT NOT NULL,
+    code TEXT NOT NULL,
+    question_id TEXT,
+    status TEXT NOT NULL DEFAULT 'queued',
+    submission_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    retry_delay REAL NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    UNIQUE (problem_slug, language, code_hash)
+)
+"""
+
+
+class SubmissionQueue:
+    def __init__(
+        self,
+        db_path: Path,
+        get_api: Callable,
+        resolve_question_id: Optional[Callable] = None,
+        retry_delay: float = min_retry_delay,
+    ):
+        """
+        Durable queue of submissions sent to LeetCode by a background worker.
+        Submissions are stored before they are sent, so they survive network
+        failures and restarts. They are sent in order, retried while LeetCode
+        cannot be reached, and deduplicated by the hash of their code.
+        :param db_path: Path of the SQLite database.
+        :param get_api: Returns the LeetCodeAPI to submit with.
+        :param resolve_question_id: Returns the question ID of a problem slug.
+        :param retry_delay: Delay before the first retry, in seconds.
+        """
+        self.db_path = db_path
+        self._get_api = get_api
+        self._resolve_question_id = resolve_question_id
+        self.retry_delay = retry_delay
+
+        self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute(schema)
+        self._connection.commit()
+
+        self._condition = threading.Condition()
+        self._worker = None
+
+    def _execute(self, statement: str, parameters=()):
+        with self._condition:
+            cursor = self._connection.execute(statement, parameters)
+            self._connection.commit()
+            return cursor
+
+    def _get(self, item_id: int) -> Dict[str, Any]:
+        row = self._execute(
+            "SELECT * FROM submissions WHERE id = ?", (item_id,)
+        ).fetchone()
+        item = dict(row)
+        item["result"] = json.loads(item["result"]) if item["result"] else None
+        return item
+
+    def _update(self, item_id: int, **values):
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        self._execute(
+            f"UPDATE submissions SET {assignments} WHERE id = ?",
+            (*values.values(), item_id),
+        )
+
+    def start(self):
+        """
+        Start the background worker, which also flushes submissions left
+        queued by previous sessions.
+        """
+        with self._condition:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def enqueue(
+        self,
+        problem_slug: str,
+        language: str,
+        code: str,
+        code_hash: str,
+        question_id: Optional[str] = None,
+    ) -> int:
+        """
+        Queue a submission, unless identical code is already queued or got a
+        verdict that a new run would get again.
+        :param problem_slug: Slug of the problem.
+        :param language: Programming language of the code.
+        :param code: Code to submit.
+        :param code_hash: Hash of the code, identifying duplicates.
+        :param question_id: ID of the problem, resolved when sending if not given.
+        :return: ID of the queued submission.
+        """
+        with self._condition:
+            self._execute(
+                "INSERT OR IGNORE INTO submissions "
+                "(problem_slug, language, code_hash, code, question_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (problem_slug, language, code_hash, code, question_id, time.time()),
+            )
+            item_id, status, result = self._execute(
+                "SELECT id, status, result FROM submissions "
+                "WHERE problem_slug = ? AND language = ? AND code_hash = ?",
+                (problem_slug, language, code_hash),
+            ).fetchone()
+
+            # Submissions that failed for good, or got a verdict that may change
+            # on a new run (e.g., "Time Limit Exceeded"), are sent again when saved
+            # again
+            verdict = json.loads(result).get("status_msg") if result else None
+            if status == "failed" or (
+                status == "done" and verdict not in deterministic_verdicts
+            ):
+                self._update(
+                    item_id,
+                    status="queued",
+                    submission_id=None,
+                    attempts=0,
+                    retry_delay=0,
+                    next_attempt_at=0,
+                    error=None,
+                    result=None,
+                )
+            self._condition.notify_all()
+
+        self.start()
+        return item_id
+
+    def wait(self, item_id: int, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a submission is judged or failed for good.
+        :param item_id: ID of the queued submission.
+        :param timeout: Seconds to wait at most (None waits forever).
+        :return: The submission, with its `status` ("queued", "done" or "failed"),
+                 `result` and `error`.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._get(item_id)["status"] != "queued", timeout
+            )
+            return self._get(item_id)
+
+    def pending_count(self) -> int:
+        """
+        Count the submissions waiting to be sent.
+        :return: Number of queued submissions.
+        """
+        return self._execute(
+            "SELECT COUNT(*) FROM submissions WHERE status = 'queued'"
+        ).fetchone()[0]
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Submissions are sent in order, so a retried one holds back the others
+                row = self._execute(
+                    "SELECT id, next_attempt_at FROM submissions "
+                    "WHERE status = 'queued' ORDER BY id LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    self._condition.wait()
+                    continue
+                delay = row["next_attempt_at"] - time.time()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+            self._send(self._get(row["id"]))
+            with self._condition:
+                self._condition.notify_all()
+
+    def _send(self, item: Dict[str, Any]):
+        api = self._get_api()
+        try:
+            question_id = item["question_id"]
+            if not question_id and self._resolve_question_id:
+                question_id = self._resolve_question_id(item["problem_slug"])
+                self._update(item["id"], question_id=question_id)
+
+            # A submission posted before a failure only needs its verdict
+            submission_id = item["submission_id"]
+            if not submission_id:
+                submission_id = api.post_submission(
+                    item["problem_slug"], item["code"], item["language"], question_id
+                )
+                self._update(item["id"], submission_id=submission_id)
+
+            result = api.wait_for_verdict(submission_id)
+        except RateLimitError as e:
+            self._retry(item, e, e.retry_after, count_attempt=False)
+        except TimeoutError as e:  # A verdict that stayed pending, not connectivity
+            self._retry(item, e)
+        except OSError as e:  # No connectivity, including timeouts
+            self._retry(item, e, count_attempt=False)
+        except Exception as e:
+            self._retry(item, e)
+        else:
+            self._update(
+                item["id"], status="done", error=None, result=json.dumps(result)
+            )
+
+    def _retry(
+        self,
+        item: Dict[str, Any],
+        error: Exception,
+        delay: Optional[float] = None,
+        count_attempt: bool = True,
+    ):
+        attempts = item["attempts"] + (1 if count_attempt else 0)
+        if attempts >= max_attempts:
+            log(f"Submission of {item['problem_slug']} failed: {error}", LogLevel.ERROR)
+            self._update(
+                item["id"], status="failed", attempts=attempts, error=str(error)
+            )
+            return
+
+        if delay is None:
+            delay = min(max(item["retry_delay"] * 2, self.retry_delay), max_retry_delay)
+        log(
+            f"🔌 Could not submit {item['problem_slug']} ({error}), retrying in "
+            f"{delay:.0f}s. {self.pending_count()} submission(s) queued.",
+            LogLevel.WARN,
+        )
+        self._update(
+            item["id"],
+            attempts=attempts,
+            retry_delay=delay,
+            next_attempt_at=time.time() + delay,
+            error=str(error),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_submission_queue() -> SubmissionQueue:
+    """
+    Get the shared submission queue, stored in the data directory.
+    :return: SubmissionQueue instance.
+    """
+    from handlers.APIHandler import get_api
+    from handlers.CacheHandler import get_cached_api
+
+    return SubmissionQueue(
+        get_data_dir() / "submissions.db",
+        get_api,
+        resolve_question_id=lambda slug: get_cached_api().get_question_id(slug),
+    )
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from utils.benchmark import fit_complexity, get_max_input_size, run_benchmark
+from utils.test_local_runner import two_sum
+
+constraints = (
+    "<ul>\n"
+    "<li><code>2 &lt;= nums.length &lt;= 10<sup>5</sup></code></li>\n"
+    "<li><code>-10<sup>9</sup> &lt;= nums[i] &lt;= 10<sup>9</sup></code></li>\n"
+    "</ul>"
+)
+
+quadratic_solution = """
+class Solution:
+    def twoSum(self, nums: List[int], target: int) -> List[int]:
+        for i in range(len(nums)):
+            for j in range(i + 1, len(nums)):
+                if nums[i] + nums[j] == target and target > 10**12:
+                    return [i, j]
+        return []
+"""
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_max_input_size(self):
+        """
+        The largest length bound is read from the constraints, not value bounds.
+        """
+        self.assertEqual(get_max_input_size(constraints), 10**5)
+        self.assertEqual(get_max_input_size("<code>1 &lt;= n &lt;= 45</code>"), 45)
+        self.assertIsNone(get_max_input_size("<p>No constraints.</p>"))
+
+    def test_fit_complexity(self):
+        """
+        Least squares picks the model the measurements grow like.
+        """
+        sizes = [2**k for k in range(3, 14)]
+        self.assertEqual(
+            fit_complexity(sizes, [1e-6 + 3e-8 * n for n in sizes])["complexity"],
+            "O(n)",
+        )
+        self.assertEqual(
+            fit_complexity(sizes, [1e-6 + 3e-9 * n * n for n in sizes])["complexity"],
+            "O(n^2)",
+        )
+        self.assertEqual(
+            fit_complexity(sizes, [1000.0 for _ in sizes], noise=4096)["complexity"],
+            "O(1)",
+        )
+
+    def test_quadratic_solution_is_too_slow(self):
+        """
+        A quadratic solution is flagged when the constraints call for O(n log n).
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            code_path = os.path.join(temp_dir, "solution.py")
+            with open(code_path, "w") as file:
+                file.write(quadratic_solution)
+
+            problem = dict(two_sum, content=two_sum["content"] + constraints)
+            report = run_benchmark(code_path, problem, "python3", time_budget=2)
+
+        self.assertIsNone(report["error"])
+        self.assertEqual(report["expected"], "O(n log n)")
+        self.assertIn(report["time"]["complexity"], ["O(n^2)", "O(n^3)"])
+        self.assertTrue(report["too_slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
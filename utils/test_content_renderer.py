@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils import content_renderer
+from utils.content_renderer import render_problem_content
+
+
+class TestRenderProblemContent(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        patches = [
+            mock.patch.object(content_renderer, "render_cache_dir", self.cache_dir),
+            mock.patch.dict(content_renderer._rendered, clear=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_renders_are_cached_in_memory_and_on_disk(self):
+        first = render_problem_content("two-sum", "<p>Two <b>Sum</b></p>")
+        self.assertIn("Two **Sum**", first)
+        (cache_file,) = self.cache_dir.iterdir()
+
+        # Memory hit: the file is not read again
+        cache_file.write_text("Stale", encoding="utf-8")
+        self.assertEqual(
+            render_problem_content("two-sum", "<p>Two <b>Sum</b></p>"), first
+        )
+
+        # Disk hit: another process finds the render on disk
+        content_renderer._rendered.clear()
+        self.assertEqual(
+            render_problem_content("two-sum", "<p>Two <b>Sum</b></p>"), "Stale"
+        )
+
+    def test_changed_content_is_rendered_again(self):
+        render_problem_content("two-sum", "<p>Two Sum</p>")
+        changed = render_problem_content("two-sum", "<p>Two Sum II</p>")
+
+        self.assertIn("Two Sum II", changed)
+        self.assertEqual(len(list(self.cache_dir.glob("two-sum-*.txt"))), 2)
+        self.assertEqual(list(self.cache_dir.glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
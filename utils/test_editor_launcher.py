@@ -0,0 +1,52 @@
+import contextlib
+import io
+import os
+import time
+import unittest
+from unittest import mock
+
+from utils.editor_launcher import launch_editor, wait_for_editor
+from utils.logger import log, LogLevel
+
+
+class TestEditorLauncher(unittest.TestCase):
+
+    def test_terminal_editor_does_not_block(self):
+        """
+        A terminal editor runs alongside the caller, which logs after it exits.
+        """
+        output = io.StringIO()
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(
+                mock.patch(
+                    "utils.editor_launcher.resolve_editor_command",
+                    return_value="sleep 0.5",
+                )
+            )
+            stack.enter_context(mock.patch.dict(os.environ, {"TMUX": ""}))
+            stack.enter_context(contextlib.redirect_stdout(output))
+
+            start = time.monotonic()
+            process = launch_editor("vim", ["solutions/two-sum.py"])
+            self.assertLess(time.monotonic() - start, 0.4)
+
+            log("🎉 Submission accepted!", LogLevel.INFO)
+            self.assertNotIn("accepted", output.getvalue())
+
+            wait_for_editor(process)
+            self.assertIn("🎉 Submission accepted!", output.getvalue())
+
+    def test_paths_with_spaces_are_quoted(self):
+        with contextlib.ExitStack() as stack:
+            popen = stack.enter_context(mock.patch("subprocess.Popen"))
+            stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            launch_editor("code", ["my solutions/two-sum.py", "my solutions/3sum.py"])
+
+        self.assertEqual(
+            popen.call_args[0][0],
+            "code 'my solutions/two-sum.py' 'my solutions/3sum.py'",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import platform
+import tempfile
+import threading
+import time
+import unittest
+
+from utils.file_watcher import InotifyFileWatcher, PollingFileWatcher
+
+
+def write_later(path, content, delay=0.05):
+    def write():
+        time.sleep(delay)
+        with open(path, "w") as file:
+            file.write(content)
+
+    threading.Thread(target=write, daemon=True).start()
+
+
+class FileWatcherTests:
+    """
+    Behaviour shared by every file watcher backend.
+    """
+
+    def create_watcher(self, paths):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "two-sum.py")
+        self.other_path = os.path.join(self.temp_dir.name, "notes.txt")
+        with open(self.path, "w") as file:
+            file.write("class Solution:\n    pass\n")
+        # Make sure the next write gets a different modification time
+        os.utime(self.path, (0, 0))
+        self.watcher = self.create_watcher([self.path])
+
+    def tearDown(self):
+        self.watcher.close()
+        self.temp_dir.cleanup()
+
+    def test_detects_save(self):
+        """
+        A save is reported with the absolute path of the file.
+        """
+        write_later(self.path, "class Solution:\n    x = 1\n")
+        self.assertEqual(self.watcher.wait(timeout=2), [self.path])
+
+    def test_times_out_without_changes(self):
+        """
+        Waiting without any change returns nothing once the timeout expires.
+        """
+        start = time.monotonic()
+        self.assertEqual(self.watcher.wait(timeout=0.1), [])
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_ignores_unwatched_files(self):
+        """
+        Writes to other files in the same directory are not reported.
+        """
+        write_later(self.other_path, "notes")
+        self.assertEqual(self.watcher.wait(timeout=0.3), [])
+
+    def test_wake_interrupts_wait(self):
+        """
+        Another thread can wake a blocked watcher up.
+        """
+        threading.Timer(0.05, self.watcher.wake).start()
+        start = time.monotonic()
+        self.assertEqual(self.watcher.wait(timeout=5), [])
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class TestPollingFileWatcher(FileWatcherTests, unittest.TestCase):
+
+    def create_watcher(self, paths):
+        return PollingFileWatcher(paths, interval=0.02)
+
+
+@unittest.skipUnless(platform.system() == "Linux", "inotify is Linux only")
+class TestInotifyFileWatcher(FileWatcherTests, unittest.TestCase):
+
+    def create_watcher(self, paths):
+        return InotifyFileWatcher(paths)
+
+    def test_detects_atomic_rename(self):
+        """
+        Editors that save by renaming a temporary file over the original are detected.
+        """
+        temp_path = self.path + ".swp"
+        with open(temp_path, "w") as file:
+            file.write("class Solution:\n    y = 2\n")
+
+        threading.Timer(0.05, os.replace, (temp_path, self.path)).start()
+        self.assertEqual(self.watcher.wait(timeout=2), [self.path])
+
+    def test_detects_save_within_milliseconds(self):
+        """
+        Saves are reported right away instead of at the next poll.
+        """
+        write_later(self.path, "class Solution:\n    z = 3\n", delay=0)
+        start = time.monotonic()
+        self.assertEqual(self.watcher.wait(timeout=2), [self.path])
+        self.assertLess(time.monotonic() - start, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
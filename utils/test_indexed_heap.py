@@ -0,0 +1,35 @@
+import random
+import unittest
+
+from utils.indexed_heap import IndexedHeap
+
+
+class TestIndexedHeap(unittest.TestCase):
+
+    def test_updates_keep_the_heap_ordered(self):
+        """
+        Keys pop in priority order after random pushes, updates and removals.
+        """
+        rng = random.Random(0)
+        heap = IndexedHeap((key, rng.random()) for key in range(100))
+        priorities = {key: heap.priority(key) for key in range(100)}
+
+        for _ in range(500):
+            key = rng.randrange(150)
+            if key in heap and rng.random() < 0.2:
+                heap.remove(key)
+                del priorities[key]
+            else:
+                priorities[key] = rng.random()
+                heap.push(key, priorities[key])
+
+        popped = [heap.pop() for _ in range(len(heap))]
+        self.assertEqual(popped, sorted(priorities.items(), key=lambda item: item[1]))
+
+    def test_empty_heap(self):
+        with self.assertRaises(IndexError):
+            IndexedHeap().pop()
+
+
+if __name__ == "__main__":
+    unittest.main()
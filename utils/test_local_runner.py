@@ -0,0 +1,216 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from utils.local_runner import (
+    parse_example_testcases,
+    parse_expected_outputs,
+    run_examples,
+)
+
+two_sum = {
+    "titleSlug": "two-sum",
+    "content": (
+        '<p><strong class="example">Example 1:</strong></p>\n<pre>\n'
+        "<strong>Input:</strong> nums = [2,7,11,15], target = 9\n"
+        "<strong>Output:</strong> [0,1]\n"
+        "<strong>Explanation:</strong> Because nums[0] + nums[1] == 9.\n</pre>\n"
+        '<p><strong class="example">Example 2:</strong></p>\n<pre>\n'
+        "<strong>Input:</strong> nums = [3,2,4], target = 6\n"
+        "<strong>Output:</strong> [1,2]\n</pre>\n"
+        "<p>You can return the answer in any order.</p>"
+    ),
+    "exampleTestcases": "[2,7,11,15]\n9\n[3,2,4]\n6",
+    "metaData": json.dumps(
+        {
+            "name": "twoSum",
+            "params": [
+                {"name": "nums", "type": "integer[]"},
+                {"name": "target", "type": "integer"},
+            ],
+            "return": {"type": "integer[]", "size": 2},
+        }
+    ),
+}
+
+reverse_list = {
+    "titleSlug": "reverse-linked-list",
+    "content": (
+        '<p><strong class="example">Example 1:</strong></p>\n'
+        '<div class="example-block">\n<p><strong>Input:</strong> '
+        '<span class="example-io">head = [1,2,3,4,5]</span></p>\n'
+        '<p><strong>Output:</strong> <span class="example-io">[5,4,3,2,1]</span></p>'
+    ),
+    "exampleTestcases": "[1,2,3,4,5]",
+    "metaData": json.dumps(
+        {
+            "name": "reverseList",
+            "params": [{"name": "head", "type": "ListNode"}],
+            "return": {"type": "ListNode"},
+        }
+    ),
+}
+
+two_sum_solution = """
+class Solution:
+    def twoSum(self, nums: List[int], target: int) -> List[int]:
+        seen = {}
+        for i, num in enumerate(nums):
+            if target - num in seen:
+                return [i, seen[target - num]]
+            seen[num] = i
+"""
+
+reverse_list_solution = """
+class Solution:
+    def reverseList(self, head: Optional[ListNode]) -> Optional[ListNode]:
+        previous = None
+        while head:
+            print("debugging output must not break the harness")
+            head.next, previous, head = previous, head, head.next
+        return previous
+"""
+
+
+class TestLocalRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_solution(self, code):
+        code_path = os.path.join(self.temp_dir.name, "solution.py")
+        with open(code_path, "w") as file:
+            file.write(code)
+        return code_path
+
+    def test_parse_examples(self):
+        """
+        Test cases are grouped per parameter and outputs parsed from the statement.
+        """
+        self.assertEqual(
+            parse_example_testcases(two_sum["exampleTestcases"], 2),
+            [[[2, 7, 11, 15], 9], [[3, 2, 4], 6]],
+        )
+        self.assertEqual(parse_expected_outputs(two_sum["content"]), [[0, 1], [1, 2]])
+        self.assertEqual(
+            parse_expected_outputs(reverse_list["content"]), [[5, 4, 3, 2, 1]]
+        )
+
+    def test_passing_solution_in_any_order(self):
+        """
+        Answers accepted in any order pass even when ordered differently.
+        """
+        code_path = self.write_solution(two_sum_solution)
+        local_results = run_examples(code_path, two_sum, "python3")
+
+        self.assertTrue(local_results["passed"])
+        self.assertEqual(local_results["results"][0]["output"], [1, 0])
+
+    def test_linked_list_conversion(self):
+        """
+        ListNode arguments and results are converted from and to lists.
+        """
+        code_path = self.write_solution(reverse_list_solution)
+        local_results = run_examples(code_path, reverse_list, "python3")
+
+        self.assertTrue(local_results["passed"])
+
+    def test_wrong_answer_and_errors(self):
+        """
+        Wrong answers and exceptions fail the examples.
+        """
+        code_path = self.write_solution(
+            "class Solution:\n"
+            "    def twoSum(self, nums, target):\n"
+            "        if target == 9:\n"
+            "            return [0, 2]\n"
+            "        raise ValueError('boom')\n"
+        )
+        local_results = run_examples(code_path, two_sum, "python3")
+
+        self.assertFalse(local_results["passed"])
+        self.assertIsNone(local_results["results"][0]["error"])
+        self.assertIn("ValueError: boom", local_results["results"][1]["error"])
+
+    def test_timeout(self):
+        """
+        Solutions that never return are stopped.
+        """
+        code_path = self.write_solution(
+            "class Solution:\n"
+            "    def twoSum(self, nums, target):\n"
+            "        while True:\n"
+            "            pass\n"
+        )
+        local_results = run_examples(code_path, two_sum, "python3", timeout=0.5)
+
+        self.assertFalse(local_results["passed"])
+        self.assertIn("Timed out", local_results["results"][0]["error"])
+
+    def test_repeated_runs_use_warm_workers(self):
+        """
+        Runs after the first one reuse warm workers and reload the edited file.
+        """
+        code_path = self.write_solution(two_sum_solution)
+        run_examples(code_path, two_sum, "python3")
+
+        self.write_solution(
+            two_sum_solution.replace(
+                "[i, seen[target - num]]", "[seen[target - num], i]"
+            )
+        )
+        start = time.perf_counter()
+        local_results = run_examples(code_path, two_sum, "python3")
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(local_results["passed"])
+        self.assertEqual(local_results["results"][0]["output"], [0, 1])
+        self.assertLess(elapsed, 0.1)
+
+    def test_workers_recover_from_crashes(self):
+        """
+        A solution exiting its worker is reported and the pool keeps working.
+        """
+        code_path = self.write_solution(
+            "import os\n"
+            "class Solution:\n"
+            "    def twoSum(self, nums, target):\n"
+            "        os._exit(3)\n"
+        )
+        local_results = run_examples(code_path, two_sum, "python3")
+        self.assertIn("crashed", local_results["results"][0]["error"])
+
+        code_path = self.write_solution(two_sum_solution)
+        self.assertTrue(run_examples(code_path, two_sum, "python3")["passed"])
+
+    def test_runs_are_isolated(self):
+        """
+        Solutions see no secrets from the environment and leave nothing behind
+        for the next run, not even files in their working directory.
+        """
+        code_path = self.write_solution(
+            "import builtins, os\n"
+            "assert set(os.environ) <= {'PATH'}, sorted(os.environ)\n"
+            "assert not hasattr(builtins, 'leaked'), 'state leaked'\n"
+            "assert not os.path.exists('scratch.txt'), 'file leaked'\n"
+            "builtins.leaked = True\n"
+            "open('scratch.txt', 'w').close()\n" + two_sum_solution
+        )
+        for _ in range(3):
+            local_results = run_examples(code_path, two_sum, "python3")
+            self.assertTrue(local_results["passed"], local_results["results"])
+
+    def test_unsupported_language(self):
+        """
+        Languages without a local harness are left to the remote judge.
+        """
+        self.assertIsNone(run_examples("Solution.java", two_sum, "java"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import threading
+import unittest
+
+from utils.pagination import paginate
+
+
+class TestPaginate(unittest.TestCase):
+
+    def test_follows_has_more_until_the_last_page(self):
+        """
+        Every item is streamed, in order, across pages of the requested size.
+        """
+        items = list(range(250))
+        requests = []
+
+        def fetch_page(skip, limit):
+            requests.append((skip, limit))
+            return items[skip : skip + limit], skip + limit < len(items)
+
+        self.assertEqual(list(paginate(fetch_page, 100)), items)
+        self.assertEqual(requests, [(0, 100), (100, 100), (200, 100)])
+
+    def test_prefetches_the_next_page(self):
+        """
+        The next page is requested before the current one is consumed.
+        """
+        second_page_requested = threading.Event()
+
+        def fetch_page(skip, limit):
+            if skip:
+                second_page_requested.set()
+                return [skip], False
+            return [skip], True
+
+        pages = paginate(fetch_page, 10)
+        self.assertEqual(next(pages), 0)
+        self.assertTrue(second_page_requested.wait(5))
+        self.assertEqual(list(pages), [10])
+
+    def test_empty_filtered_pages_do_not_stop_pagination(self):
+        def fetch_page(skip, limit):
+            return ([] if skip == 0 else ["last"]), skip == 0
+
+        self.assertEqual(list(paginate(fetch_page, 5)), ["last"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.submission_cache import cache_result, get_cached_result
+
+
+class TestSubmissionCache(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache_dir_patch = mock.patch(
+            "utils.submission_cache.result_cache_dir", Path(temp_dir.name)
+        )
+        cache_dir_patch.start()
+        self.addCleanup(cache_dir_patch.stop)
+
+    def test_only_deterministic_verdicts_are_cached(self):
+        """
+        Identical code that timed out is judged again rather than failed from cache.
+        """
+        for code_hash, status_msg in [
+            ("accepted", "Accepted"),
+            ("wrong", "Wrong Answer"),
+            ("slow", "Time Limit Exceeded"),
+            ("broken", "Internal Error"),
+        ]:
+            cache_result("two-sum", "python3", code_hash, {"status_msg": status_msg})
+
+        self.assertEqual(
+            get_cached_result("two-sum", "python3", "accepted"),
+            {"status_msg": "Accepted"},
+        )
+        self.assertIsNotNone(get_cached_result("two-sum", "python3", "wrong"))
+        self.assertIsNone(get_cached_result("two-sum", "python3", "slow"))
+        self.assertIsNone(get_cached_result("two-sum", "python3", "broken"))
+
+
+if __name__ == "__main__":
+    unittest.main()
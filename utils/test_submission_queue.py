@@ -0,0 +1,114 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from utils.submission_queue import SubmissionQueue
+
+
+class FlakyAPI:
+    def __init__(self, failures=0, verdict="Accepted"):
+        self.failures = failures
+        self.verdict = verdict
+        self.submissions = []
+
+    def post_submission(self, problem_slug, code, language, question_id=None):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Network is unreachable")
+        self.submissions.append(code)
+        return str(len(self.submissions))
+
+    def wait_for_verdict(self, submission_id):
+        return {"status_msg": self.verdict, "submission_id": submission_id}
+
+
+class PendingAPI(FlakyAPI):
+    def wait_for_verdict(self, submission_id):
+        raise TimeoutError("Verdict still pending")
+
+
+class TestSubmissionQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "submissions.db"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_submissions_are_flushed_in_order_once_online(self):
+        """
+        Submissions failing for lack of connectivity are retried in order.
+        """
+        api = FlakyAPI(failures=2)
+        queue = SubmissionQueue(self.db_path, lambda: api, retry_delay=0.01)
+
+        first = queue.enqueue("two-sum", "python3", "first", "hash-1")
+        second = queue.enqueue("3sum", "python3", "second", "hash-2")
+
+        self.assertEqual(queue.wait(second, timeout=5)["status"], "done")
+        self.assertEqual(queue.wait(first)["result"]["submission_id"], "1")
+        self.assertEqual(api.submissions, ["first", "second"])
+        self.assertEqual(queue.pending_count(), 0)
+
+    def test_identical_code_is_queued_once(self):
+        api = FlakyAPI()
+        queue = SubmissionQueue(self.db_path, lambda: api)
+
+        first = queue.enqueue("two-sum", "python3", "code", "hash")
+        queue.wait(first, timeout=5)
+        second = queue.enqueue("two-sum", "python3", "code", "hash")
+
+        self.assertEqual(first, second)
+        self.assertEqual(api.submissions, ["code"])
+
+    def test_code_is_judged_again_after_a_time_limit_exceeded(self):
+        """
+        Verdicts that may change on a new run are never reused.
+        """
+        api = FlakyAPI(verdict="Time Limit Exceeded")
+        queue = SubmissionQueue(self.db_path, lambda: api)
+
+        first = queue.enqueue("two-sum", "python3", "code", "hash")
+        queue.wait(first, timeout=5)
+        api.verdict = "Accepted"
+        second = queue.enqueue("two-sum", "python3", "code", "hash")
+        item = queue.wait(second, timeout=5)
+
+        self.assertEqual(item["result"]["status_msg"], "Accepted")
+        self.assertEqual(item["result"]["submission_id"], "2")
+        self.assertEqual(api.submissions, ["code", "code"])
+
+    def test_leftovers_are_sent_by_the_next_session(self):
+        """
+        Submissions queued when a session ends are sent by the next one.
+        """
+        offline = SubmissionQueue(self.db_path, lambda: FlakyAPI(failures=100))
+        item_id = offline.enqueue("two-sum", "python3", "code", "hash")
+        time.sleep(0.1)
+        self.assertEqual(offline.pending_count(), 1)
+
+        api = FlakyAPI()
+        queue = SubmissionQueue(self.db_path, lambda: api)
+        queue.start()
+
+        self.assertEqual(queue.wait(item_id, timeout=5)["status"], "done")
+        self.assertEqual(api.submissions, ["code"])
+
+    def test_pending_verdicts_count_as_attempts(self):
+        """
+        Verdicts that never come give up after a few attempts.
+        """
+        api = PendingAPI()
+        queue = SubmissionQueue(self.db_path, lambda: api, retry_delay=0.01)
+
+        item = queue.wait(queue.enqueue("two-sum", "python3", "code", "hash"), 5)
+        self.assertEqual(item["status"], "failed")
+        self.assertEqual(item["attempts"], 3)
+        # The submission was posted once, only its verdict was awaited again
+        self.assertEqual(api.submissions, ["code"])
+
+
+if __name__ == "__main__":
+    unittest.main()
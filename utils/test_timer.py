@@ -0,0 +1,51 @@
+import time
+import unittest
+
+from utils.timer import TimerScheduler, format_duration
+
+
+class TestTimerScheduler(unittest.TestCase):
+
+    def test_timers_fire_in_deadline_order(self):
+        """
+        Expired timers fire once, nearest deadline first, and cancelled ones never do.
+        """
+        fired = []
+        scheduler = TimerScheduler()
+        scheduler.add("slow", 0.2, on_expire=lambda timer: fired.append(timer.name))
+        scheduler.add("fast", 0.05, on_expire=lambda timer: fired.append(timer.name))
+        cancelled = scheduler.add("cancelled", 0.01)
+        scheduler.cancel(cancelled)
+
+        self.assertAlmostEqual(scheduler.next_timeout(), 0.05, delta=0.02)
+        time.sleep(0.25)
+        scheduler.fire_expired()
+        scheduler.fire_expired()
+
+        self.assertEqual(fired, ["fast", "slow"])
+        self.assertFalse(cancelled.expired)
+        self.assertIsNone(scheduler.next_timeout())
+
+    def test_pause_moves_the_deadline(self):
+        """
+        Time spent paused does not count against a timer.
+        """
+        scheduler = TimerScheduler()
+        timer = scheduler.add("two-sum", 0.1)
+        scheduler.pause()
+        time.sleep(0.15)
+        self.assertIsNone(scheduler.next_timeout())
+        self.assertEqual(scheduler.fire_expired(), [])
+
+        scheduler.resume()
+        self.assertGreater(timer.remaining(), 0.05)
+        time.sleep(0.1)
+        self.assertEqual(scheduler.fire_expired(), [timer])
+
+    def test_format_duration(self):
+        self.assertEqual(format_duration(65), "01:05")
+        self.assertEqual(format_duration(3725), "1:02:05")
+
+
+if __name__ == "__main__":
+    unittest.main()
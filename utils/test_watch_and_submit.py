@@ -0,0 +1,135 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.submission_queue import SubmissionQueue
+from utils.watch_and_submit import SolutionTracker, watch_solutions
+
+
+class FakeAPI:
+    def __init__(self):
+        self.submissions = []
+        self.judge_time = 0.1
+
+    def get_question_id(self, problem_slug):
+        return "1"
+
+    def post_submission(self, problem_slug, code, language, question_id=None):
+        self.submissions.append(problem_slug)
+        return "wrong" if "wrong" in code else "right"
+
+    def wait_for_verdict(self, submission_id):
+        time.sleep(self.judge_time)
+        if submission_id == "wrong":
+            return {"status_msg": "Wrong Answer"}
+        return {"status_msg": "Accepted"}
+
+
+class TestWatchSolutions(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.api = FakeAPI()
+        patches = [
+            mock.patch("utils.watch_and_submit.get_api", return_value=self.api),
+            mock.patch("utils.watch_and_submit.get_cached_api", return_value=self.api),
+            mock.patch(
+                "utils.watch_and_submit.get_submission_queue",
+                return_value=SubmissionQueue(
+                    Path(self.temp_dir.name) / "submissions.db", lambda: self.api
+                ),
+            ),
+            mock.patch("utils.watch_and_submit.record_attempt"),
+            mock.patch(
+                "utils.submission_cache.result_cache_dir",
+                Path(self.temp_dir.name) / "results",
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        update_score_patch = mock.patch("utils.watch_and_submit.update_score")
+        self.update_score = update_score_patch.start()
+        self.addCleanup(update_score_patch.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_tracker(self, slug):
+        code_path = os.path.join(self.temp_dir.name, f"{slug}.py")
+        with open(code_path, "w") as file:
+            file.write("class Solution:\n    pass\n")
+        return SolutionTracker(code_path, slug, "python3", difficulty="Easy")
+
+    def test_problems_are_submitted_independently(self):
+        """
+        A single loop submits each saved file on its own until all are accepted.
+        """
+        trackers = [self.create_tracker("two-sum"), self.create_tracker("3sum")]
+
+        def save(tracker, code):
+            time.sleep(0.2)
+            with open(tracker.code_path, "w") as file:
+                file.write(code)
+
+        def solve():
+            save(trackers[1], "# wrong\n")
+            save(trackers[1], "# right\n")
+            save(trackers[0], "# right\n")
+
+        thread = threading.Thread(target=solve, daemon=True)
+        thread.start()
+        watch_solutions(trackers, debounce=0.05)
+        thread.join()
+
+        self.assertEqual(self.api.submissions, ["3sum", "3sum", "two-sum"])
+        self.assertTrue(all(tracker.accepted for tracker in trackers))
+        self.assertEqual(trackers[1].status, "✅ Accepted")
+        self.update_score.assert_called_with(
+            "easy", completed_in_time=True, problem_slug="two-sum"
+        )
+
+    def test_time_limit_ends_the_session(self):
+        """
+        Problems not accepted within the time limit expire, scoring no points.
+        """
+        tracker = self.create_tracker("two-sum")
+
+        start = time.monotonic()
+        watch_solutions([tracker], debounce=0.05, time_limit=0.005)
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertTrue(tracker.expired)
+        self.assertEqual(self.api.submissions, [])
+        self.update_score.assert_called_once_with(
+            "easy", completed_in_time=False, problem_slug="two-sum", solved=False
+        )
+
+    def test_time_limit_is_enforced_while_judging(self):
+        """
+        The session stays responsive while a verdict is awaited.
+        """
+        tracker = self.create_tracker("two-sum")
+        self.api.judge_time = 5
+
+        def save():
+            time.sleep(0.1)
+            with open(tracker.code_path, "w") as file:
+                file.write("# right\n")
+
+        threading.Thread(target=save, daemon=True).start()
+        start = time.monotonic()
+        watch_solutions([tracker], debounce=0.05, time_limit=0.01)
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertTrue(tracker.expired)
+        self.assertFalse(tracker.accepted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,201 @@
+import heapq
+import itertools
+import signal
+import threading
 import time
+from typing import Callable, List, Optional
 
-expiration_time = 0
 
+class Timer:
+    def __init__(
+        self, name: str, duration: float, on_expire: Optional[Callable] = None
+    ):
+        """
+        Countdown based on the monotonic clock, so it is not affected by changes
+        to the system time.
+        :param name: Name of the timer (e.g., the problem slug).
+        :param duration: Seconds until the timer expires.
+        :param on_expire: Called with the timer when it expires.
+        """
+        self.name = name
+        self.duration = duration
+        self.on_expire = on_expire
+        self.deadline = time.monotonic() + duration
+        self.paused_at = None
+        self.expired = False
+        self.cancelled = False
 
-def start_timer(time_limit: int, problem_slug: str):
-    """
-    Start a timer for the specified time limit.
-    :param time_limit: Time limit in seconds.
-    :param problem_slug: Slug of the problem.
-    """
-    global expiration_time
-    expiration_time = time.time() + time_limit
-    print(f"⏳ Timer started for problem: {problem_slug}")
+    def remaining(self) -> float:
+        """
+        Get the remaining time.
+        :return: Remaining time in seconds.
+        """
+        now = self.paused_at if self.paused_at is not None else time.monotonic()
+        return max(0.0, self.deadline - now)
+
+    def elapsed(self) -> float:
+        """
+        Get the time spent on the timer, excluding pauses.
+        :return: Elapsed time in seconds.
+        """
+        return self.duration - self.remaining()
+
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = time.monotonic()
+
+    def resume(self):
+        if self.paused_at is not None:
+            self.deadline += time.monotonic() - self.paused_at
+            self.paused_at = None
+
+
+class TimerScheduler:
+    def __init__(self):
+        """
+        Timers whose deadlines are handled by an event loop: the loop waits at most
+        `next_timeout()` seconds for its events, then calls `fire_expired()`.
+        """
+        self.timers: List[Timer] = []
+        self._heap = []
+        self._counter = itertools.count()
+        # Reentrant, since the suspend signal handler may interrupt a locked call
+        self._lock = threading.RLock()
+
+    def add(
+        self, name: str, duration: float, on_expire: Optional[Callable] = None
+    ) -> Timer:
+        """
+        Start a timer.
+        :param name: Name of the timer.
+        :param duration: Seconds until the timer expires.
+        :param on_expire: Called with the timer when it expires.
+        :return: The started timer.
+        """
+        timer = Timer(name, duration, on_expire)
+        with self._lock:
+            self.timers.append(timer)
+            heapq.heappush(self._heap, (timer.deadline, next(self._counter), timer))
+        return timer
+
+    def cancel(self, timer: Timer):
+        timer.cancelled = True
+
+    def pause(self):
+        """
+        Pause all timers (e.g., while the process is suspended).
+        """
+        with self._lock:
+            for timer in self.timers:
+                timer.pause()
+
+    def resume(self):
+        """
+        Resume all timers, moving their deadlines by the time spent paused.
+        """
+        with self._lock:
+            for timer in self.timers:
+                timer.resume()
+            self._heap = [
+                (timer.deadline, next(self._counter), timer)
+                for timer in self.timers
+                if not (timer.expired or timer.cancelled)
+            ]
+            heapq.heapify(self._heap)
+
+    def next_timeout(self) -> Optional[float]:
+        """
+        Get how long the event loop may wait before a timer expires.
+        :return: Seconds until the nearest deadline, or None without running timers.
+        """
+        with self._lock:
+            while self._heap and self._is_done(self._heap[0][2]):
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            timer = self._heap[0][2]
+            if timer.paused_at is not None:
+                return None
+            return timer.remaining()
+
+    def fire_expired(self) -> List[Timer]:
+        """
+        Call the callbacks of the timers whose deadline passed, on the caller's thread.
+        :return: The timers that expired.
+        """
+        expired = []
+        with self._lock:
+            now = time.monotonic()
+            while self._heap:
+                deadline, _, timer = self._heap[0]
+                if self._is_done(timer):
+                    heapq.heappop(self._heap)
+                    continue
+                if timer.paused_at is not None or deadline > now:
+                    break
+                heapq.heappop(self._heap)
+                timer.expired = True
+                expired.append(timer)
+
+        for timer in expired:
+            if timer.on_expire:
+                timer.on_expire(timer)
+        return expired
+
+    @staticmethod
+    def _is_done(timer: Timer) -> bool:
+        return timer.expired or timer.cancelled
+
+
+class SuspendHandler:
+    def __init__(self, scheduler: TimerScheduler):
+        """
+        Pause timers while the process is suspended (Ctrl+Z) and resume them
+        when it continues (`fg`). Signals can only be handled on the main thread.
+        :param scheduler: Scheduler of the timers.
+        """
+        self.scheduler = scheduler
+        self._previous_handlers = {}
+
+    def __enter__(self):
+        installable = (
+            hasattr(signal, "SIGTSTP")
+            and threading.current_thread() is threading.main_thread()
+        )
+        if installable:
+            for signal_number, handler in (
+                (signal.SIGTSTP, self._on_suspend),
+                (signal.SIGCONT, self._on_continue),
+            ):
+                self._previous_handlers[signal_number] = signal.signal(
+                    signal_number, handler
+                )
+        return self
+
+    def __exit__(self, *exc_info):
+        for signal_number, handler in self._previous_handlers.items():
+            signal.signal(signal_number, handler)
+        self._previous_handlers = {}
+
+    def _on_suspend(self, signal_number, frame):
+        self.scheduler.pause()
+        # Suspend for real with the default handler, which is reinstalled on continue
+        signal.signal(signal.SIGTSTP, signal.SIG_DFL)
+        signal.raise_signal(signal.SIGTSTP)
+
+    def _on_continue(self, signal_number, frame):
+        signal.signal(signal.SIGTSTP, self._on_suspend)
+        self.scheduler.resume()
 
 
-def get_time_remaining() -> int:
+def format_duration(seconds: float) -> str:
     """
-    Get the remaining time in seconds.
-    :return: Remaining time in seconds.
+    Format a duration for display.
+    :param seconds: Duration in seconds.
+    :return: Duration as `MM:SS`, or `H:MM:SS` from one hour.
     """
-    remaining = int(expiration_time - time.time())
-    return max(0, remaining)
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
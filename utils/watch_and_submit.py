@@ -1,46 +1,408 @@
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 
-from api.LeetCodeAPI import LeetCodeAPI
-
-from utils.timer import start_timer
+from handlers.APIHandler import get_api
+from handlers.CacheHandler import get_cached_api
+from scoring.attempts import record_attempt
+from scoring.score import update_score
+from utils.benchmark import run_benchmark, log_benchmark
+from utils.file_watcher import create_file_watcher
+from utils.local_runner import run_examples, log_local_results
+from utils.submission_cache import get_code_hash, get_cached_result, cache_result
+from utils.submission_queue import get_submission_queue
+from utils.timer import SuspendHandler, TimerScheduler, format_duration
 from utils.logger import log, LogLevel
 
+# Status shown for a problem before anything was submitted
+not_submitted_status = "⏳ Not submitted"
+
+
+class SolutionTracker:
+    def __init__(
+        self,
+        code_path,
+        problem_slug,
+        language,
+        ignore_comments=False,
+        problem_details=None,
+        bench=False,
+        difficulty=None,
+    ):
+        """
+        Track the solution file of one problem and submit it when it changes.
+        Code identical to the last submission is never resubmitted.
+        When `problem_details` are given, the examples run locally first and the
+        solution is only submitted once they pass. With `bench`, the solution is
+        also benchmarked locally on generated inputs before it is submitted.
+        """
+        self.code_path = code_path
+        self.problem_slug = problem_slug
+        self.language = language
+        self.ignore_comments = ignore_comments
+        self.problem_details = problem_details
+        self.bench = bench
+        self.difficulty = difficulty
+        self.accepted = False
+        self.expired = False
+        self.timer = None
+        self.question_id = None
+        self.closed = False
+        self.status = not_submitted_status
+
+        # Saving the untouched template is not worth a submission
+        with open(code_path, "r") as file:
+            self.last_hash = get_code_hash(file.read(), language, ignore_comments)
+
+    @property
+    def done(self):
+        return self.accepted or self.expired
+
+    def close(self):
+        """
+        Stop waiting for queued submissions, which are sent in a later session.
+        """
+        self.closed = True
+
+    def check(self):
+        """
+        Handle a saved change of the solution file: run the examples, submit the
+        solution and wait for its verdict. This may take a while, so the
+        session runs it in the background.
+        :return: True once the solution is accepted.
+        """
+        with open(self.code_path, "r") as file:
+            code = file.read()
+
+        code_hash = get_code_hash(code, self.language, self.ignore_comments)
+        if code_hash == self.last_hash:
+            log(
+                f"No changes to {self.problem_slug} since the last submission, skipping.",
+                LogLevel.DEBUG,
+            )
+            return self.accepted
+        self.last_hash = code_hash
+
+        result = get_cached_result(self.problem_slug, self.language, code_hash)
+        if result is not None:
+            log(
+                "♻️ Identical code was already judged, reusing its verdict.",
+                LogLevel.INFO,
+            )
+            # Recorded again, as reviews grade attempts by their verdicts
+            record_attempt(
+                "verdict",
+                self.problem_slug,
+                difficulty=self.difficulty,
+                verdict=result["status_msg"],
+            )
+        else:
+            if self.problem_details and not self._run_examples(code):
+                return False
+
+            log(
+                f"Detected changes. Submitting solution for {self.problem_slug}...",
+                LogLevel.INFO,
+            )
+            # Queued durably first, so a dropped connection never loses the attempt
+            submission_queue = get_submission_queue()
+            item_id = submission_queue.enqueue(
+                self.problem_slug,
+                self.language,
+                code,
+                code_hash,
+                question_id=self.question_id
+                or (self.problem_details or {}).get("questionId"),
+            )
+            self.status = "📮 Submitting"
+            record_attempt("submitted", self.problem_slug, difficulty=self.difficulty)
+            item = submission_queue.wait(item_id, timeout=1)
+            while item["status"] == "queued":
+                if self.expired or self.closed:
+                    log(
+                        f"📮 The submission of {self.problem_slug} is still "
+                        f"pending, it will be completed by a later session.",
+                        LogLevel.INFO,
+                    )
+                    return False
+                item = submission_queue.wait(item_id, timeout=1)
+
+            if item["status"] == "failed":
+                self.status = "⚠️ Submission failed"
+                self.last_hash = None  # Saving the same code again retries it
+                return False
+            result = item["result"]
+
+            # Only final verdicts are worth remembering, and only deterministic
+            # ones are cached (see `cache_result`)
+            if "status_msg" in result:
+                cache_result(self.problem_slug, self.language, code_hash, result)
+                record_attempt(
+                    "verdict",
+                    self.problem_slug,
+                    difficulty=self.difficulty,
+                    verdict=result["status_msg"],
+                )
+
+        self.accepted = process_submission_result(result)
+        self.status = (
+            "✅ Accepted"
+            if self.accepted
+            else f"❌ {result.get('status_msg') or 'Not accepted'}"
+        )
+        return self.accepted
+
+    def _get_question_id(self):
+        if self.question_id is None:
+            self.question_id = self.problem_details and self.problem_details.get(
+                "questionId"
+            )
+        if self.question_id is None:
+            self.question_id = get_cached_api().get_question_id(self.problem_slug)
+        return self.question_id
+
+    def _run_examples(self, code):
+        local_results = run_examples(
+            self.code_path, self.problem_details, self.language
+        )
+        if local_results is None:
+            return self._run_examples_remotely(code)
+
+        log_local_results(local_results)
+        if not local_results["passed"]:
+            log("Not submitting until the examples pass.", LogLevel.WARN)
+            self.status = "🧪 Examples failing"
+            return False
+
+        if self.bench:
+            report = run_benchmark(self.code_path, self.problem_details, self.language)
+            if report is not None:
+                log_benchmark(report)
+        return True
+
+    def _run_examples_remotely(self, code):
+        # Languages without a local harness run the examples on LeetCode instead
+        example_testcases = self.problem_details.get("exampleTestcases")
+        if not example_testcases:
+            return True
+
+        log(
+            f"Running the examples of {self.problem_slug} on LeetCode...", LogLevel.INFO
+        )
+        try:
+            result = get_api().run_solution(
+                self.problem_slug,
+                code,
+                self.language,
+                example_testcases,
+                question_id=self._get_question_id(),
+            )
+        except Exception as e:
+            log(f"Failed to run the examples: {e}", LogLevel.WARN)
+            return True  # The submission itself still tells
+
+        if not result.get("run_success"):
+            error = result.get("full_compile_error") or result.get("full_runtime_error")
+            log(f"❌ {result.get('status_msg')}: {error}", LogLevel.ERROR)
+        elif not result.get("correct_answer"):
+            log(
+                f"❌ Examples failed: expected {result.get('expected_code_answer')}, "
+                f"got {result.get('code_answer')}",
+                LogLevel.ERROR,
+            )
+        else:
+            log("✅ Examples passed on LeetCode.", LogLevel.INFO)
+            return True
+
+        log("Not submitting until the examples pass.", LogLevel.WARN)
+        self.status = "🧪 Examples failing"
+        return False
 
-def setup_file_watcher(code_path, problem_slug, language, time_limit):
+
+def watch_solutions(trackers, debounce=0.5, time_limit=None):
     """
-    Set up a file watcher to monitor changes and submit the solution.
+    Watch the solution files of several problems from a single loop, submitting
+    each one independently as it is saved, until all of them are accepted or
+    their time is up. The score is updated when a problem is accepted or expires.
+    Checks run in the background and wake the loop once done, so timers and
+    other problems are handled while a verdict is awaited.
+    :param trackers: SolutionTracker of each problem.
+    :param debounce: Seconds a saved file must stay unchanged before it is checked.
+    :param time_limit: Minutes each problem may take (None for no limit).
     """
-    leetcode_api = LeetCodeAPI()
+    scheduler = TimerScheduler()
+    if time_limit:
+        for tracker in trackers:
+            tracker.timer = scheduler.add(
+                tracker.problem_slug,
+                time_limit * 60,
+                on_expire=lambda _, tracker=tracker: _expire(tracker),
+            )
 
-    start_timer(time_limit, problem_slug)
-    log(f"Watching file: {code_path}...", LogLevel.INFO)
+    trackers_by_path = {
+        os.path.abspath(tracker.code_path): tracker for tracker in trackers
+    }
+    watcher = create_file_watcher(trackers_by_path.keys())
+    executor = ThreadPoolExecutor(max_workers=len(trackers))
 
-    last_modified = os.path.getmtime(code_path)
+    # Submissions queued while offline in earlier sessions are flushed as well
+    submission_queue = get_submission_queue()
+    if submission_queue.pending_count():
+        log(
+            f"📮 Sending {submission_queue.pending_count()} queued submission(s)...",
+            LogLevel.INFO,
+        )
+        submission_queue.start()
+
+    running_checks = {}  # Tracker to the future of its check
+    saved_while_checking = set()
+    try:
+        with SuspendHandler(scheduler):
+            while not all(tracker.done for tracker in trackers):
+                # Blocks until a file is saved, a check finishes or the nearest
+                # time limit is reached
+                saved = set(watcher.wait(timeout=scheduler.next_timeout()))
+                status_changed = bool(scheduler.fire_expired())
+
+                for tracker, future in list(running_checks.items()):
+                    if not future.done():
+                        continue
+                    del running_checks[tracker]
+                    status_changed = True
+                    if _get_check_result(tracker, future) and not tracker.expired:
+                        _accept(tracker, scheduler)
+
+                if saved:
+                    # Editors may write several times per save, so wait until
+                    # files settle
+                    while True:
+                        settling = watcher.wait(timeout=debounce)
+                        if not settling:
+                            break
+                        saved.update(settling)
+
+                # Saves made during a check are checked once it is done
+                to_check = [
+                    trackers_by_path[path] for path in saved if path in trackers_by_path
+                ]
+                for tracker in list(saved_while_checking):
+                    if tracker not in running_checks:
+                        saved_while_checking.discard(tracker)
+                        to_check.append(tracker)
 
-    while True:
-        current_modified = os.path.getmtime(code_path)
-        if current_modified != last_modified:
-            log("Detected changes. Submitting solution...", LogLevel.INFO)
-            last_modified = current_modified
+                for tracker in to_check:
+                    if tracker.done:
+                        continue
+                    if tracker in running_checks:
+                        saved_while_checking.add(tracker)
+                        continue
+                    future = executor.submit(tracker.check)
+                    future.add_done_callback(lambda _: watcher.wake())
+                    running_checks[tracker] = future
 
-            with open(code_path, "r") as file:
-                code = file.read()
+                if status_changed and len(trackers) > 1:
+                    log_session_status(trackers)
+    finally:
+        for tracker in trackers:
+            tracker.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+        watcher.close()
 
-            try:
-                result = leetcode_api.submit_solution(problem_slug, code, language)
-                process_submission_result(result)
-                break
-            except Exception as e:
-                log(f"Submission failed: {e}", LogLevel.ERROR)
-        time.sleep(1)
+
+def _get_check_result(tracker, future):
+    try:
+        return future.result()
+    except Exception as e:
+        log(f"Failed to check {tracker.problem_slug}: {e}", LogLevel.ERROR)
+        tracker.status = "⚠️ Check failed"
+        tracker.last_hash = None  # Saving the same code again retries it
+        return False
+
+
+def _accept(tracker, scheduler):
+    completed_in_time = True
+    if tracker.timer is not None:
+        # The deadline may have passed while the verdict was awaited
+        completed_in_time = tracker.timer.remaining() > 0
+        scheduler.cancel(tracker.timer)
+        log(
+            f"⏱️ Solved {tracker.problem_slug} in {format_duration(tracker.timer.elapsed())}.",
+            LogLevel.INFO,
+        )
+    if tracker.difficulty:
+        update_score(
+            tracker.difficulty.lower(),
+            completed_in_time=completed_in_time,
+            problem_slug=tracker.problem_slug,
+        )
+
+
+def _expire(tracker):
+    tracker.expired = True
+    tracker.status = "⏰ Time's up"
+    log(
+        f"⏰ Time's up for {tracker.problem_slug} after {format_duration(tracker.timer.duration)}!",
+        LogLevel.WARN,
+    )
+    if tracker.difficulty:
+        # Unsolved problems only reset the streak
+        update_score(
+            tracker.difficulty.lower(),
+            completed_in_time=False,
+            problem_slug=tracker.problem_slug,
+            solved=False,
+        )
+
+
+def log_session_status(trackers):
+    accepted_count = sum(tracker.accepted for tracker in trackers)
+    log(f"🏁 Solved {accepted_count}/{len(trackers)} problems:", LogLevel.INFO)
+    for tracker in trackers:
+        status = tracker.status
+        if tracker.timer is not None and not tracker.done:
+            status += f" ({format_duration(tracker.timer.remaining())} left)"
+        log(f"  • {tracker.problem_slug}: {status}", LogLevel.INFO)
+
+
+def setup_file_watcher(
+    code_path,
+    problem_slug,
+    language,
+    time_limit,
+    debounce=0.5,
+    ignore_comments=False,
+    problem_details=None,
+    bench=False,
+    difficulty=None,
+):
+    """
+    Set up a file watcher to monitor changes and submit the solution.
+    Saves are debounced and code identical to the last submission is never resubmitted.
+    When `problem_details` are given, the examples run locally first and the
+    solution is only submitted once they pass. With `bench`, the solution is
+    also benchmarked locally on generated inputs before it is submitted.
+    Watching stops once the solution is accepted or `time_limit` minutes passed.
+    """
+    log(f"Watching file: {code_path}...", LogLevel.INFO)
+
+    tracker = SolutionTracker(
+        code_path,
+        problem_slug,
+        language,
+        ignore_comments=ignore_comments,
+        problem_details=problem_details,
+        bench=bench,
+        difficulty=difficulty,
+    )
+    watch_solutions([tracker], debounce, time_limit)
 
 
 def process_submission_result(result):
-    if result.get("status", {}).get("message") == "Accepted":
+    if result.get("status_msg") == "Accepted":
         log(
-            f"🎉 Submission accepted! Runtime: {result['runtime']}, Memory: {result['memory']}",
+            f"🎉 Submission accepted! Runtime: {result.get('status_runtime')}, Memory: {result.get('status_memory')}",
             LogLevel.INFO,
         )
-    else:
-        log(f"Submission failed. Status: {result.get('status_msg')}", LogLevel.ERROR)
+        return True
+
+    log(f"Submission failed. Status: {result.get('status_msg')}", LogLevel.ERROR)
+    return False
@@ -0,0 +1,223 @@
+import contextlib
+import io
+import multiprocessing
+import math
+import os
+import queue
+import shutil
+import signal
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Any, Dict
+
+# Resource limits applied to processes running solutions
+memory_limit_bytes = 1024 * 1024 * 1024
+file_size_limit_bytes = 1024 * 1024
+
+# Seconds the pool waits beyond a job's timeout before giving up on its worker
+timeout_grace = 1.0
+
+
+def _limit_resources(timeout: float):
+    try:
+        import resource
+    except ImportError:
+        return  # Not available on Windows
+
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    resource.setrlimit(
+        resource.RLIMIT_FSIZE, (file_size_limit_bytes, file_size_limit_bytes)
+    )
+    # Stops runaway solutions even if their worker is gone
+    cpu_seconds = math.ceil(timeout) + 1
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+
+
+def _run_job(job, timeout: float):
+    """
+    Run a harness job in the current directory, with limited resources.
+    :return: The job's results.
+    """
+    from utils import harness
+
+    _limit_resources(timeout)
+
+    # Solutions may print while debugging, which is not part of the results
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return harness.run_job(job)
+        except BaseException as e:  # e.g., `exit()` called by the solution
+            return {"error": f"{type(e).__name__}: {e}"}
+
+
+def _run_job_in_child(job, timeout: float, scratch_dir: str, connection):
+    """
+    Fork a child of the warm worker for a single job, so nothing a solution
+    changes (modules, `sys`, builtins) outlives its run.
+    :return: The job's results.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # Solutions only get to reply through their own pipe
+            connection.close()
+            receiver.close()
+            os.chdir(scratch_dir)
+            tempfile.tempdir = scratch_dir
+            sender.send(_run_job(job, timeout))
+        finally:
+            os._exit(0)
+
+    sender.close()
+    results = None
+    try:
+        if not receiver.poll(timeout):
+            os.kill(pid, signal.SIGKILL)
+            return {"timeout": True}
+        results = receiver.recv()
+    except EOFError:
+        pass  # The child died without results
+    finally:
+        _, status = os.waitpid(pid, 0)
+        receiver.close()
+
+    if results is None:
+        exit_code = os.waitstatus_to_exitcode(status)
+        return {"error": f"Local run crashed (exit code {exit_code})"}
+    return results
+
+
+def _worker_main(connection):
+    """
+    Worker loop: receive harness jobs, run them and send the results back.
+    Workers only keep the PATH of the environment, so solutions never see the
+    session secrets, and each job runs in a fresh child and scratch directory.
+    """
+    path = os.environ.get("PATH", "")
+    os.environ.clear()
+    os.environ["PATH"] = path
+    working_dir = os.getcwd()
+
+    while True:
+        try:
+            job, timeout = connection.recv()
+        except (EOFError, OSError):
+            return
+
+        scratch_dir = tempfile.mkdtemp(prefix="squidleet-worker-")
+        try:
+            if hasattr(os, "fork"):
+                results = _run_job_in_child(job, timeout, scratch_dir, connection)
+            else:
+                # Without fork (e.g., on Windows), the pool replaces the worker
+                # after each job instead
+                os.chdir(scratch_dir)
+                results = _run_job(job, timeout)
+        finally:
+            os.chdir(working_dir)
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+        connection.send(results)
+
+
+class WorkerPool:
+    def __init__(self, size: int = 2):
+        """
+        Pool of warm interpreter processes running solutions locally.
+        Workers are forked from a forkserver with the harness preloaded, and
+        fork a fresh child for each job. A worker that times out or crashes is
+        replaced in the background.
+        :param size: Number of workers.
+        """
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context("forkserver")
+            self._context.set_forkserver_preload(["utils.harness"])
+        else:
+            self._context = multiprocessing.get_context("spawn")
+
+        self.size = size
+        self._idle = queue.Queue()
+        self._started = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Start the workers, unless they are already running.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        for _ in range(self.size):
+            self._spawn()
+
+    def _spawn(self):
+        parent_connection, child_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_connection,), daemon=True
+        )
+        process.start()
+        child_connection.close()
+        self._idle.put((process, parent_connection))
+
+    def _replace(self, worker):
+        process, connection = worker
+        process.kill()
+        connection.close()
+        threading.Thread(target=self._spawn, daemon=True).start()
+
+    def run(self, job: Dict[str, Any], timeout: float) -> Any:
+        """
+        Run a harness job on an idle worker.
+        :param job: Harness job (see `utils/harness.py`).
+        :param timeout: Seconds the job may take.
+        :return: The job's results.
+        """
+        self.start()
+
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No local worker available after {timeout}s")
+
+        process, connection = worker
+        try:
+            connection.send((job, timeout))
+            # Workers stop jobs at their timeout, the grace covers the worker itself
+            finished = connection.poll(timeout + timeout_grace)
+            results = connection.recv() if finished else None
+        except (EOFError, OSError):
+            process.join(timeout=1)
+            exit_code = process.exitcode
+            self._replace(worker)
+            raise Exception(f"Local run crashed (exit code {exit_code})")
+
+        if not finished:
+            self._replace(worker)
+            raise TimeoutError(f"Timed out after {timeout}s")
+
+        if hasattr(os, "fork"):
+            self._idle.put(worker)
+        else:
+            self._replace(worker)
+
+        if isinstance(results, dict) and results.get("timeout"):
+            raise TimeoutError(f"Timed out after {timeout}s")
+        return results
+
+    def close(self):
+        while not self._idle.empty():
+            process, connection = self._idle.get()
+            process.kill()
+            connection.close()
+
+
+@lru_cache(maxsize=None)
+def get_worker_pool() -> WorkerPool:
+    """
+    Get the shared worker pool, created (but not started) on first use.
+    :return: WorkerPool instance.
+    """
+    return WorkerPool()